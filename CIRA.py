@@ -31,18 +31,41 @@
 
 import argparse
 import os
+import sys
 import pandas as pd
 import yaml
 import json
 import drawsvg as dw
 import numpy as np 
-from math import sqrt
-from collections import defaultdict, deque
-from itertools import combinations
+from math import sqrt, comb
+from collections import Counter, OrderedDict, defaultdict
+from statistics import NormalDist
+from itertools import combinations, islice
 import random
+import ast
+import signal
 import time
+import contextlib
+import hashlib
+import cProfile
+import tracemalloc
 import matplotlib.pyplot as plt
 from matplotlib.ticker import ScalarFormatter
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba, to_hex
+from matplotlib.image import imsave
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+try:
+    # Peak memory of the process, not available on Windows
+    import resource
+except ImportError:
+    resource = None
+try:
+    # JIT compilation of the kernels of the fault enumeration and of the solvers, optional
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 #Parser initialisation.
@@ -65,6 +88,21 @@ parser.add_argument('--Font', type = str, help = 'Choose the font.', default = '
 parser.add_argument('--Font_Size', type = float, help = 'Choose a scaling factor for the font.', default = 1)
 parser.add_argument('--BumpMap_SVG_image_file_name', type = str, help = 'Filename for outputting the resulting image.', default = r'OutputFiles\BumpMap.svg' ) 
 parser.add_argument('--Display_Reparability_SVG', action = 'store_true', help = 'Flag to display the reparability in the SVG image of the choosen interface.')
+parser.add_argument('--Reparability_Heatmap', action = 'store_true', help = 'Flag to color each bump of the SVG image by the number of Unrepairable and Catastrophic faults it is involved in. Works with any fault model.')
+parser.add_argument('--Heatmap_Colormap', type = str, help = 'Matplotlib colormap used by the reparability heatmap.', default = 'YlOrRd')
+
+#Arguments for tiled rendering of large interfaces.
+parser.add_argument('--Tiled_SVG', action = 'store_true', help = 'Render the bump map as level-of-detail tiles instead of a single SVG image, for very large interfaces.')
+parser.add_argument('--Tile_Directory', type = str, help = 'Directory where the tiles and their index (Tiles.json) are written.', default = r'OutputFiles\Tiles')
+parser.add_argument('--Tile_Size', type = float, help = 'Side of a tile, is a multiple of the Pitch.', default = 64)
+parser.add_argument('--Tile_Format', type = str, help = 'Choose the format of the tiles [svg, png].', default = 'svg')
+parser.add_argument('--LOD_Cell_Size', type = float, help = 'Side of a cell of the coarse overview raster, is a multiple of the Pitch.', default = 8)
+parser.add_argument('--LOD_Color_Mode', type = str, help = 'Choose how the cells of the coarse overview are colored [Type, Density].', default = 'Type')
+parser.add_argument('--Tile_Workers', type = int, help = 'Number of processes rendering tiles in parallel.', default = 1)
+
+#Arguments for the native binary interface format.
+parser.add_argument('--Compile_Interface', type = str, help = 'Compile the bump map and the IRL into this binary interface file (.cirab), which can then be given as BumpMap_file_name and IRL_file_name.', default = None)
+parser.add_argument('--Decompile_Interface', type = str, help = 'Write the bump map and the IRL of this binary interface file (.cirab) to BumpMap_file_name and IRL_file_name.', default = None)
 
 #Arguments for Reparability Stats.
 parser.add_argument('--Reparability_Statistics', action = 'store_true', help = 'Flag to output the reparability statistics of the choosen interface.')
@@ -73,7 +111,30 @@ parser.add_argument('--IRL_file_name', type = str, help = 'Name of the IRL file
 parser.add_argument('--Fault_Table_file_name', type = str, help = 'The file that is written containing the repair informations for the interface.', default = r'OutputFiles\Fault_Table.yaml')
 parser.add_argument('--Reparability_Table_file_name', type = str, help = 'The file that is written containing the repair informations for the interface.', default = r'OutputFiles\Repair_Table.yaml')
 parser.add_argument('--Repair_Solutions_Table_file_name', type = str, help = 'The file that is written containing the repair informations for the interface.', default = r'OutputFiles\Repair_Solutions_Table.yaml')
-parser.add_argument('--Print_Fault', action = 'store_true', help = 'Flag to print each fault.')
+parser.add_argument('--Solution_Encoding', type = str, help = 'Encoding of the repair solutions : Full (every mux of the rerouted repair chains) or Delta (only the muxes changed from the default configuration).', default = 'Full')
+parser.add_argument('--Intern_Solutions', action = 'store_true', help = 'Flag to write each distinct repair solution once, in the solution dictionary, the Repair_Solutions_Table giving the ID of the solution of each repair chain.')
+parser.add_argument('--Solution_Dictionary_file_name', type = str, help = 'The file that is written containing the distinct repair solutions, with --Intern_Solutions.', default = r'OutputFiles\Repair_Solutions_Dictionary.csv')
+parser.add_argument('--Solution_Cache_Size', type = int, help = 'Maximum number of solutions of repair chains cached and reused across faults by the RecursiveSolver, 0 to solve every fault.', default = 100000)
+parser.add_argument('--Incremental', action = 'store_true', help = 'Flag to reuse the results of the previous reparability statistics, only the faults affected by the edits of the bump map or IRL being analyzed again.')
+parser.add_argument('--Incremental_State_file_name', type = str, help = 'The file that is written containing the results and dependencies of the last run, with --Incremental.', default = r'OutputFiles\Incremental_State.json')
+parser.add_argument('--Short_Distance_Sweep', type = str, help = 'List of short distances in µm, for example 8,10,12, to compute the reparability statistics of the shorts for each of them in a single pass.', default = None)
+parser.add_argument('--Sweep_file_name', type = str, help = 'The file that is written containing the reparability versus short distance curve, with --Short_Distance_Sweep.', default = r'OutputFiles\Short_Distance_Sweep.csv')
+parser.add_argument('--Sampling_Mode', type = str, help = 'Choose how the reparability statistics are computed [Exhaustive, Uniform, Stratified, Counting]. Uniform and Stratified sample the fault space and give confidence intervals. Counting gives the exact statistics of the opens without enumerating them.', default = 'Exhaustive')
+parser.add_argument('--Precision', type = float, help = 'Half-width of the confidence interval of the reparability percentage at which the sampling stops, in percentage points.', default = 0.1)
+parser.add_argument('--Confidence_Level', type = float, help = 'Confidence level of the confidence intervals of the sampled statistics.', default = 0.95)
+parser.add_argument('--Max_Samples', type = int, help = 'Maximum number of faults sampled.', default = 1000000)
+parser.add_argument('--Pruning', action = 'store_true', help = 'Flag to prune the exhaustive enumeration of multiple opens, the faults containing an unrepairable set of opens being counted without being solved.')
+parser.add_argument('--Sampled_Table_file_name', type = str, help = 'The file that is written containing the faults sampled by the Uniform and Stratified modes.', default = r'OutputFiles\Sampled_Table.csv')
+parser.add_argument('--Minimal_Sets_file_name', type = str, help = 'The file that is written containing the minimal unrepairable sets of opens found, with --Pruning.', default = r'OutputFiles\Minimal_Unrepairable_Sets.csv')
+parser.add_argument('--Sampling_Seed', type = int, help = 'Seed of the sampling of the fault space.', default = None)
+parser.add_argument('--Stats_Only', action = 'store_true', help = 'Flag to only compute the exhaustive reparability statistics, the faults being streamed into counters without writing the Fault_Table and the Repair_Table.')
+parser.add_argument('--Stats_Breakdown_file_name', type = str, help = 'The CSV file that is written containing the statistics per repair chain and per bump type, with --Stats_Only.', default = None)
+parser.add_argument('--Print_Fault', action = 'store_true', help = 'Flag to print each fault (debug mode, slows down large runs).')
+parser.add_argument('--Checkpoint_Interval', type = float, help = 'Time between two checkpoints of the reparability statistics or repair solutions, in seconds. 0 disables the periodic checkpoints, the checkpoint being only written at the end of the run or when it is interrupted.', default = 0)
+parser.add_argument('--Checkpoint_file_name', type = str, help = 'The JSON file that is written containing the last checkpoint.', default = r'OutputFiles\Checkpoint.json')
+parser.add_argument('--Resume', action = 'store_true', help = 'Flag to resume the reparability statistics or repair solutions from the last checkpoint.')
+parser.add_argument('--Reuse_Tables', action = 'store_true', help = 'Flag to read the Fault_Table, Repair_Table and Repair_Solutions_Table written by a previous run for the same bump map, IRL and fault model instead of computing them again.')
+parser.add_argument('--Progress_Interval', type = float, help = 'Minimal time between two progress reports (throughput, tallies and ETA), in seconds. 0 disables the progress reports.', default = 2)
 
 #Arguments for Fault Model.
 parser.add_argument('--Fault_Type', type = str, help = 'Choose the fault type to analyze [Short, Open].', default = 'Short')
@@ -93,9 +154,20 @@ parser.add_argument('--Log_Scale', action = 'store_true', help = 'Flag to set th
 
 #Arguments for Bundle Repair Mechanisms (BRM).
 parser.add_argument('--Bundle_Flag', action = 'store_true', help = 'A boolean to indicate if the interface and the repair mechanism is at the bundle level.')
+parser.add_argument('--Fault_Class_Table_file_name', type = str, help = 'The file that is written containing the bundle-level fault classes and their number of faults, with --Bundle_Flag.', default = r'OutputFiles\Fault_Class_Table.csv')
 
-#Arguments.
-args = parser.parse_args()
+#Arguments for design exploration.
+parser.add_argument('--What_If', type = str, help = 'YAML file of candidate modifications of the interface (spares, routes, repair chains, bundle repair pairs), each candidate being evaluated against the base interface given by BumpMap_file_name and IRL_file_name.', default = None)
+parser.add_argument('--What_If_Metric', type = str, help = 'Choose what is evaluated for each candidate [Reparability, Yield]. Reparability gives the repair statistics of the fault model, Yield the yield of MetaCIRA.', default = 'Reparability')
+parser.add_argument('--What_If_file_name', type = str, help = 'The file that is written containing the results of every candidate.', default = r'OutputFiles\What_If.csv')
+
+#Arguments for instrumentation.
+parser.add_argument('--Profile', action = 'store_true', help = 'Flag to record the time, calls and peak memory of each stage, and the counters of the fault enumeration and of the solvers, in a JSON file.')
+parser.add_argument('--Profile_file_name', type = str, help = 'The JSON file that is written containing the instrumentation of the run.', default = r'OutputFiles\Profile.json')
+parser.add_argument('--cProfile_file_name', type = str, help = 'If given with --Profile, the whole run is also profiled with cProfile and the statistics are dumped to this file (readable with pstats or snakeviz).', default = None)
+
+#Arguments. When CIRA is imported as a module (by CIRA_Benchmark.py for example), the default values are used.
+args = parser.parse_args() if __name__ == '__main__' else parser.parse_args([])
 
 BumpMap_file_name = args.BumpMap_file_name
 Create_SVG = args.Create_SVG
@@ -113,6 +185,19 @@ Font = args.Font
 Font_Size = args.Font_Size
 BumpMap_SVG_image_file_name = args.BumpMap_SVG_image_file_name
 Display_Reparability_SVG = args.Display_Reparability_SVG
+Reparability_Heatmap = args.Reparability_Heatmap
+Heatmap_Colormap = args.Heatmap_Colormap
+
+Tiled_SVG = args.Tiled_SVG
+Tile_Directory = args.Tile_Directory
+Tile_Size = args.Tile_Size
+Tile_Format = args.Tile_Format
+LOD_Cell_Size = args.LOD_Cell_Size
+LOD_Color_Mode = args.LOD_Color_Mode
+Tile_Workers = args.Tile_Workers
+
+Compile_Interface = args.Compile_Interface
+Decompile_Interface = args.Decompile_Interface
 
 Reparability_Statistics = args.Reparability_Statistics
 Repair_Solutions = args.Repair_Solutions
@@ -121,6 +206,29 @@ Fault_Table_file_name = args.Fault_Table_file_name
 Reparability_Table_file_name = args.Reparability_Table_file_name
 Repair_Solutions_Table_file_name = args.Repair_Solutions_Table_file_name
 Print_Fault = args.Print_Fault
+Solution_Encoding = args.Solution_Encoding
+Intern_Solutions = args.Intern_Solutions
+Solution_Dictionary_file_name = args.Solution_Dictionary_file_name
+Solution_Cache_Size = args.Solution_Cache_Size
+Sampling_Mode = args.Sampling_Mode
+Precision = args.Precision
+Confidence_Level = args.Confidence_Level
+Max_Samples = args.Max_Samples
+Sampling_Seed = args.Sampling_Seed
+Sampled_Table_file_name = args.Sampled_Table_file_name
+Pruning = args.Pruning
+Minimal_Sets_file_name = args.Minimal_Sets_file_name
+Stats_Only = args.Stats_Only
+Stats_Breakdown_file_name = args.Stats_Breakdown_file_name
+Incremental = args.Incremental
+Short_Distance_Sweep = args.Short_Distance_Sweep
+Sweep_file_name = args.Sweep_file_name
+Incremental_State_file_name = args.Incremental_State_file_name
+Progress_Interval = args.Progress_Interval
+Checkpoint_Interval = args.Checkpoint_Interval
+Checkpoint_file_name = args.Checkpoint_file_name
+Resume = args.Resume
+Reuse_Tables = args.Reuse_Tables
 
 Fault_Type = args.Fault_Type
 Faults_Number = args.Faults_Number
@@ -137,10 +245,212 @@ Number_of_electrical_yield_tested = args.Number_of_electrical_yield_tested
 Log_Scale = args.Log_Scale
 
 Bundle_Flag = args.Bundle_Flag
+Fault_Class_Table_file_name = args.Fault_Class_Table_file_name
+
+What_If = args.What_If
+What_If_Metric = args.What_If_Metric
+What_If_file_name = args.What_If_file_name
+
+Profile = args.Profile
+Profile_file_name = args.Profile_file_name
+cProfile_file_name = args.cProfile_file_name
 
 start = time.time()
 
+# Section 0 : Instrumentation.
+# The instrumentation is disabled by default, Profile_Stage and Profile_Count then do nothing.
+Profile_Data = {'Enabled': False, 'Stages': {}, 'Counters': defaultdict(int)}
+
+def Profile_Enable():
+    """
+    This function enables the instrumentation and clears the stages and counters recorded before.
+    Without the resource module (on Windows), the peak memory is measured with tracemalloc, which only sees
+    the memory allocated by Python and slows the run down.
+    """
+    Profile_Data['Enabled'] = True
+    Profile_Data['Stages'] = {}
+    Profile_Data['Counters'] = defaultdict(int)
+    if resource is None and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def Peak_Memory_MB():
+    """
+    This function returns the peak memory of the process since its start, in MB.
+    """
+    if resource is not None:
+        # ru_maxrss is in kB on Linux and in bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024**2 if os.uname().sysname == 'Darwin' else peak / 1024
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[1] / 1024**2
+    return None
+
+# Context of every stage while the instrumentation is disabled, entering it costs nothing
+Disabled_Stage = contextlib.nullcontext()
+
+def Profile_Stage(stage):
+    """
+    This function returns the context manager recording a stage of CIRA (see Recorded_Stage), or a shared context
+    doing nothing while the instrumentation is disabled, so that the stages of the per-fault loops are free in a default run.
+
+    Parameters:
+    - stage (str): Name of the stage.
+    """
+    if not Profile_Data['Enabled']:
+        return Disabled_Stage
+    return Recorded_Stage(stage)
+
+@contextlib.contextmanager
+def Recorded_Stage(stage):
+    """
+    This context manager records the time spent in a stage of CIRA, the number of times the stage is entered
+    and the peak memory of the process at the end of the stage.
+    Stages can be nested, the time of a stage includes the time of the stages it contains.
+
+    Parameters:
+    - stage (str): Name of the stage.
+    """
+    stage_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = Profile_Data['Stages'].setdefault(stage, {'Calls': 0, 'Time (s)': 0.0})
+        entry['Calls'] += 1
+        entry['Time (s)'] += time.perf_counter() - stage_start
+        entry['Peak memory (MB)'] = Peak_Memory_MB()
+
+def Profile_Count(counter, increment=1):
+    """
+    This function increments a counter of the instrumentation (solver calls, cache hits, etc).
+
+    Parameters:
+    - counter (str): Name of the counter.
+    - increment (int): Value added to the counter.
+    """
+    if Profile_Data['Enabled']:
+        Profile_Data['Counters'][counter] += increment
+
+def Write_Profile(Profile_file_name, Total_time):
+    """
+    This function writes the stages and counters recorded by the instrumentation to a JSON file.
+
+    Parameters:
+    - Profile_file_name (str): Path to the JSON file.
+    - Total_time (float): Wall-clock time of the whole run, in seconds.
+
+    Returns:
+    - dict: The content of the JSON file.
+    """
+    Counters = dict(Profile_Data['Counters'])
+    # Share of the candidate combinations that form a short, the rest is wasted enumeration
+    if Counters.get('Candidate combinations', 0) > 0:
+        Counters['Short acceptance ratio'] = Counters.get('Accepted combinations', 0) / Counters['Candidate combinations']
+
+    Profile_Report = {
+        'Total time (s)': Total_time,
+        'Peak memory (MB)': Peak_Memory_MB(),
+        'Stages': Profile_Data['Stages'],
+        'Counters': Counters}
+
+    with open(Profile_file_name, 'w') as file:
+        json.dump(Profile_Report, file, indent=1)
+    print(f'Wrote the profile to {Profile_file_name}')
+
+    return Profile_Report
+
+# Progress reports of the long loops. The total is known up front, except for the loops stopping on a target (the total is then None),
+# the reports are printed to stderr at most every Progress_Data['Interval'] seconds, so the terminal is never the bottleneck.
+Progress_Data = {'Interval': 2, 'Label': '', 'Total': 0, 'Done': 0, 'Start_Done': 0, 'Tallies': defaultdict(int), 'Status': '', 'Start': 0.0, 'Last': 0.0}
+
+def Anchor_Combinations_Number(Pool_Size, Bumps_Number, Faults_Number):
+    """
+    This function returns the number of candidate combinations of an anchor tested by Fault_Enumerator, before the short filter
+    (see Fault_Space_Anchors) : the sets of Faults_Number combinations of Bumps_Number bumps, taken in the anchor and its pool and containing the anchor.
+
+    Parameters:
+    - Pool_Size (int): Number of bumps of the pool of the anchor.
+    - Bumps_Number (int): Number of bumps affected by a fault (1 for the open faults).
+    - Faults_Number (int): Number of faults happening at the same time.
+
+    Returns:
+    - int: The number of candidate combinations.
+    """
+    return comb(comb(Pool_Size + 1, Bumps_Number), Faults_Number) - comb(comb(Pool_Size, Bumps_Number), Faults_Number)
+
+def Progress_Start(Label, Total, Done=0, Tallies=None):
+    """
+    This function starts the progress reports of a loop.
+
+    Parameters:
+    - Label (str): Name of the loop, printed in front of each report.
+    - Total (int): Number of items of the loop, None if the loop stops on a target, the reports then having no percentage nor ETA.
+    - Done (int): Number of items already done, when the loop is resumed from a checkpoint.
+    - Tallies (dict): Tallies of the items already done.
+    """
+    Progress_Data['Label'] = Label
+    Progress_Data['Total'] = Total
+    Progress_Data['Done'] = Done
+    Progress_Data['Start_Done'] = Done
+    Progress_Data['Tallies'] = defaultdict(int, Tallies or {})
+    Progress_Data['Status'] = ''
+    Progress_Data['Start'] = Progress_Data['Last'] = time.perf_counter()
+
+def Progress_Update(Repair_Type=None, Done=1, Tallies=None, Status=None):
+    """
+    This function records the progress of the loop, and prints a report if the last one is older than the interval.
+    Parallel workers send their partial results to the parent process, which adds them with Tallies, so the
+    reports always cover the whole run.
+
+    Parameters:
+    - Repair_Type (str): Type of the item done, added to the tallies ('Repairable', 'Unrepairable', etc).
+    - Done (int): Number of items done.
+    - Tallies (dict): Counts added to the tallies, for items done by a worker.
+    - Status (str): State of the loop printed by the reports, for a loop stopping on a target (its distance to the target for example).
+    """
+    Progress_Data['Done'] += Done
+    if Status is not None:
+        Progress_Data['Status'] = Status
+    if Repair_Type is not None:
+        Progress_Data['Tallies'][Repair_Type] += 1
+    if Tallies is not None:
+        for key, value in Tallies.items():
+            Progress_Data['Tallies'][key] += value
+
+    if Progress_Data['Interval'] > 0:
+        now = time.perf_counter()
+        if now - Progress_Data['Last'] >= Progress_Data['Interval']:
+            Progress_Data['Last'] = now
+            Progress_Print(now)
+
+def Progress_Print(now):
+    """
+    This function prints a progress report: items done, throughput, ETA (if the total is known), status and tallies.
+    """
+    elapsed = now - Progress_Data['Start']
+    Done = Progress_Data['Done']
+    Total = Progress_Data['Total']
+    rate = (Done - Progress_Data['Start_Done']) / elapsed if elapsed > 0 else 0
+    Status = f", {Progress_Data['Status']}" if Progress_Data['Status'] else ''
+    Tallies = ''.join(f', {key} : {value}' for key, value in Progress_Data['Tallies'].items())
+    if Total is None:
+        print(f"[{Progress_Data['Label']}] {Done}, {rate:.1f}/s{Status}{Tallies}", file=sys.stderr, flush=True)
+        return
+    ETA = (Total - Done) / rate if rate > 0 else float('inf')
+    print(f"[{Progress_Data['Label']}] {Done}/{Total} ({Done / max(Total, 1) * 100:.1f}%), {rate:.1f}/s, ETA {ETA:.1f} s{Status}{Tallies}", file=sys.stderr, flush=True)
+
+def Progress_End():
+    """
+    This function prints the last progress report of a loop, if the loop lasted long enough to have reports.
+    """
+    if Progress_Data['Interval'] > 0:
+        now = time.perf_counter()
+        if now - Progress_Data['Start'] >= Progress_Data['Interval']:
+            Progress_Print(now)
+
 # Section 1 : Data Loading and Preparation.
+# The YAML files are parsed by the C loader of libyaml when PyYAML is built with it, several times faster than the pure Python one.
+YAML_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def file_loading_as_a_DataFrame(file_name):
     """
     Loads a specified file into a pandas DataFrame based on its extension.
@@ -163,7 +473,7 @@ def file_loading_as_a_DataFrame(file_name):
     elif ext[1:] in ['yaml', 'yml']:  # Check for YAML or YML files
         # Load YAML or YML file into a DataFrame
         with open(file_name, 'r') as file:
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=YAML_Loader)  # The C loader of libyaml if available
             df = pd.DataFrame(data)  # Create a DataFrame from the loaded data
         
     elif ext[1:] == 'json':  # Check for JSON files
@@ -205,8 +515,8 @@ def Repair_yaml_file_loading_into_a_dataframe(Interface_IRL_file_name):
     with open(Interface_IRL_file_name, 'r') as file:
         data = yaml.safe_load(file)
         
-    # Initialize an empty DataFrame with the desired columns.
-    df_Repair_Capabilities = pd.DataFrame(columns=['Signal', 'Connection', 'Mux', 'Sel', 'Status', 'RepairChain'])
+    # Initialize an empty list of rows, the DataFrame being built once from it.
+    rows = []
 
     # Extract information from the dictionary.
     # The keys of the dictionary represent repair chains.
@@ -226,21 +536,11 @@ def Repair_yaml_file_loading_into_a_dataframe(Interface_IRL_file_name):
                     mux_info = physical_port_info.get('Control', {}).get('Mux', '')
                     sel_info = physical_port_info.get('Control', {}).get('Sel', '')
 
-                # Create a new row with the extracted information.
-                    new_row = {
-                        'Signal': [functional_port_name],
-                        'Connection': [physical_port_name],
-                        'Mux': [mux_info],
-                        'Sel': [sel_info],
-                        'Status': [physical_port],
-                        'RepairChain': [RepairChain],
-                    }
-
-                # Append the new row to the DataFrame.
-                    df_Repair_Capabilities = pd.concat([df_Repair_Capabilities, pd.DataFrame(new_row)], ignore_index=True)
+                # Append a new row with the extracted information.
+                    rows.append([functional_port_name, physical_port_name, mux_info, sel_info, physical_port, RepairChain])
 
     # Return the DataFrame containing the repair capabilities.
-        return df_Repair_Capabilities
+    return pd.DataFrame(rows, columns=['Signal', 'Connection', 'Mux', 'Sel', 'Status', 'RepairChain'])
 
 def Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name):
     """
@@ -252,6 +552,10 @@ def Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name):
     Returns:
         pd.DataFrame: DataFrame with the columns ['Signal', 'Connection', 'Mux', 'Sel', 'Status', 'RepairChain'].
     """
+    # The route table of a binary interface is memory-mapped
+    if os.path.splitext(Interface_IRL_file_name)[1] == '.cirab':
+        return Interface_Binary_to_DataFrame(Read_Interface_Binary(Interface_IRL_file_name), 'Routes')
+
     try:
         # Read the IRL file
         with open(Interface_IRL_file_name, 'r', encoding='utf-8') as file:
@@ -263,10 +567,10 @@ def Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name):
         clean_content = '\n'.join(content_lines).strip()
         
         # Parse as YAML (IRL format is compatible)
-        data = yaml.safe_load(clean_content)
+        data = yaml.load(clean_content, Loader=YAML_Loader)
         
-        # Initialize an empty DataFrame with the desired columns.
-        df_Repair_Capabilities = pd.DataFrame(columns=['Signal', 'Connection', 'Mux', 'Sel', 'Status', 'RepairChain'])
+        # The rows are collected in a list and the DataFrame is built once, appending to a DataFrame being quadratic
+        rows = []
 
         # Extract information from the dictionary (same logic as the YAML function)
         RepairChains = list(data.keys())
@@ -280,19 +584,9 @@ def Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name):
                         mux_info = physical_port_info.get('Control', {}).get('Mux', '')
                         sel_info = physical_port_info.get('Control', {}).get('Sel', '')
 
-                        new_row = {
-                            'Signal': [functional_port_name],
-                            'Connection': [physical_port_name],
-                            'Mux': [mux_info],
-                            'Sel': [sel_info],
-                            'Status': [physical_port],
-                            'RepairChain': [RepairChain],
-                        }
-
-                        # Append the new row to the DataFrame
-                        df_Repair_Capabilities = pd.concat([df_Repair_Capabilities, pd.DataFrame(new_row)], ignore_index=True)
+                        rows.append([functional_port_name, physical_port_name, mux_info, sel_info, physical_port, RepairChain])
 
-        return df_Repair_Capabilities
+        return pd.DataFrame(rows, columns=['Signal', 'Connection', 'Mux', 'Sel', 'Status', 'RepairChain'])
         
     except Exception as e:
         print(f"Error reading the IRL file: {e}")
@@ -309,40 +603,515 @@ def Avoid_bump_name_iteration(file_name):
     Returns:
     - pd.DataFrame: A DataFrame with unique bump names.
     """
+    # A binary interface is written with unique names, its bump map is memory-mapped as it is
+    if os.path.splitext(file_name)[1] == '.cirab':
+        return Interface_Binary_to_DataFrame(Read_Interface_Binary(file_name), 'Bumps')
+
     # Load the DataFrame from the specified file
     df = file_loading_as_a_DataFrame(file_name)
 
-    # Dictionary to keep track of name counts
-    name_counts = defaultdict(int)
+    # Number of times each name has already been seen, the names seen before get a suffix indicating the count
+    counts = df.groupby('Name', sort=False).cumcount()
+    duplicates = (counts > 0).to_numpy()
+    if duplicates.any():
+        names = df['Name'].to_numpy(dtype=object).copy()
+        names[duplicates] = df['Name'][duplicates].astype(str) + '_' + counts[duplicates].astype(str)
+        df['Name'] = names
 
-    # List to store the modified names
-    modified_names = []
+    # Return the DataFrame with unique bump names and typed columns
+    return Bump_Column_Types(df)
 
-    # Iterate through each name in the 'Name' column
-    for name in df['Name']:
-        # Get the current count of the name
-        count = name_counts[name]
-        # Increment the count for the name
-        name_counts[name] += 1
-        
-        # If the name has not been seen before, append it as is
-        if count == 0:
-            modified_names.append(name)
-        else:
-            # If the name has been seen before, append it with a suffix indicating the count
-            modified_names.append(f"{name}_{count}")
+def Bump_Column_Types(df):
+    """
+    This function gives the columns of a bump map their types, whatever the format it was loaded from : float coordinates,
+    boolean Spare (True only for the bumps whose Spare is True, as tested by the solvers) and categorical Type and Bundle.
 
-    # Update the 'Name' column with the modified names
-    df['Name'] = modified_names
-    
-    # Return the DataFrame with unique bump names
+    Parameters:
+    - df (pd.DataFrame): DataFrame containing bump information.
+
+    Returns:
+    - pd.DataFrame: The same DataFrame, with typed columns.
+    """
+    for column in ['X', 'Y']:
+        if column in df:
+            df[column] = df[column].astype(float)
+    if 'Spare' in df:
+        df['Spare'] = df['Spare'].eq(True)
+    for column in ['Type', 'Bundle']:
+        if column in df:
+            df[column] = df[column].astype('category')
     return df
 
-# Section 2 : SVG Generation.    
+# Native binary interface format : a header giving the string table and the position of each column, followed by the columns as raw arrays.
+# The numeric and boolean columns are stored as they are, the text columns (names, types, bundles, routes) as int32 codes in the string table (-1 if missing).
+Binary_Interface_Magic = b'CIRAIF1\n'
+Binary_Interface_Alignment = 64
+
+def Write_Interface_Binary(df_bump, Route_Table, Binary_file_name):
+    """
+    This function writes an interface (bump map and route table) to the native binary interface format, which is memory-mapped by Read_Interface_Binary.
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information, with unique names (see Avoid_bump_name_iteration).
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+    - Binary_file_name (str): Path to the binary file (.cirab).
+    """
+    Strings = {}
+    Tables = {}
+    Arrays = []
+    offset = 0
+    for Table_name, df in [('Bumps', df_bump), ('Routes', Route_Table)]:
+        Tables[Table_name] = []
+        for column in df.columns:
+            values = df[column]
+            if values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype):
+                # Text column : codes in the string table
+                array = np.array([Strings.setdefault(str(value), len(Strings)) if isinstance(value, str) or not pd.isna(value) else -1 for value in values], dtype=np.int32)
+                kind = 'Category' if isinstance(values.dtype, pd.CategoricalDtype) else 'Text'
+            else:
+                array = np.ascontiguousarray(values.to_numpy())
+                kind = 'Array'
+            Tables[Table_name].append({'Column': column, 'Kind': kind, 'dtype': array.dtype.str, 'Length': len(array), 'Offset': offset})
+            Arrays.append(array)
+            offset += -(-array.nbytes // Binary_Interface_Alignment) * Binary_Interface_Alignment
+
+    Header = json.dumps({'Version': 1, 'Strings': list(Strings), 'Tables': Tables}).encode()
+    # The columns start on an aligned offset after the header
+    Data_start = -(-(len(Binary_Interface_Magic) + 8 + len(Header)) // Binary_Interface_Alignment) * Binary_Interface_Alignment
+
+    with open(Binary_file_name, 'wb') as file:
+        file.write(Binary_Interface_Magic)
+        file.write(len(Header).to_bytes(8, 'little'))
+        file.write(Header)
+        for array, column in zip(Arrays, [column for Table in Tables.values() for column in Table]):
+            file.seek(Data_start + column['Offset'])
+            file.write(array.tobytes())
+        file.truncate(Data_start + offset)
+
+def Read_Interface_Binary(Binary_file_name):
+    """
+    This function memory-maps an interface written by Write_Interface_Binary. The columns are read-only views of the file,
+    loaded on demand and shared by every process mapping the same file (see Interface_Binary_to_DataFrame for the columns kept as views).
+
+    Parameters:
+    - Binary_file_name (str): Path to the binary file (.cirab).
+
+    Returns:
+    - dict: 'Strings', the string table (with NaN at the end, for the missing values), and for 'Bumps' and 'Routes', the dictionary {column: (kind, array)}.
+    """
+    with open(Binary_file_name, 'rb') as file:
+        if file.read(len(Binary_Interface_Magic)) != Binary_Interface_Magic:
+            raise ValueError(f'{Binary_file_name} is not a CIRA binary interface')
+        Header_length = int.from_bytes(file.read(8), 'little')
+        Header = json.loads(file.read(Header_length))
+    Data_start = -(-(len(Binary_Interface_Magic) + 8 + Header_length) // Binary_Interface_Alignment) * Binary_Interface_Alignment
+
+    Interface = {'Strings': np.array(Header['Strings'] + [np.nan], dtype=object)}
+    for Table_name, columns in Header['Tables'].items():
+        Interface[Table_name] = {}
+        for column in columns:
+            if column['Length'] == 0:
+                array = np.empty(0, dtype=column['dtype'])
+            else:
+                array = np.memmap(Binary_file_name, dtype=column['dtype'], mode='r', offset=Data_start + column['Offset'], shape=(column['Length'],))
+            Interface[Table_name][column['Column']] = (column['Kind'], array)
+    return Interface
+
+def Binary_Categorical(Strings, codes):
+    """
+    This function builds a categorical column from its codes in the string table, without decoding every value :
+    the codes are renumbered in the sorted categories actually used, as pd.Categorical would order them.
+    """
+    used = np.unique(codes)
+    used = used[used >= 0]
+    order = np.argsort(Strings[used].astype(str), kind='stable')
+    # The code -1 of the missing values reads the last entry of the lookup, the NaN of the string table, which stays -1
+    lookup = np.full(len(Strings), -1, dtype=np.int32)
+    lookup[used[order]] = np.arange(len(used), dtype=np.int32)
+    return pd.Categorical.from_codes(lookup[codes], categories=Strings[used[order]].astype(str))
+
+def Interface_Binary_to_DataFrame(Interface, Table_name):
+    """
+    This function builds the DataFrame of a table of a memory-mapped interface ('Bumps' for df_bump, 'Routes' for the Route_Table),
+    with the same columns and types as the loading of the original files.
+    The numeric and boolean columns are read-only views of the mapped file, never copied, so their pages are shared by every process
+    mapping it; the categorical columns are built from their codes, and only the text columns are decoded into Python strings.
+    """
+    columns = {}
+    for column, (kind, array) in Interface[Table_name].items():
+        if kind == 'Text':
+            columns[column] = Interface['Strings'][array]
+        elif kind == 'Category':
+            columns[column] = Binary_Categorical(Interface['Strings'], array)
+        else:
+            columns[column] = array.view(np.ndarray)
+    return pd.DataFrame(columns, copy=False)
+
+def Write_BumpMap_yaml(df_bump, BumpMap_file_name):
+    """
+    This function writes a bump map DataFrame to a YAML bump map, the missing values being left out.
+    """
+    BumpMap = [{column: value.item() if isinstance(value, np.generic) else value for column, value in bump.items() if isinstance(value, str) or not pd.isna(value)}
+               for bump in df_bump.to_dict('records')]
+    with open(BumpMap_file_name, 'w') as file:
+        yaml.safe_dump(BumpMap, file, sort_keys=False)
+
+def Write_IRL(Route_Table, Interface_IRL_file_name):
+    """
+    This function writes a route table to an IRL file, one port per signal of each repair chain.
+    The repair chains, and the signals of each of them, are written in their order of first appearance in the route table.
+    """
+    # The routes without repair chain or signal belong to no port
+    Route_Table = Route_Table[Route_Table['RepairChain'].notna() & Route_Table['Signal'].notna()]
+    Chain_codes = pd.factorize(Route_Table['RepairChain'])[0]
+    Port_codes = pd.MultiIndex.from_arrays([Route_Table['RepairChain'], Route_Table['Signal']]).factorize()[0]
+    # Stable sort of the routes by repair chain, then by port
+    order = np.lexsort((Port_codes, Chain_codes))
+    Routes = Route_Table.iloc[order]
+
+    # Parts of the IRL file, joined once when the file is written
+    IRL_parts = ['# IRL Format v1.0\n# Generated file - do not edit manually\n\n']
+    previous_chain = previous_port = None
+    for chain, port, RepairChain, Signal, Status, Connection, Mux, Sel in zip(Chain_codes[order], Port_codes[order], Routes['RepairChain'], Routes['Signal'],
+                                                                               Routes['Status'], Routes['Connection'], Routes['Mux'], Routes['Sel']):
+        if port != previous_port:
+            if previous_port is not None:
+                IRL_parts.append('\n')
+            if chain != previous_chain:
+                IRL_parts.append(f'{RepairChain}:\n')
+                k = 0
+                previous_chain = chain
+            IRL_parts.append(f'  Port_{k}:\n    Name: {Signal}\n')
+            k += 1
+            previous_port = port
+        IRL_parts.append(f'    {Status}:\n      To: {Connection}\n      Control:\n        Mux: {Mux}\n        Sel: {Sel}\n')
+    if previous_port is not None:
+        IRL_parts.append('\n')
+    with open(Interface_IRL_file_name, 'w') as file:
+        file.write(''.join(IRL_parts))
+
+def Read_Fault_Table(file_name):
+    """
+    This function reads a Fault_Table, Repair_Table or Repair_Solutions_Table written by CIRA to a CSV file.
+    The lists and sets of the 'Fault', 'Chain_list' and 'Repair_Solutions' columns, written as text, are converted back.
+
+    Parameters:
+    - file_name (str): Path to the CSV file.
+
+    Returns:
+    - pd.DataFrame: The table, as returned by the function that wrote it.
+    """
+    def Literal(value):
+        # An empty set is written 'set()', which is not a literal
+        if not isinstance(value, str):
+            return value
+        return set() if value == 'set()' else ast.literal_eval(value)
+
+    Table = pd.read_csv(file_name, index_col=0)
+    for column in ['Fault', 'Chain_list', 'Repair_Solutions']:
+        if column in Table:
+            Table[column] = Table[column].map(Literal)
+    return Table
+
+# The fingerprint of a table is written next to it, in the file of the table followed by this extension, to reuse the table in a later run (see Reusable_Table)
+Fingerprint_Extension = '.fingerprint'
+# Version of the layout of the tables, part of their fingerprint : to increase when the columns or the encoding of a table change,
+# so that the tables written by an older version are computed again
+Table_Format_Version = 1
+
+def File_Digest(file_name):
+    """
+    This function returns the digest of the content of a file, read by blocks.
+
+    Parameters:
+    - file_name (str): Path to the file.
+
+    Returns:
+    - bytes: The digest of the file.
+    """
+    Digest = hashlib.blake2b(digest_size=16)
+    with open(file_name, 'rb') as file:
+        while block := file.read(1 << 20):
+            Digest.update(block)
+    return Digest.digest()
+
+def Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance, **Options):
+    """
+    This function returns the fingerprint of what a Fault_Table, Repair_Table or Repair_Solutions_Table depends on :
+    the content of the bump map and of the IRL, the fault model and the version of the layout of the tables (see Table_Format_Version).
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short, only used by the shorts.
+    - Short_Distance (float): Upper threshold for the short distance in µm, only used by the shorts.
+    - Options: The other parameters of the table, such as the encoding of the repair solutions.
+
+    Returns:
+    - str: The fingerprint, as a hexadecimal digest.
+    """
+    Fingerprint = hashlib.blake2b(digest_size=16)
+    for file_name in [BumpMap_file_name, Interface_IRL_file_name]:
+        Fingerprint.update(File_Digest(file_name))
+
+    Fault_Model = {'Table_Format_Version': Table_Format_Version, 'Fault_Type': Fault_Type, 'Faults_Number': Faults_Number, **Options}
+    if Fault_Type == 'Short':
+        Fault_Model.update({'Shorted_Bumps_Number': Shorted_Bumps_Number, 'Short_Distance': Short_Distance})
+    Fingerprint.update(json.dumps(Fault_Model, sort_keys=True).encode())
+    return Fingerprint.hexdigest()
+
+def Write_Table_Fingerprint(Table_file_name, Fingerprint, Dependencies=()):
+    """
+    This function writes the fingerprint of a table next to it (see Table_Fingerprint), with the size and modification time of the table,
+    so that a table written afterwards by another analysis (sampled, pruned, ...) is not taken for it.
+    The digests of the files the table refers to, such as the solution dictionary of an interned Repair_Solutions_Table, are written with it.
+
+    Parameters:
+    - Table_file_name (str): Path to the CSV file of the table, already written.
+    - Fingerprint (str): The fingerprint of the table.
+    - Dependencies (list): Paths to the files the table refers to, already written.
+    """
+    Status = os.stat(Table_file_name)
+    Record = {'Fingerprint': Fingerprint, 'Size': Status.st_size, 'Modified': Status.st_mtime_ns,
+              'Dependencies': {file_name: File_Digest(file_name).hex() for file_name in Dependencies}}
+    with open(Table_file_name + Fingerprint_Extension, 'w') as file:
+        json.dump(Record, file, indent=1)
+
+def Reusable_Table(Table_file_name, Fingerprint, Dependencies=(), Warn=True):
+    """
+    This function checks if a table written by a previous run can be read instead of being computed again :
+    the table must exist, be unchanged since its fingerprint was written, have the given fingerprint,
+    and refer to the same files, unchanged since then.
+
+    Parameters:
+    - Table_file_name (str): Path to the CSV file of the table.
+    - Fingerprint (str): The fingerprint of the table to compute (see Table_Fingerprint).
+    - Dependencies (list): Paths to the files the table to compute refers to (see Write_Table_Fingerprint).
+    - Warn (bool): Flag to print why an existing table cannot be reused.
+
+    Returns:
+    - bool: True if the table can be reused.
+    """
+    if Table_file_name is None or not os.path.exists(Table_file_name):
+        return False
+
+    Problem = None
+    try:
+        with open(Table_file_name + Fingerprint_Extension, 'r') as file:
+            Record = json.load(file)
+    except (OSError, ValueError):
+        Problem = 'has no fingerprint'
+    else:
+        Status = os.stat(Table_file_name)
+        if Record.get('Size') != Status.st_size or Record.get('Modified') != Status.st_mtime_ns:
+            Problem = 'was modified after its fingerprint was written'
+        elif Record.get('Fingerprint') != Fingerprint:
+            Problem = 'was computed for another bump map, IRL, fault model, solution encoding or version of CIRA'
+        elif Record.get('Dependencies', {}) != {file_name: File_Digest(file_name).hex() if os.path.exists(file_name) else None for file_name in Dependencies}:
+            Problem = 'refers to a solution dictionary that is missing or was modified'
+
+    if Problem is not None and Warn:
+        print(f'Warning : the table {Table_file_name} {Problem}, it is computed again.')
+    return Problem is None
+
+# Section 2 : SVG Generation.
+def SVG_Style_Tables(aspect):
+    """
+    This function resolves the colors and shapes of the aspect file once into dictionaries.
+    It replaces the per-bump lookups in the aspect DataFrame by constant time dictionary accesses.
+    As with the DataFrame lookups, the first line of the aspect file wins if a type is defined twice.
+
+    Parameters:
+    - aspect (pd.DataFrame): DataFrame containing the columns 'Type', 'Color' and 'Shape'.
+
+    Returns:
+    - tuple: (color_dict, shape_dict), two dictionaries mapping each type to its color and shape.
+    """
+    # Keep the first definition of each type, as aspect.loc[...].values[0] would
+    aspect = aspect.drop_duplicates(subset='Type', keep='first')
+
+    # Build the type -> color and type -> shape dictionaries
+    color_dict = dict(zip(aspect['Type'], aspect['Color']))
+    shape_dict = dict(zip(aspect['Type'], aspect['Shape']))
+
+    return color_dict, shape_dict
+
+def SVG_Shape_Symbols(s, Stroke_Color):
+    """
+    This function creates one reusable symbol per bump shape, to be emitted once in the <defs> of the SVG.
+    Each symbol contains the white underlay and the shape itself. The shape has no fill so it inherits
+    the color and the opacity of the group the <use> element is placed in.
+
+    Parameters:
+    - s (float): Size of the bumps.
+    - Stroke_Color (str): Color of the stroke around the bumps.
+
+    Returns:
+    - dict: A dictionary mapping each shape name ('Circle', 'Triangle', 'Square') to its symbol.
+    """
+    # The white underlay sets every attribute explicitly so it is not affected by the group opacity
+    underlay = dict(fill='white', stroke=Stroke_Color, stroke_width=s / 10, fill_opacity=1, stroke_opacity=1)
+
+    # Define the shapes centered on the origin, the <use> element will place them at the bump coordinates
+    shape_elements = {
+        'Circle': lambda **kwargs: dw.Circle(0, 0, s, **kwargs),
+        'Triangle': lambda **kwargs: dw.Lines(-s, s, s, s, 0, -s, close='true', **kwargs),
+        'Square': lambda **kwargs: dw.Rectangle(-s, -s, 1.7 * s, 1.7 * s, **kwargs),
+    }
+
+    symbols = {}
+    for shape, shape_element in shape_elements.items():
+        symbol = dw.Group(id=f'Bump_{shape}')
+        symbol.append(shape_element(**underlay))
+        symbol.append(shape_element(stroke_width=s / 10))
+        symbols[shape] = symbol
+
+    return symbols
+
+def Append_Bumps_SVG(bumpmap, df, color_dict, shape_dict, symbols, Stroke_Color, a, bump_colors=None):
+    """
+    This function draws the bumps of a DataFrame on an SVG drawing.
+    Bumps sharing the same color and shape are placed in the same group, which carries the style,
+    and each bump is a single <use> element referencing the symbol of its shape.
+    The color of a bump is the color of its type, unless bump_colors gives one color per bump (see Reparability_Heat_Colors).
+
+    Parameters:
+    - bumpmap (dw.Drawing or dw.Group): The drawing to which the bumps are appended.
+    - df (pd.DataFrame): DataFrame containing the columns 'X', 'Y', 'Type' and 'Spare'.
+    - color_dict (dict): Dictionary mapping each type to its color, see SVG_Style_Tables.
+    - shape_dict (dict): Dictionary mapping each type to its shape, see SVG_Style_Tables.
+    - symbols (dict): Dictionary mapping each shape to its symbol, see SVG_Shape_Symbols.
+    - Stroke_Color (str): Color of the stroke around the bumps.
+    - a (float): Opacity of the bumps.
+    - bump_colors (iterable, optional): One color per bump of df, overriding the color of the types.
+    """
+    if bump_colors is None:
+        bump_colors = [color_dict[bump_type] for bump_type in df['Type']]
+
+    # Group the bump coordinates by style, a spare bump keeps the color of its type but takes the shape of the spares
+    style_groups = defaultdict(list)
+    for x, y, bump_type, spare, color in zip(df['X'], df['Y'], df['Type'], df['Spare'], bump_colors):
+        shape = shape_dict['SPARE'] if spare == True else shape_dict[bump_type]
+        style_groups[(color, shape)].append((x, y))
+
+    # Emit one group per style
+    for (color, shape), coordinates in style_groups.items():
+        group = dw.Group(fill=color, stroke=Stroke_Color, fill_opacity=a, stroke_opacity=a)
+        for x, y in coordinates:
+            group.append(dw.Use(symbols[shape], x, y))
+        bumpmap.append(group)
+
+def Append_Bump_Names_SVG(bumpmap, df, s, Font_Size, Font):
+    """
+    This function writes the names of the bumps, except POWER and GND connections, on an SVG drawing.
+    The font attributes are carried by a single group instead of being repeated on every text element.
+
+    Parameters:
+    - bumpmap (dw.Drawing or dw.Group): The drawing to which the names are appended.
+    - df (pd.DataFrame): DataFrame containing the columns 'X', 'Y', 'Type' and 'Name'.
+    - s (float): Size of the bumps.
+    - Font_Size (float): Scaling factor for the font size.
+    - Font (str): Font to be used for the names.
+    """
+    group = dw.Group(font_size=Font_Size * 0.8 * 1.2 * s, font_family=Font, dominant_baseline='middle', text_anchor='start')
+    for x, y, bump_type, name in zip(df['X'], df['Y'], df['Type'], df['Name']):
+        if bump_type != 'GND' and bump_type != 'POWER':
+            group.append(dw.Text(name.replace('_phy', ''), None, x, y, transform=f'rotate (-15, {x}, {y})'))
+    bumpmap.append(group)
+
+def Append_Fault_Lines_SVG(bumpmap, Repair_Table, coordinates, color_dict, s):
+    """
+    This function draws one line per 2-bump short on an SVG drawing, colored by reparability.
+    The coordinates of the bumps are read from a dictionary indexed by bump name and the lines
+    are grouped by repair type, so the style of each line is only written once per group.
+
+    Parameters:
+    - bumpmap (dw.Drawing or dw.Group): The drawing to which the lines are appended.
+    - Repair_Table (pd.DataFrame): DataFrame containing the columns 'Fault' and 'Repair_Type'.
+    - coordinates (dict): Dictionary mapping each bump name to its (X, Y) coordinates.
+    - color_dict (dict): Dictionary mapping each repair type to its color, see SVG_Style_Tables.
+    - s (float): Size of the bumps.
+    """
+    # Style of the lines for each repair type: Catastrophic is thick, Benign is dashed
+    line_styles = {
+        'Catastrophic': dict(stroke_width=2 * s / 6),
+        'Benign': dict(stroke_width=s / 6, stroke_dasharray='2,2'),
+    }
+
+    # Group the lines by repair type
+    lines_per_type = defaultdict(list)
+    for bumps, Reparability in zip(Repair_Table['Fault'], Repair_Table['Repair_Type']):
+        lines_per_type[Reparability].append((coordinates[bumps[0]], coordinates[bumps[1]]))
+
+    # Emit one group per repair type
+    for Reparability, lines in lines_per_type.items():
+        group = dw.Group(stroke=color_dict[Reparability], **line_styles.get(Reparability, dict(stroke_width=s / 6)))
+        for (X1, Y1), (X2, Y2) in lines:
+            group.append(dw.Line(X1, Y1, X2, Y2))
+        bumpmap.append(group)
+
+def Bump_Reparability_Counts(Repair_Table, df_bump):
+    """
+    This function aggregates a Repair_Table into the number of faults of each repair type every bump is involved in.
+    It works with any fault model (opens, k-bump shorts, multiple faults), as each fault is a list of bumps.
+    The table is exploded once into (bump, repair type) pairs and counted, so the cost is linear in the size of the table.
+
+    Parameters:
+    - Repair_Table (pd.DataFrame): DataFrame containing the columns 'Fault' and 'Repair_Type'.
+    - df_bump (pd.DataFrame): DataFrame containing bump information, the result follows the order of its 'Name' column.
+
+    Returns:
+    - pd.DataFrame: A DataFrame indexed by bump name with one column per repair type
+      ('Repairable', 'Unrepairable', 'Benign', 'Catastrophic'), containing the number of faults involving the bump.
+    """
+    # One (bump, repair type) pair per bump of each fault
+    pairs = Repair_Table[['Fault', 'Repair_Type']].explode('Fault')
+
+    # Count the pairs and align the counts with the bump map
+    counts = pd.crosstab(pairs['Fault'], pairs['Repair_Type'])
+    counts = counts.reindex(index=df_bump['Name'], columns=['Repairable', 'Unrepairable', 'Benign', 'Catastrophic'], fill_value=0)
+
+    return counts
+
+def Reparability_Heat_Colors(counts, Heatmap_Colormap, levels=10):
+    """
+    This function converts the per-bump counts of Bump_Reparability_Counts into a color scale.
+    The number of Unrepairable and Catastrophic faults involving each bump is quantized into a few levels,
+    so that bumps of the same level and shape share one SVG group.
+
+    Parameters:
+    - counts (pd.DataFrame): Result of Bump_Reparability_Counts.
+    - Heatmap_Colormap (str): Name of a matplotlib colormap.
+    - levels (int): Number of colors of the scale.
+
+    Returns:
+    - tuple: (bump_colors, legend) where bump_colors is a list with one color per bump and legend is a dictionary
+      mapping a label describing the range of each level used to its color.
+    """
+    critical = (counts['Unrepairable'] + counts['Catastrophic']).to_numpy()
+    maximum = max(int(critical.max()), 1)
+
+    # Level 0 is reserved to the bumps involved in no critical fault
+    level = np.ceil(critical / maximum * (levels - 1)).astype(int)
+    colormap = plt.get_cmap(Heatmap_Colormap)
+    palette = [to_hex(colormap(i / (levels - 1))) for i in range(levels)]
+    bump_colors = [palette[i] for i in level]
+
+    # Range of critical faults of each level used by a bump
+    legend = {}
+    for i in sorted(set(level.tolist())):
+        low = int(critical[level == i].min())
+        high = int(critical[level == i].max())
+        legend[f'{low} critical faults' if low == high else f'{low}-{high} critical faults'] = palette[i]
+
+    return bump_colors, legend
+
 def Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name, Open_SVG,
                 Bump_Diameter, Pitch, Input_X_scale, Input_Y_scale,
                 Legend, Margin, Bump_Name, Stroke_Color,
-                Font, Font_Size, Display_Reparability_SVG):
+                Font, Font_Size, Display_Reparability_SVG, Reparability_Heatmap=False, Heatmap_Colormap='YlOrRd', Repair_Table=None):
     """
     This function generates an SVG image of the bump map based on the provided parameters.
     It reads the bump map data from a specified file, applies scaling factors, and creates
@@ -365,6 +1134,9 @@ def Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name
     - Font (str): Font to be used for text in the SVG image.
     - Font_Size (float): Scaling factor for the font size.
     - Display_Reparability_SVG (bool): Flag to display reparability information in the SVG image.
+    - Reparability_Heatmap (bool): Flag to color each bump by the number of Unrepairable and Catastrophic faults it is involved in.
+    - Heatmap_Colormap (str): Matplotlib colormap used by the reparability heatmap.
+    - Repair_Table (pd.DataFrame, optional): An already computed Repair_Table, used instead of running Repair_Statistics_using_LogicSolver.
     """
     # Code to generate the SVG image
     # (The code remains the same as provided in the original script)
@@ -449,48 +1221,23 @@ def Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name
     else:
         a = 1
 
-    # If the Display_Reparability_SVG flag is set, generate the repair solutions table
-    if Display_Reparability_SVG:   
+    # Resolve the colors and shapes once, and index the coordinates of the bumps by name
+    color_dict, shape_dict = SVG_Style_Tables(aspect)
+    coordinates = dict(zip(df['Name'], zip(df['X'], df['Y'])))
+    symbols = SVG_Shape_Symbols(s, Stroke_Color)
+
+    # If the reparability is displayed, generate the repair table unless it is given
+    if (Display_Reparability_SVG or Reparability_Heatmap) and Repair_Table is None:
         # Call the function to generate repair statistics using a logic solver
-        Repair_Solutions_Table = Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, Faults_Number, Interface_IRL_file_name, Reparability_Table_file_name, Fault_Table_file_name, Print_Fault) 
+        Repair_Table = Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, Faults_Number, Interface_IRL_file_name, Reparability_Table_file_name, Fault_Table_file_name, Print_Fault, Reuse=Reuse_Tables) 
+
+    # If the Display_Reparability_SVG flag is set, draw the 2-bump shorts
+    if Display_Reparability_SVG:   
+        Repair_Solutions_Table = Repair_Table
 
         if Fault_Type == 'Short' and Shorted_Bumps_Number == 2:
-            
-            for index, fault in Repair_Solutions_Table.iterrows():
-                # Initialize a list to store the coordinates of the bumps involved in the fault
-                fault_coordinates = []
-                # Extract the list of bumps involved in the fault
-                bumps = fault['Fault']
-                # Iterate through each bump in the fault
-                for bump in bumps:
-                    # Initialize a list to store the coordinates of the current bump
-                    bump_coordinates = []
-                    # Get the x-coordinate of the bump from the DataFrame
-                    X_coord = df[df['Name'] == bump]['X'].values[0]
-                    # Get the y-coordinate of the bump from the DataFrame
-                    Y_coord = df[df['Name'] == bump]['Y'].values[0]
-                    # Append the coordinates to the bump_coordinates list
-                    bump_coordinates.append(X_coord)
-                    bump_coordinates.append(Y_coord)
-                    # Append the bump_coordinates list to the fault_coordinates list
-                    fault_coordinates.append(bump_coordinates)
-                
-                # Get the repair type for the current fault
-                Reparability = fault['Repair_Type']
-                # Get the color corresponding to the repair type from the aspect DataFrame
-                color = aspect.loc[aspect['Type'] == Reparability, 'Color'].values[0]
-
-                # If the repair type is 'Catastrophic', draw a thick, solid line between the bumps
-                if Reparability == 'Catastrophic':
-                    bumpmap.append(Line(fault_coordinates[0][0], fault_coordinates[0][1], fault_coordinates[1][0], fault_coordinates[1][1], color, 2*s))
-                
-                # If the repair type is 'Benign', draw a thin, dashed line between the bumps
-                if Reparability == 'Benign':
-                    bumpmap.append(dw.Line(fault_coordinates[0][0], fault_coordinates[0][1], fault_coordinates[1][0], fault_coordinates[1][1], stroke = color, stroke_width = s/6, stroke_dasharray = '2,2'))
-
-                # For other repair types, draw a regular line between the bumps
-                else: 
-                    bumpmap.append(Line(fault_coordinates[0][0], fault_coordinates[0][1], fault_coordinates[1][0], fault_coordinates[1][1], color, s))
+            # Draw one line between the two bumps of each short, colored by reparability
+            Append_Fault_Lines_SVG(bumpmap, Repair_Solutions_Table, coordinates, color_dict, s)
 
             # If the legend is enabled, add the repair types to the legend list
             if Legend:    
@@ -498,33 +1245,24 @@ def Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name
                     legend_list.append(i)
         else: 
             print('Warning : Display_Reparability_SVG does not work with others fault model than 2-bumps short. Please specify the correct fault model with : --Fault_Type and --Shorted_Bumps_Number')
-               
-    # Iterate over each bump in the DataFrame
-    for i in range(df.shape[0]):
-
-        # Define the x, y coordinates using the columns from the DataFrame
-        x = df['X'][i]
-        y = df['Y'][i]
 
-        bump_type = df['Type'][i]
-
-        # Recover colors and shapes from the aspect DataFrame corresponding to the bump type
-        color = aspect.loc[aspect['Type'] == bump_type, 'Color'].values[0]
-        shape = aspect.loc[aspect['Type'] == bump_type, 'Shape'].values[0]
-
-        # If a bump is a spare, get the shape from the aspect file
-        if df['Spare'][i] == True:
-            shape = aspect.loc[aspect['Type'] == 'SPARE', 'Shape'].values[0]
-
-        # Generate a shape for each bump at the position x, y with the shape, color, and stroke color required
-        bumpmap.append(shape_function_dict[shape](x, y, s, 'white', Stroke_Color, 1))
-        bumpmap.append(shape_function_dict[shape](x, y, s, color, Stroke_Color, a))
-
-        # Show the bump name if required and if the bump is not a POWER or GND connection  
-        if Bump_Name:
-            if df['Type'][i] != 'GND' and df['Type'][i] != 'POWER': 
-                bump_name = df['Name'][i].replace('_phy', '')
-                bumpmap.append(Text(x, y, bump_name, 1.2*s, Font_Size, Font, 'middle', 'start', -15))
+    # If the Reparability_Heatmap flag is set, color the bumps by their number of critical faults
+    bump_colors = None
+    if Reparability_Heatmap:
+        bump_colors, heat_legend = Reparability_Heat_Colors(Bump_Reparability_Counts(Repair_Table, df), Heatmap_Colormap)
+        # The levels of the scale are added to the legend as circles
+        for label, color in heat_legend.items():
+            color_dict[label] = color
+            shape_dict[label] = 'Circle'
+            if Legend:
+                legend_list.append(label)
+
+    # Draw the bumps, grouped by style and referencing the shape symbols
+    Append_Bumps_SVG(bumpmap, df, color_dict, shape_dict, symbols, Stroke_Color, a, bump_colors)
+
+    # Show the bump names if required, POWER and GND connections are not named
+    if Bump_Name:
+        Append_Bump_Names_SVG(bumpmap, df, s, Font_Size, Font)
 
     # Show the legend if required
     if Legend:
@@ -532,8 +1270,8 @@ def Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name
         X_edge = width + legend_margin - Margin 
         for j in legend_list:
             index = legend_list.index(j)
-            color = aspect.loc[aspect['Type'] == j, 'Color'].values[0]
-            shape = aspect.loc[aspect['Type'] == j, 'Shape'].values[0]
+            color = color_dict[j]
+            shape = shape_dict[j]
 
             X_Shape = X_edge - 0.65 * legend_margin
             Y_Shape = (index * Pitch)
@@ -599,65 +1337,394 @@ def Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name
     if Open_SVG:
         os.system(f'inkscape {BumpMap_SVG_image_file_name}') 
  
-# Section 3 : Raw Solvers
-def LogicSolver(Chain_list, Route_Table, df_bump, fault):
+def Render_LOD_Overview(df, color_dict, min_X, min_Y, Cell_Size, LOD_Color_Mode, file_name):
     """
-    This function determines the reparability of a fault based on the available repair chains and route table.
-    The function will evaluate how many spares are available per affected repair chain. 
-    It will compare this number to the number of connection that need to be repaired.
-    The fault can be repaired if there is enough spares in the affected repair chains.
+    This function renders the coarse level of detail of a bump map: the bumps are aggregated into square cells
+    and each cell becomes one pixel of a raster image.
+    In 'Type' mode, a cell takes the color of its most frequent bump type and its opacity grows with the bump density.
+    In 'Density' mode, a cell is colored by its number of bumps.
 
     Parameters:
-    - Chain_list (list): List of repair chains.
-    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
-    - df_bump (pd.DataFrame): DataFrame containing bump information.
-    - fault (list): List of faulty connections.
+    - df (pd.DataFrame): DataFrame containing the columns 'X', 'Y' and 'Type'.
+    - color_dict (dict): Dictionary mapping each type to its color, see SVG_Style_Tables.
+    - min_X (float): X coordinate of the left edge of the first cell.
+    - min_Y (float): Y coordinate of the top edge of the first cell.
+    - Cell_Size (float): Side of a cell, in µm.
+    - LOD_Color_Mode (str): 'Type' or 'Density'.
+    - file_name (str): Path of the PNG image to write.
 
     Returns:
-    - str: 'Repairable' if the fault can be repaired, 'Unrepairable' otherwise.
+    - tuple: (number of columns, number of rows) of cells.
     """
+    # Cell index of each bump
+    ix = ((df['X'].to_numpy() - min_X) // Cell_Size).astype(np.int64)
+    iy = ((df['Y'].to_numpy() - min_Y) // Cell_Size).astype(np.int64)
+    nx = int(ix.max()) + 1
+    ny = int(iy.max()) + 1
+    cell = iy * nx + ix
+
+    # Number of bumps per cell
+    density = np.bincount(cell, minlength=nx * ny)
+    filled = density > 0
+
+    if LOD_Color_Mode == 'Density':
+        image = plt.get_cmap('viridis')(density / density.max())
+
+    elif LOD_Color_Mode == 'Type':
+        # Count the bumps of each type in every cell and keep the most frequent type
+        codes, types = pd.factorize(df['Type'])
+        counts = np.bincount(cell * len(types) + codes, minlength=nx * ny * len(types)).reshape(nx * ny, len(types))
+        majority = counts.argmax(axis=1)
+        palette = np.array([to_rgba(color_dict[bump_type]) for bump_type in types])
+        image = palette[majority]
+        # The opacity of a cell grows with its density, from 0.2 to 1
+        image[:, 3] = 0.2 + 0.8 * density / density.max()
 
-    # Initialize the unrepairable flag
-    UnrepairableFlag = False
+    else:
+        raise ValueError(f"LOD_Color_Mode must be 'Type' or 'Density', not {LOD_Color_Mode}")
 
-    # Iterate over each repair chain of the Chain_list
-    for Chain in Chain_list:
-        # Initialize lists to keep track of spare connections and faulty connections
-        Spare_list = []
-        Spare_Count = 0
+    # Empty cells are transparent
+    image[~filled] = (1, 1, 1, 0)
 
-        # If the fault is not marked as Unrepairable yet.
-        if UnrepairableFlag == False: 
-            Faulty_Connections = []
+    # Upscale the cells so the overview is at least 1024 pixels wide
+    factor = max(1, 1024 // nx)
+    image = image.reshape(ny, nx, 4).repeat(factor, axis=0).repeat(factor, axis=1)
+    imsave(file_name, image)
 
-            # Get the signal set (a list of the signal in the affected repair chain) for the current repair chain
-            SignalSet = Route_Table[(Route_Table['RepairChain'] == Chain)]
-      
-            # Iterate over each signal in the signal set
-            for index, signal_row in SignalSet.iterrows():
+    return nx, ny
 
-                # Check if the connection is a spare or if it only exists for repair purpose in the Route_Table, the second condition is related to the special case of HBM2 mode 1, use of DBI connections for repair. 
-                if (df_bump.loc[df_bump['Name'] == signal_row['Connection'], 'Spare'].values[0] == True) or Route_Table[(Route_Table['Connection'] == signal_row['Connection']) & (Route_Table['Status'] == 'Default')].empty:
-                    if signal_row['Connection'] not in Spare_list:
-                        Spare_list.append(signal_row['Connection']) 
-                        # Increment the spare count per 1
-                        Spare_Count += 1
+def Render_Tile(tile):
+    """
+    This function renders one tile of the bump map, in SVG or PNG format.
+    A tile contains the bumps, the bump names and the fault lines located in its bounds, plus the bumps
+    of the neighbouring tiles whose shape overlaps its edges.
+    It is defined at module level so the tiles can be rendered by worker processes.
 
-            # If the connection is found in the SignalSet's 'Connection' values, it is added to the Faulty_Connections list
-            for connection in fault:
+    Parameters:
+    - tile (dict): Description of the tile, as built by Display_Tiled_SVG. The keys are 'file_name', 'bounds',
+      'bumps', 'faults', 'coordinates', 'color_dict', 'shape_dict', 's', 'Stroke_Color', 'Bump_Name', 'Font',
+      'Font_Size', 'Tile_Format' and 'Pixels_per_um'.
 
-                if connection in SignalSet['Connection'].values: # HBM2 Mode 1 DBI specifics
-                    Faulty_Connections.append(connection)
+    Returns:
+    - str: Path of the written tile.
+    """
+    min_X, min_Y, max_X, max_Y = tile['bounds']
+    bumps = tile['bumps']
+    faults = tile['faults']
+    s = tile['s']
+    Stroke_Color = tile['Stroke_Color']
+    color_dict = tile['color_dict']
+    shape_dict = tile['shape_dict']
+
+    # If the bump names are displayed, the bumps are drawn with an opacity of 0.7, as in Display_SVG
+    a = 0.7 if tile['Bump_Name'] else 1
+
+    if tile['Tile_Format'] == 'svg':
+        drawing = dw.Drawing(max_X - min_X, max_Y - min_Y, origin=(min_X, min_Y))
+        if faults is not None and len(faults) > 0:
+            Append_Fault_Lines_SVG(drawing, faults, tile['coordinates'], color_dict, s)
+        bump_colors = bumps['Heat_Color'] if 'Heat_Color' in bumps else None
+        Append_Bumps_SVG(drawing, bumps, color_dict, shape_dict, SVG_Shape_Symbols(s, Stroke_Color), Stroke_Color, a, bump_colors)
+        if tile['Bump_Name']:
+            Append_Bump_Names_SVG(drawing, bumps, s, tile['Font_Size'], tile['Font'])
+        drawing.save_svg(tile['file_name'])
+
+    elif tile['Tile_Format'] == 'png':
+        # One figure per tile, scaled so that one µm is Pixels_per_um pixels
+        dpi = 100
+        Pixels_per_um = tile['Pixels_per_um']
+        points_per_um = Pixels_per_um * 72 / dpi
+        figure = Figure(figsize=((max_X - min_X) * Pixels_per_um / dpi, (max_Y - min_Y) * Pixels_per_um / dpi), dpi=dpi)
+        ax = figure.add_axes([0, 0, 1, 1])
+        ax.set_xlim(min_X, max_X)
+        ax.set_ylim(max_Y, min_Y)
+        ax.axis('off')
+
+        # Fault lines, one collection per repair type
+        if faults is not None and len(faults) > 0:
+            for Reparability, group in faults.groupby('Repair_Type'):
+                segments = [(tile['coordinates'][bumps_pair[0]], tile['coordinates'][bumps_pair[1]]) for bumps_pair in group['Fault']]
+                width = (2 if Reparability == 'Catastrophic' else 1) * s / 6 * points_per_um
+                linestyle = (0, (2, 2)) if Reparability == 'Benign' else 'solid'
+                ax.add_collection(LineCollection(segments, colors=color_dict[Reparability], linewidths=width, linestyles=linestyle))
+
+        # Bumps, one scatter per color and shape
+        markers = {'Circle': 'o', 'Triangle': '^', 'Square': 's'}
+        shapes = np.where(bumps['Spare'] == True, shape_dict['SPARE'], bumps['Type'].map(shape_dict))
+        colors = bumps['Heat_Color'].to_numpy() if 'Heat_Color' in bumps else bumps['Type'].map(color_dict).to_numpy()
+        for color, shape in set(zip(colors, shapes)):
+            selection = (colors == color) & (shapes == shape)
+            ax.scatter(bumps['X'].to_numpy()[selection], bumps['Y'].to_numpy()[selection], s=(2 * s * points_per_um) ** 2, marker=markers[shape],
+                       c=color, edgecolors=Stroke_Color, linewidths=s / 10 * points_per_um, alpha=a)
+
+        # Bump names, POWER and GND connections are not named
+        if tile['Bump_Name']:
+            for x, y, bump_type, name in zip(bumps['X'], bumps['Y'], bumps['Type'], bumps['Name']):
+                if bump_type != 'GND' and bump_type != 'POWER':
+                    ax.text(x, y, name.replace('_phy', ''), fontsize=tile['Font_Size'] * 0.96 * s * points_per_um, family=tile['Font'],
+                            va='center', ha='left', rotation=15, rotation_mode='anchor')
+
+        figure.savefig(tile['file_name'], dpi=dpi)
 
-                signal = connection.replace('_phy', '')
-                if signal in SignalSet['Signal'].values:
-                    # If the connection does not have any repair option. In other words, if it only has a default connection, then the fault is marked as Unrepairable
-                    if Route_Table[(Route_Table['Signal'] == signal) & (Route_Table['Status'] != 'Default')].empty:
-                        UnrepairableFlag = True
-                        
-            # If the number of faulty connections exceeds the spare count, mark as Unrepairable
-            if len(Faulty_Connections) > Spare_Count:
-                UnrepairableFlag = True
+    else:
+        raise ValueError(f"Tile_Format must be 'svg' or 'png', not {tile['Tile_Format']}")
+
+    return tile['file_name']
+
+def Display_Tiled_SVG(BumpMap_file_name, Aspect_file_name, Tile_Directory, Bump_Diameter, Pitch, Input_X_scale, Input_Y_scale,
+                      Bump_Name, Stroke_Color, Font, Font_Size, Display_Reparability_SVG,
+                      Tile_Size, Tile_Format, LOD_Cell_Size, LOD_Color_Mode, Tile_Workers,
+                      Reparability_Heatmap=False, Heatmap_Colormap='YlOrRd', Repair_Table=None):
+    """
+    This function renders a bump map as a level-of-detail pyramid, for interfaces too large for a single SVG image.
+    Level 0 is a raster overview where the bumps are aggregated into cells (see Render_LOD_Overview).
+    Level 1 is a grid of SVG or PNG tiles, each containing only its own bumps, names and fault lines (see Render_Tile).
+    The tiles are built and rendered one at a time, or by Tile_Workers processes with a bounded number of tiles in flight,
+    so the memory used does not grow with the number of tiles.
+    The description of every level and tile is written in Tile_Directory/Tiles.json.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Aspect_file_name (str): Path to the file containing colors and shapes of bumps.
+    - Tile_Directory (str): Directory where the tiles are written.
+    - Bump_Diameter (float): Diameter of the bumps in micrometers.
+    - Pitch (float): Pitch of the interface, estimated from the bump map if 0.
+    - Input_X_scale (float): Scaling factor for the X-axis in the bump map file.
+    - Input_Y_scale (float): Scaling factor for the Y-axis in the bump map file.
+    - Bump_Name (bool): Flag to display the bump names in the tiles.
+    - Stroke_Color (str): Color of the stroke around the bumps.
+    - Font (str): Font to be used for the bump names.
+    - Font_Size (float): Scaling factor for the font size.
+    - Display_Reparability_SVG (bool): Flag to draw the 2-bump shorts in the tiles, colored by reparability.
+    - Tile_Size (float): Side of a tile, as a multiple of the pitch.
+    - Tile_Format (str): 'svg' or 'png'.
+    - LOD_Cell_Size (float): Side of a cell of the overview, as a multiple of the pitch.
+    - LOD_Color_Mode (str): 'Type' or 'Density', see Render_LOD_Overview.
+    - Tile_Workers (int): Number of processes rendering the tiles.
+    - Reparability_Heatmap (bool): Flag to color each bump by the number of Unrepairable and Catastrophic faults it is involved in.
+    - Heatmap_Colormap (str): Matplotlib colormap used by the reparability heatmap.
+    - Repair_Table (pd.DataFrame, optional): An already computed Repair_Table, used instead of running Repair_Statistics_using_LogicSolver.
+
+    Returns:
+    - dict: The content of Tiles.json.
+    """
+    # Load the bump map and the aspect file, and scale the coordinates
+    df = Avoid_bump_name_iteration(BumpMap_file_name)
+    aspect = file_loading_as_a_DataFrame(Aspect_file_name)
+    df['X'] = df['X'] * Input_X_scale
+    df['Y'] = df['Y'] * Input_Y_scale
+
+    min_X = df['X'].min()
+    min_Y = df['Y'].min()
+    max_X = df['X'].max()
+    max_Y = df['Y'].max()
+
+    # If the pitch is not defined by the user, it is estimated as in Display_SVG
+    if Pitch == 0:
+        X_Pitch = (max_X - min_X) / (len(df['X'].unique()) / 2)
+        Y_Pitch = (max_Y - min_Y) / (len(df['Y'].unique()) / 2)
+        Pitch = (X_Pitch + Y_Pitch) / 2
+        print('Warning : The pitch is not defined by the user. To define it, please use : --Pitch int (in µm)')
+
+    s = 0.2 * Bump_Diameter * Pitch
+    color_dict, shape_dict = SVG_Style_Tables(aspect)
+    os.makedirs(Tile_Directory, exist_ok=True)
+
+    # The grid starts half a pitch before the first bump so the bumps on the edges are not cut
+    origin_X = min_X - Pitch / 2
+    origin_Y = min_Y - Pitch / 2
+    index = {
+        'Pitch': Pitch,
+        'Bounds': [origin_X, origin_Y, max_X + Pitch / 2, max_Y + Pitch / 2],
+        'Levels': [],
+    }
+
+    # Level 0 : coarse overview
+    Cell_Size = LOD_Cell_Size * Pitch
+    nx, ny = Render_LOD_Overview(df, color_dict, origin_X, origin_Y, Cell_Size, LOD_Color_Mode, os.path.join(Tile_Directory, 'LOD_0.png'))
+    index['Levels'].append({'Level': 0, 'File': 'LOD_0.png', 'Cell_Size': Cell_Size, 'Columns': nx, 'Rows': ny, 'Color_Mode': LOD_Color_Mode})
+
+    # If the reparability is displayed, generate the repair table unless it is given
+    if (Display_Reparability_SVG or Reparability_Heatmap) and Repair_Table is None:
+        Repair_Table = Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, Faults_Number, Interface_IRL_file_name, Reparability_Table_file_name, Fault_Table_file_name, Print_Fault, Reuse=Reuse_Tables)
+
+    # The heat colors are stored with the bumps, so each tile carries the colors of its own bumps
+    if Reparability_Heatmap:
+        df['Heat_Color'], heat_legend = Reparability_Heat_Colors(Bump_Reparability_Counts(Repair_Table, df), Heatmap_Colormap)
+        index['Heatmap_Legend'] = heat_legend
+
+    # The 2-bump shorts to draw, with the coordinates of their bumps
+    faults = None
+    if Display_Reparability_SVG:
+        if Fault_Type == 'Short' and Shorted_Bumps_Number == 2:
+            faults = Repair_Table[['Fault', 'Repair_Type']].reset_index(drop=True)
+        else:
+            print('Warning : Display_Reparability_SVG does not work with others fault model than 2-bumps short. Please specify the correct fault model with : --Fault_Type and --Shorted_Bumps_Number')
+
+    # Level 1 : tile index of each bump, and bumps sorted by tile
+    Tile_Side = Tile_Size * Pitch
+    tx = ((df['X'].to_numpy() - origin_X) // Tile_Side).astype(np.int64)
+    ty = ((df['Y'].to_numpy() - origin_Y) // Tile_Side).astype(np.int64)
+    n_tiles_X = int(tx.max()) + 1
+    tile_id = ty * n_tiles_X + tx
+    order = np.argsort(tile_id, kind='stable')
+    sorted_id = tile_id[order]
+    tile_ids, starts = np.unique(sorted_id, return_index=True)
+    tile_slices = dict(zip(tile_ids.tolist(), zip(starts.tolist(), np.append(starts[1:], len(order)).tolist())))
+
+    # Tiles of each fault line: a line is drawn in the tiles of both of its bumps
+    position = pd.Series(np.arange(len(df)), index=df['Name'])
+    faults_per_tile = defaultdict(list)
+    if faults is not None:
+        for row, bumps_pair in enumerate(faults['Fault']):
+            for tile in set(tile_id[position[list(bumps_pair)].to_numpy()].tolist()):
+                faults_per_tile[tile].append(row)
+
+    # Bumps closer than this margin to the edge of a tile overlap it
+    halo = 2 * s
+
+    def Tiles():
+        # Build the tiles one at a time
+        for tile in tile_slices:
+            column, row = tile % n_tiles_X, tile // n_tiles_X
+            bounds = (origin_X + column * Tile_Side, origin_Y + row * Tile_Side, origin_X + (column + 1) * Tile_Side, origin_Y + (row + 1) * Tile_Side)
+
+            # Own bumps, and bumps of the neighbouring tiles overlapping the edges
+            members = []
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    if 0 <= column + dx < n_tiles_X and (tile + dy * n_tiles_X + dx) in tile_slices:
+                        begin, end = tile_slices[tile + dy * n_tiles_X + dx]
+                        members.append(order[begin:end])
+            members = np.concatenate(members)
+            X = df['X'].to_numpy()[members]
+            Y = df['Y'].to_numpy()[members]
+            members = members[(X > bounds[0] - halo) & (X < bounds[2] + halo) & (Y > bounds[1] - halo) & (Y < bounds[3] + halo)]
+            bumps = df.iloc[np.sort(members)][['Name', 'X', 'Y', 'Type', 'Spare'] + (['Heat_Color'] if Reparability_Heatmap else [])]
+
+            # Fault lines of the tile, and the coordinates of their bumps
+            tile_faults = None
+            coordinates = None
+            if faults is not None:
+                tile_faults = faults.iloc[faults_per_tile[tile]]
+                names = list({name for bumps_pair in tile_faults['Fault'] for name in bumps_pair})
+                rows = position[names].to_numpy()
+                coordinates = dict(zip(names, zip(df['X'].to_numpy()[rows], df['Y'].to_numpy()[rows])))
+
+            yield {
+                'file_name': os.path.join(Tile_Directory, f'Tile_{row}_{column}.{Tile_Format}'),
+                'bounds': bounds,
+                'bumps': bumps,
+                'faults': tile_faults,
+                'coordinates': coordinates,
+                'color_dict': color_dict,
+                'shape_dict': shape_dict,
+                's': s,
+                'Stroke_Color': Stroke_Color,
+                'Bump_Name': Bump_Name,
+                'Font': Font,
+                'Font_Size': Font_Size,
+                'Tile_Format': Tile_Format,
+                'Pixels_per_um': 32 / Pitch,
+            }, column, row, int(tile_slices[tile][1] - tile_slices[tile][0])
+
+    tiles_index = []
+    def Register(column, row, bounds, bumps_number):
+        tiles_index.append({'File': f'Tile_{row}_{column}.{Tile_Format}', 'Column': column, 'Row': row, 'Bounds': list(bounds), 'Bumps': bumps_number})
+
+    # Render the tiles, either sequentially or with a bounded number of tiles sent to the worker processes
+    # The progress is updated by the parent process when a worker returns a tile
+    Progress_Start('Tiles', len(tile_slices))
+    if Tile_Workers > 1:
+        with ProcessPoolExecutor(max_workers=Tile_Workers) as executor:
+            pending = set()
+            for tile, column, row, bumps_number in Tiles():
+                if len(pending) >= 2 * Tile_Workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                        Progress_Update()
+                pending.add(executor.submit(Render_Tile, tile))
+                Register(column, row, tile['bounds'], bumps_number)
+            for future in wait(pending).done:
+                future.result()
+                Progress_Update()
+    else:
+        for tile, column, row, bumps_number in Tiles():
+            Render_Tile(tile)
+            Progress_Update()
+            Register(column, row, tile['bounds'], bumps_number)
+    Progress_End()
+
+    index['Levels'].append({'Level': 1, 'Tile_Size': Tile_Side, 'Format': Tile_Format, 'Columns': n_tiles_X, 'Rows': int(ty.max()) + 1, 'Tiles': tiles_index})
+
+    # Write the index of the levels and tiles
+    with open(os.path.join(Tile_Directory, 'Tiles.json'), 'w') as file:
+        json.dump(index, file, indent=1)
+    print(f'Wrote {len(tiles_index)} tiles and the overview to {Tile_Directory}')
+
+    return index
+
+# Section 3 : Raw Solvers
+def LogicSolver(Chain_list, Route_Table, df_bump, fault):
+    """
+    This function determines the reparability of a fault based on the available repair chains and route table.
+    The function will evaluate how many spares are available per affected repair chain. 
+    It will compare this number to the number of connection that need to be repaired.
+    The fault can be repaired if there is enough spares in the affected repair chains.
+
+    Parameters:
+    - Chain_list (list): List of repair chains.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - fault (list): List of faulty connections.
+
+    Returns:
+    - str: 'Repairable' if the fault can be repaired, 'Unrepairable' otherwise.
+    """
+    Profile_Count('LogicSolver calls')
+
+    # Initialize the unrepairable flag
+    UnrepairableFlag = False
+
+    # Iterate over each repair chain of the Chain_list
+    for Chain in Chain_list:
+        # Initialize lists to keep track of spare connections and faulty connections
+        Spare_list = []
+        Spare_Count = 0
+
+        # If the fault is not marked as Unrepairable yet.
+        if UnrepairableFlag == False: 
+            Faulty_Connections = []
+
+            # Get the signal set (a list of the signal in the affected repair chain) for the current repair chain
+            SignalSet = Route_Table[(Route_Table['RepairChain'] == Chain)]
+      
+            # Iterate over each signal in the signal set
+            for index, signal_row in SignalSet.iterrows():
+
+                # Check if the connection is a spare or if it only exists for repair purpose in the Route_Table, the second condition is related to the special case of HBM2 mode 1, use of DBI connections for repair. 
+                if (df_bump.loc[df_bump['Name'] == signal_row['Connection'], 'Spare'].values[0] == True) or Route_Table[(Route_Table['Connection'] == signal_row['Connection']) & (Route_Table['Status'] == 'Default')].empty:
+                    if signal_row['Connection'] not in Spare_list:
+                        Spare_list.append(signal_row['Connection']) 
+                        # Increment the spare count per 1
+                        Spare_Count += 1
+
+            # If the connection is found in the SignalSet's 'Connection' values, it is added to the Faulty_Connections list
+            for connection in fault:
+
+                if connection in SignalSet['Connection'].values: # HBM2 Mode 1 DBI specifics
+                    Faulty_Connections.append(connection)
+
+                signal = connection.replace('_phy', '')
+                if signal in SignalSet['Signal'].values:
+                    # If the connection does not have any repair option. In other words, if it only has a default connection, then the fault is marked as Unrepairable
+                    if Route_Table[(Route_Table['Signal'] == signal) & (Route_Table['Status'] != 'Default')].empty:
+                        UnrepairableFlag = True
+                        
+            # If the number of faulty connections exceeds the spare count, mark as Unrepairable
+            if len(Faulty_Connections) > Spare_Count:
+                UnrepairableFlag = True
 
     # Return the reparability status
     if UnrepairableFlag == True:
@@ -680,369 +1747,2326 @@ def RecursiveSolver(Used_IS_list, Routed_PFS_list, PFS_to_route_list, PFS_counte
     - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
 
     Returns:
-    - None: The function modifies the Solutions_dict_per_RepairChain dictionary in place.
+    - None: The function modifies the Solutions_dict_per_RepairChain dictionary in place.
+    """
+    Profile_Count('RecursiveSolver calls')
+    
+    # Base case: If all PFS are routed, store the solution
+    if Routed_PFS_list == PFS_to_route_list: #If we have routed every PFS 
+        Solutions_dict_per_RepairChain[f'Solution_{len(Solutions_dict_per_RepairChain)}'] = Solution.set_index('Mux')['Sel'].to_dict()
+        return
+
+    # if there exists no solution for the fault yet
+    if len(Solutions_dict_per_RepairChain) == 0:
+
+        # Get the current PFS to route
+        PFS_to_route = PFS_to_route_list[PFS_counter]
+        
+        # Find possible routes for the current PFS in Route_Table
+        possible_PFS_route = Route_Table[(Route_Table['Signal'] == PFS_to_route)]
+
+        for index, route in possible_PFS_route.iterrows():
+            # We marked the connection corresponding to the current route as used
+            Used_IS = route['Connection']
+
+            # Check if the IS and PFS are not already used or routed
+            if Used_IS not in Used_IS_list and PFS_to_route not in Routed_PFS_list:
+
+                # Update the lists and the current solution
+                Used_IS_list.append(Used_IS)
+                Routed_PFS_list.append(PFS_to_route)
+                Solution = Solution._append(route, ignore_index=True)
+
+                # Recursively solve for the next PFS
+                RecursiveSolver(Used_IS_list, Routed_PFS_list, PFS_to_route_list, PFS_counter + 1, Solution, Solutions_dict_per_RepairChain, Route_Table, Repair_Type)
+
+                if len(Solutions_dict_per_RepairChain) == 0:
+                    # Backtrack to explore other routes
+                    Routed_PFS_list.pop()
+                    Used_IS_list.pop()
+                    Solution = Solution.drop(Solution.index[-1])
+
+def BundleSolver(df_bump, fault, Route_Table):
+    """
+    This function determines the reparability of a fault based on the available bundles and route table.
+    It only works with interface made of bundles. 
+    See the README for more informations.
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - fault (list): List of faulty connections.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+
+    Returns:
+    - str: 'Repairable' if the fault can be repaired, 'Unrepairable' otherwise.
+    """
+    Profile_Count('BundleSolver calls')
+
+    # Initialize an empty list to store unique bundles associated with the faulty connections
+    Bundle_list = []
+
+    # Initialize a flag to determine if the fault is unrepairable
+    UnrepairableFlag = False
+
+    # Iterate through each connection in the fault list
+    for connection in fault:
+        # Get the bundle associated with the current connection
+        Bundle = df_bump.loc[df_bump['Name'] == connection, 'Bundle'].values[0]
+        
+        # If the bundle is not already in the Bundle_list, add it
+        if Bundle not in Bundle_list:
+            Bundle_list.append(Bundle)
+
+    # Iterate through each unique bundle in the Bundle_list
+    for Bundle in Bundle_list:
+        # If the fault is not already marked as unrepairable and the bundle is not None
+        if UnrepairableFlag == False and Bundle != None:
+            # Check if there is a default route for the bundle in the Route_Table, in other words : check if the bundle is for repair purpose only 
+            if not Route_Table[(Route_Table['Connection'] == Bundle) & (Route_Table['Status'] == 'Default')].empty:
+                # Get the signal name associated with the bundle
+                Bundle_Signal = Bundle.replace('_phy', '')
+
+                # Get the repair connection for the bundle signal
+                Repair_Bundle = Route_Table[(Route_Table['Signal'] == Bundle_Signal) & (Route_Table['Status'] == 'Repair')]['Connection'].values[0]
+
+                # If the repair bundle assigned to the current bundle is in the Bundle_list, mark the fault as unrepairable
+                if Repair_Bundle in Bundle_list:
+                    UnrepairableFlag = True
+
+    # Return the reparability status based on the UnrepairableFlag
+    if UnrepairableFlag == True: 
+        return 'Unrepairable'
+    else:
+        return 'Repairable'
+    
+def Bundle_Repair_Map(Route_Table):
+    """
+    This function precomputes the repair bundle of every functional bundle of an interface made of bundles,
+    ie the lookups done by BundleSolver for each fault.
+
+    Parameters:
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+
+    Returns:
+    - dict: The repair bundle of each bundle having a default route (None if the bundle has no repair route).
+    """
+    Functional_Bundles = Route_Table.loc[Route_Table['Status'] == 'Default', 'Connection'].unique()
+    Repair_Routes = Route_Table[Route_Table['Status'] == 'Repair'].drop_duplicates('Signal').set_index('Signal')['Connection']
+
+    return {Bundle: Repair_Routes.get(Bundle.replace('_phy', '')) for Bundle in Functional_Bundles}
+
+def Bundle_Reparability(Bundles, Repair_Map):
+    """
+    This function determines the reparability of a fault from the set of affected bundles, with the rule of BundleSolver : 
+    the fault is unrepairable if a functional bundle and its repair bundle are both affected.
+
+    Parameters:
+    - Bundles (set): The bundles affected by the fault.
+    - Repair_Map (dict): The repair bundle of each functional bundle (see Bundle_Repair_Map).
+
+    Returns:
+    - str: 'Repairable' if the fault can be repaired, 'Unrepairable' otherwise.
+    """
+    Profile_Count('BundleSolver calls')
+
+    for Bundle in Bundles:
+        Repair_Bundle = Repair_Map.get(Bundle)
+        if Repair_Bundle is not None and Repair_Bundle in Bundles:
+            return 'Unrepairable'
+    return 'Repairable'
+
+def Jit(function):
+    """
+    This function compiles a kernel with Numba when it is installed, the kernel being run as it is by Python otherwise.
+    The kernels only use integer and float arrays, so that both give identical results.
+    """
+    if njit is None:
+        return function
+    return njit(cache=True)(function)
+
+@Jit
+def Short_Kernel(points, index_list, threshold):
+    """
+    This function is the kernel of is_short : the bumps of index_list form a short if they form a single connected component,
+    two bumps being connected if their distance is below threshold.
+
+    Parameters:
+    - points (np.ndarray): The coordinates of the bumps of the interface, one row per bump.
+    - index_list (np.ndarray): The indices of the bumps.
+    - threshold (float): Maximum distance for two bumps to be considered connected.
+
+    Returns:
+    - bool: True if the bumps form a short (or an open for a single bump), False otherwise.
+    """
+    n = index_list.shape[0]
+    if n == 0:
+        return False
+    # As in the original is_short, a single bump is accepted (it is an open) : the 1-bump shorts of Fault_Enumerator are the single opens
+    if n == 1:
+        return True
+
+    # Depth first search from the first bump
+    visited = np.zeros(n, dtype=np.bool_)
+    stack = np.empty(n, dtype=np.int64)
+    visited[0] = True
+    stack[0] = 0
+    top = 1
+    reached = 1
+    while top > 0:
+        top -= 1
+        a = index_list[stack[top]]
+        for j in range(n):
+            if not visited[j]:
+                b = index_list[j]
+                sum_squared_diff = 0.0
+                for k in range(points.shape[1]):
+                    diff = points[a, k] - points[b, k]
+                    sum_squared_diff += diff * diff
+                if np.sqrt(sum_squared_diff) < threshold:
+                    visited[j] = True
+                    stack[top] = j
+                    top += 1
+                    reached += 1
+    return reached == n
+
+@Jit
+def Chain_Capacity_Kernel(fault, chains, Member_ptr, Member_idx, Dead_ptr, Dead_idx, Spares):
+    """
+    This function is the kernel of LogicSolver : a fault is unrepairable if it opens more connections of an affected repair chain than
+    the chain has spares, or a signal of the chain without repair route. The repair chains of each bump are given as compressed rows
+    (the chains of bump b are Member_idx[Member_ptr[b]:Member_ptr[b + 1]], and those where its signal has no repair route in Dead_idx).
+
+    Parameters:
+    - fault (np.ndarray): The indices of the faulty bumps.
+    - chains (np.ndarray): The indices of the affected repair chains.
+    - Member_ptr, Member_idx (np.ndarray): The repair chains of each bump.
+    - Dead_ptr, Dead_idx (np.ndarray): The repair chains where the signal of each bump has no repair route.
+    - Spares (np.ndarray): The number of spares of each repair chain.
+
+    Returns:
+    - bool: True if the fault can be repaired, False otherwise.
+    """
+    for c in chains:
+        count = 0
+        for b in fault:
+            for j in range(Member_ptr[b], Member_ptr[b + 1]):
+                if Member_idx[j] == c:
+                    count += 1
+            for j in range(Dead_ptr[b], Dead_ptr[b + 1]):
+                if Dead_idx[j] == c:
+                    return False
+        if count > Spares[c]:
+            return False
+    return True
+
+@Jit
+def Bundle_Kernel(bundles, Repair_of):
+    """
+    This function is the kernel of Bundle_Reparability : a fault is unrepairable if a functional bundle and its repair bundle are both affected.
+
+    Parameters:
+    - bundles (np.ndarray): The indices of the bundles of the faulty bumps (-1 for a bump without bundle).
+    - Repair_of (np.ndarray): The index of the repair bundle of each bundle (-1 without repair bundle).
+
+    Returns:
+    - bool: True if the fault can be repaired, False otherwise.
+    """
+    for a in bundles:
+        if a >= 0 and Repair_of[a] >= 0:
+            for b in bundles:
+                if b == Repair_of[a]:
+                    return False
+    return True
+
+def Compressed_Rows(rows):
+    """
+    This function converts a list of lists of integers to compressed rows : the row i is indices[pointers[i]:pointers[i + 1]].
+
+    Returns:
+    - tuple: (pointers, indices) as int64 arrays.
+    """
+    pointers = np.zeros(len(rows) + 1, dtype=np.int64)
+    pointers[1:] = np.cumsum([len(row) for row in rows])
+    indices = np.array([value for row in rows for value in row], dtype=np.int64)
+    return pointers, indices
+
+def Interface_Model(df_bump, Route_Table, Bundle_Flag=False):
+    """
+    This function gathers once the lookups done by Fault_Classification and LogicSolver (or BundleSolver in the bundle mode) for every fault,
+    as integer arrays, so that the faults of an interface can be classified and solved by the kernels without any query of the DataFrames
+    (see Model_Repair_Type and Model_Fault_Types).
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+    - Bundle_Flag (bool): Flag to solve the faults by the rule of BundleSolver, the types being taken as they are in the bump map (see Bundle_Fault_Class).
+
+    Returns:
+    - dict: 'Names' and 'Types' of the bumps, 'Classes' (the classes of the bumps, see Bump_Fault_Classes), 'Chain_Index' (the index of each repair chain),
+      'Member' and 'Dead' (the compressed rows of the repair chains of each bump, and of those where its signal has no repair route), 'Spares' (the spares of
+      each repair chain, as counted by LogicSolver), 'Chain_Masks' (see Chain_Bitset_Masks), and in the bundle mode 'Bundles' (the index of the bundle
+      of each bump, -1 without bundle) and 'Repair_of'.
+    """
+    Model = {'Names': df_bump['Name'].tolist(), 'Types': df_bump['Type'].tolist(), 'Bundle_Flag': Bundle_Flag}
+    if Bundle_Flag:
+        Repair_Map = Bundle_Repair_Map(Route_Table)
+        Bundle_Names = list(dict.fromkeys([Bundle for Bundle in df_bump['Bundle'] if not pd.isna(Bundle)] + list(Repair_Map) + [Bundle for Bundle in Repair_Map.values() if Bundle is not None]))
+        Bundle_Index = {Bundle: index for index, Bundle in enumerate(Bundle_Names)}
+        Model['Bundles'] = np.array([-1 if pd.isna(Bundle) else Bundle_Index[Bundle] for Bundle in df_bump['Bundle']], dtype=np.int64)
+        Model['Repair_of'] = np.array([Bundle_Index[Repair_Map[Bundle]] if Repair_Map.get(Bundle) is not None else -1 for Bundle in Bundle_Names], dtype=np.int64)
+        return Model
+
+    Model['Classes'] = Bump_Fault_Classes(df_bump, Route_Table)
+    Model['Chain_Index'] = {RepairChain: index for index, RepairChain in enumerate(Model['Classes']['Chain_Names'])}
+
+    # Spares and signals without repair route of each repair chain, as counted by LogicSolver
+    Default_Connections = set(Route_Table.loc[Route_Table['Status'] == 'Default', 'Connection'])
+    Spare = dict(zip(df_bump['Name'], (df_bump['Spare'] == True).tolist()))
+    Repair_Signals = set(Route_Table.loc[Route_Table['Status'] != 'Default', 'Signal'])
+    Bump_Index = {name: index for index, name in enumerate(Model['Names'])}
+    Bumps_of_Signal = defaultdict(list)
+    for index, name in enumerate(Model['Names']):
+        Bumps_of_Signal[name.replace('_phy', '')].append(index)
+
+    Member = [[] for _ in Model['Names']]
+    Dead = [[] for _ in Model['Names']]
+    Model['Spares'] = np.zeros(len(Model['Chain_Index']), dtype=np.int64)
+    Model['Chain_Masks'] = [None] * len(Model['Chain_Index'])
+    for RepairChain, Chain_Routes in Route_Table.groupby('RepairChain', sort=False):
+        c = Model['Chain_Index'][RepairChain]
+        Connections = set(Chain_Routes['Connection'])
+        Chain_Members = [Bump_Index[connection] for connection in Connections if connection in Bump_Index]
+        Chain_Dead = [index for signal_name in set(Chain_Routes['Signal']) - Repair_Signals for index in Bumps_of_Signal.get(signal_name, [])]
+        for index in Chain_Members:
+            Member[index].append(c)
+        for index in Chain_Dead:
+            Dead[index].append(c)
+        Model['Spares'][c] = sum(Spare.get(connection, False) or connection not in Default_Connections for connection in Connections)
+        Model['Chain_Masks'][c] = Chain_Bitset_Masks(Chain_Members, Chain_Dead, np.flatnonzero(Model['Classes']['Chain'] == c))
+    Model['Member'] = Compressed_Rows(Member)
+    Model['Dead'] = Compressed_Rows(Dead)
+    return Model
+
+def Model_Repair_Type(Model, index_list, Chain_list):
+    """
+    This function determines the reparability of a fault needing a repair action with an interface model, with the result of LogicSolver
+    (or of BundleSolver in the bundle mode).
+
+    Parameters:
+    - Model (dict): The interface model (see Interface_Model).
+    - index_list (list): The indices of the faulty bumps.
+    - Chain_list (set): The affected repair chains (see Fault_Classification).
+
+    Returns:
+    - str: 'Repairable' if the fault can be repaired, 'Unrepairable' otherwise.
+    """
+    fault = np.asarray(index_list, dtype=np.int64)
+    if Model['Bundle_Flag']:
+        Profile_Count('BundleSolver calls')
+        return 'Repairable' if Bundle_Kernel(Model['Bundles'][fault], Model['Repair_of']) else 'Unrepairable'
+
+    Profile_Count('LogicSolver calls')
+    chains = np.array([Model['Chain_Index'][RepairChain] for RepairChain in Chain_list], dtype=np.int64)
+    Repairable = Chain_Capacity_Kernel(fault, chains, *Model['Member'], *Model['Dead'], Model['Spares'])
+    return 'Repairable' if Repairable else 'Unrepairable'
+
+def Bitset_Words(indices):
+    """
+    This function gives the word and the bit of each bump in a bitset over the bumps of an interface, packed in uint64 words.
+
+    Returns:
+    - tuple: (words, bits) as arrays, bits being the uint64 value of the bit of each bump in its word.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    return indices >> 6, np.left_shift(np.uint64(1), (indices & 63).astype(np.uint64))
+
+def Chain_Bitset_Masks(Members, Dead, First):
+    """
+    This function precomputes the masks of a repair chain for the bitset engine (see Bitset_Repairable), over the words of the bitset
+    containing its bumps only.
+
+    Parameters:
+    - Members (list): The indices of the bumps connected to the repair chain.
+    - Dead (list): The indices of the bumps whose signal has no repair route in the repair chain.
+    - First (list): The indices of the bumps whose first route is in the repair chain (the faults affecting them are checked against this chain).
+
+    Returns:
+    - tuple: (w0, Member, Dead, First), the first word of the masks and the three masks, or None if the repair chain has no bump.
+    """
+    All = np.concatenate([np.asarray(Bumps, dtype=np.int64) for Bumps in [Members, Dead, First]])
+    if len(All) == 0:
+        return None
+    w0 = All.min() >> 6
+    Masks = []
+    for Bumps in [Members, Dead, First]:
+        Mask = np.zeros((All.max() >> 6) - w0 + 1, dtype=np.uint64)
+        words, bits = Bitset_Words(Bumps)
+        np.bitwise_or.at(Mask, words - w0, bits)
+        Masks.append(Mask)
+    return (int(w0), *Masks)
+
+def Fault_Bitsets(Faults, N):
+    """
+    This function encodes faults of the same number of bumps as bitsets over the N bumps of an interface, packed in uint64 words.
+
+    Parameters:
+    - Faults (np.ndarray): The indices of the bumps of each fault, one fault per row.
+    - N (int): Number of bumps of the interface.
+
+    Returns:
+    - np.ndarray: The bitset of each fault, one row of (N + 63) // 64 words per fault.
+    """
+    Bitsets = np.zeros((len(Faults), (N + 63) >> 6), dtype=np.uint64)
+    rows = np.arange(len(Faults))
+    for column in range(Faults.shape[1]):
+        words, bits = Bitset_Words(Faults[:, column])
+        Bitsets[rows, words] |= bits
+    return Bitsets
+
+def Bitset_Repairable(Model, Faults):
+    """
+    This function is the batched version of Chain_Capacity_Kernel, for faults of the same number of distinct bumps : each fault is encoded
+    as a bitset (see Fault_Bitsets), and for each repair chain affected by the faults, its lost connections are counted at once for every fault
+    by a bitwise AND with the mask of the chain and a popcount, and compared to its spares.
+
+    Parameters:
+    - Model (dict): The interface model (see Interface_Model).
+    - Faults (np.ndarray): The indices of the bumps of each fault, one fault per row.
+
+    Returns:
+    - np.ndarray: True for each fault that can be repaired.
+    """
+    Bitsets = Fault_Bitsets(Faults, len(Model['Names']))
+    Unrepairable = np.zeros(len(Faults), dtype=bool)
+    Chains = np.unique(Model['Classes']['Chain'][Faults])
+    for c in Chains[Chains >= 0].tolist():
+        w0, Member, Dead, First = Model['Chain_Masks'][c]
+        Words = Bitsets[:, w0:w0 + len(Member)]
+        Affected = (Words & First).any(axis=1)
+        Lost = np.bitwise_count(Words & Member).sum(axis=1, dtype=np.int64)
+        Unrepairable |= Affected & ((Lost > Model['Spares'][c]) | (Words & Dead).any(axis=1))
+    return ~Unrepairable
+
+def Model_Repair_Types(Model, Faults):
+    """
+    This function determines the reparability of a list of faults needing a repair action with an interface model, with the result of
+    Model_Repair_Type for each fault. The faults of the same number of distinct bumps are solved together by the bitset engine
+    (see Bitset_Repairable), by blocks of at most Bitset_Batch_Bytes of bitsets, the other faults one by one.
+
+    Parameters:
+    - Model (dict): The interface model (see Interface_Model).
+    - Faults (list): The indices of the bumps of each fault.
+
+    Returns:
+    - list: 'Repairable' or 'Unrepairable' for each fault.
+    """
+    if Model['Bundle_Flag']:
+        return [Model_Repair_Type(Model, index_list, set()) for index_list in Faults]
+
+    Repair_Types = [None] * len(Faults)
+    Lengths = defaultdict(list)
+    for position, index_list in enumerate(Faults):
+        if len(set(index_list)) == len(index_list):
+            Lengths[len(index_list)].append(position)
+        else:
+            # A bump counted twice in a fault, see the FIXME of Fault_Enumerator
+            Chain_list = {Model['Classes']['Chain_Names'][c] for c in Model['Classes']['Chain'][list(index_list)].tolist() if c >= 0}
+            Repair_Types[position] = Model_Repair_Type(Model, index_list, Chain_list)
+
+    Block = max(1, Bitset_Batch_Bytes // (8 * ((len(Model['Names']) + 63) >> 6)))
+    for Positions in Lengths.values():
+        Profile_Count('LogicSolver calls', len(Positions))
+        for start in range(0, len(Positions), Block):
+            Block_Positions = Positions[start:start + Block]
+            Repairable = Bitset_Repairable(Model, np.array([Faults[position] for position in Block_Positions], dtype=np.int64).reshape(len(Block_Positions), -1))
+            for position, repairable in zip(Block_Positions, Repairable.tolist()):
+                Repair_Types[position] = 'Repairable' if repairable else 'Unrepairable'
+    return Repair_Types
+
+# Section 4 : Reparability Statistics
+def Coordinate_Columns(columns):
+    """
+    This function gives the coordinates (X, Y, Z...) among the columns of a bump map, or the index of a bump, in their order.
+    """
+    return [column for column in columns if column.upper() in ['X', 'Y', 'Z']]
+
+def Bump_Points(df_bump):
+    """
+    This function gives the coordinates of the bumps (see Coordinate_Columns), one row per bump in the order of df_bump.
+    """
+    return df_bump[Coordinate_Columns(df_bump.columns)].to_numpy(dtype=float)
+
+def Moved_Bump_Shorts(points, Moved, Faults, Shorted_Bumps_Number, Short_Distance):
+    """
+    This function adds to a set of single shorts the shorts containing a moved bump, searched among the bumps within reach of it.
+
+    Parameters:
+    - points (np.ndarray): Coordinates of the bumps (see Bump_Points).
+    - Moved (iterable): Indices of the moved bumps.
+    - Faults (set): Shorts, as sorted tuples of indices, completed in place.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    """
+    for anchor in Moved:
+        distances = np.sqrt(((points - points[anchor])**2).sum(axis=1))
+        neighbours = [index for index in np.flatnonzero(distances <= (Shorted_Bumps_Number - 1) * Short_Distance).tolist() if index != anchor]
+        for others in combinations(neighbours, Shorted_Bumps_Number - 1):
+            index_list = tuple(sorted((anchor,) + others))
+            if index_list not in Faults and Short_Kernel(points, np.array(index_list, dtype=np.int64), Short_Distance):
+                Faults.add(index_list)
+
+def euclidean_distance(point1, point2):
+
+    """
+    Calculate the Euclidean distance between two bumps.
+    
+    Args:
+        point1: First point with coordinates accessible via dictionary-like access (e.g., point1['X'], point1['Y'])
+        point2: Second point with coordinates accessible via dictionary-like access
+    
+    Returns:
+        float: Euclidean distance between the bumps
+    """
+    # Assumes both bumps have the same dimensions
+    coords = [col for col in Coordinate_Columns(point1.index) if col in point2.index]
+    
+    # Calculate sum of squared differences for each coordinate
+    sum_squared_diff = sum((point1[coord] - point2[coord])**2 for coord in coords)
+    
+    # Return the square root of the sum
+    return np.sqrt(sum_squared_diff)
+
+def is_short(bumps, threshold):
+    """
+    Determine if a set of bumps forms a short.
+    A short is defined as:
+    1. Each point is connected to at least one other point (distance < threshold)
+    2. All bumps form a single connected component (can reach any point from any other)
+    
+    Args:
+        bumps: List of bumps, where each point is a pandas Series or similar with X, Y, etc. coordinates
+        threshold: Maximum distance for two bumps to be considered connected
+    
+    Returns:
+        bool: True if bumps form a short, False otherwise
+    """
+
+    # The connected component is searched by Short_Kernel
+    if len(bumps) == 0:
+        return False
+    coords = Coordinate_Columns(bumps[0].index)
+    points = np.array([[bump[coord] for coord in coords] for bump in bumps], dtype=float)
+    return bool(Short_Kernel(points, np.arange(len(bumps), dtype=np.int64), threshold))
+
+def Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Progress=False, Start=0, With_Position=False):
+    """
+    This function enumerates every fault of the fault model, in the order used by the Fault_Table.
+    The candidate combinations are generated as they are tested, without building the list of the combinations of bumps.
+    For shorts, the candidates of each anchor are taken in its pool of neighbours (see Fault_Space_Anchors), and only the
+    combinations of bumps forming a short within Short_Distance are kept (see is_short).
+    With Progress, the candidate combinations tested are reported by the progress reports, the caller adding
+    the type of each fault to the tallies.
+    The enumeration can start after the first Start candidate combinations, which are skipped without being tested,
+    to resume an enumeration from a checkpoint.
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Progress (bool): Flag to report the progress of the enumeration.
+    - Start (int): Number of candidate combinations skipped.
+    - With_Position (bool): Flag to also yield the position of the enumeration.
+
+    Yields:
+    - list: The indices (positions in df_bump) of the bumps affected by each fault.
+      With With_Position, the tuple (position, indices), position being the number of candidate combinations
+      consumed so far, ie the Start of an enumeration resumed after this fault.
+    """
+    N = len(df_bump)
+
+    # Check if n_bumps is valid
+    if Shorted_Bumps_Number < 1 or Shorted_Bumps_Number > N:
+        raise ValueError(f"Shorted_Bumps_Number must be between 1 and {N}")
+    
+    # Set the number of bumps that will be affected by the fault.  
+    if Fault_Type == 'Open':
+        Bumps_Number = 1
+
+    if Fault_Type == 'Short':
+        Bumps_Number = Shorted_Bumps_Number
+        # The coordinates of the bumps, for the short filter (see Short_Kernel), and the neighbours of each anchor
+        points = Bump_Points(df_bump)
+        pools, _ = Fault_Space_Anchors(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type)
+        sizes = [Anchor_Combinations_Number(len(pool), Bumps_Number, Faults_Number) for pool in pools]
+
+    def Anchor_Candidates(anchor, pool):
+        # The combinations of combinations containing the anchor, in lexicographic order : their first combination starts with the anchor
+        if Faults_Number == 1:
+            return (((anchor,) + others,) for others in combinations(pool, Bumps_Number - 1))
+        Members = list(combinations([anchor] + list(pool), Bumps_Number))
+        return ((Members[i],) + others for i in range(comb(len(pool), Bumps_Number - 1)) for others in combinations(Members[i + 1:], Faults_Number - 1))
+
+    def Candidates():
+        # Each candidate combination after the first Start ones
+        if Fault_Type == 'Open':
+            yield from (list(index_list) for index_list in islice(combinations(range(N), Faults_Number), Start, None))
+            return
+        Skipped = Start
+        for anchor, pool in enumerate(pools):
+            if Skipped >= sizes[anchor]:
+                Skipped -= sizes[anchor]
+                continue
+            for combo_of_combo in islice(Anchor_Candidates(anchor, pool), Skipped, None):
+                # FIXME : Does not work for scenarios with multiple short faults. The code puts the indices of each connection in the same list.
+                # A double short with two connections will be treated as a short with 4 connections.
+                # Furthermore, in two different short (happening at the same time): the same connection may appear twice.
+                yield [index for combo_index in combo_of_combo for index in combo_index]
+            Skipped = 0
+
+    # Candidate combinations generated versus accepted, added to the instrumentation once the enumeration ends
+    Candidate_combinations = 0
+    Accepted_combinations = 0
+    if Progress:
+        Progress_Start('Fault enumeration', comb(N, Faults_Number) if Fault_Type == 'Open' else sum(sizes), Done=Start)
+
+    try:
+        # Test each combination
+        for index_list in Candidates():
+
+            Candidate_combinations += 1
+            # The progress is updated by batches of candidates, the short filter being much faster than a report
+            if Progress and Candidate_combinations % 4096 == 0:
+                Progress_Update(Done=4096)
+
+            # If the fault type is 'Short', check if the bumps form a valid short
+            if Fault_Type == 'Short' and not Short_Kernel(points, np.array(index_list, dtype=np.int64), Short_Distance):
+                continue
+
+            Accepted_combinations += 1
+            yield (Start + Candidate_combinations, index_list) if With_Position else index_list
+    finally:
+        Profile_Count('Candidate combinations', Candidate_combinations)
+        Profile_Count('Accepted combinations', Accepted_combinations)
+        if Progress:
+            Progress_Update(Done=Candidate_combinations % 4096)
+            Progress_End()
+
+# Define the type of each connection regarding the reparability
+Fault_Reparation = {
+    'POWER': 'Benign',
+    'GND': 'Benign',
+    'DATA': 'Repair',
+    'CLK': 'Repair',
+    'ADDR': 'Repair',
+    'SIDEBAND': 'Repair',
+    'SPARE': 'Benign',
+    'NONE': 'Benign'}
+
+# Bits of the class of a bump (see Bump_Fault_Classes), and classes of a fault (see Classify_Faults)
+Bump_Class_Bits = {'Repair': 1, 'POWER': 2, 'GND': 4}
+Fault_Classes = ['Benign', 'Repair', 'Catastrophic']
+# Number of faults classified or solved together by Fault_Table_Generator and Repair_Statistics_using_LogicSolver
+Fault_Batch_Size = 65536
+# Maximum size of the fault bitsets solved together by Model_Repair_Types
+Bitset_Batch_Bytes = 1 << 26
+
+def Bump_Fault_Classes(df_bump, Route_Table):
+    """
+    This function computes once per interface what the classification of a fault needs to know about each bump, so that
+    any fault can be classified by indexing arrays (see Classify_Faults) instead of querying the route table for each bump of each fault.
+    The class of a bump is an integer made of the bits of Bump_Class_Bits : 'Repair' if the bump needs a repair action
+    (a spare is a 'SPARE', a bump without default route that is not DATA is a 'NONE', HBM2 Mode 1 DBI specifics, then see Fault_Reparation),
+    'POWER' and 'GND' for the type of the bump in the bump map.
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+
+    Returns:
+    - dict: 'Names' (the names of the bumps), 'Class' (the class of each bump), 'Chain' (the index in 'Chain_Names' of the
+      repair chain of the first route to each bump, -1 without route) and 'Chain_Names' (the repair chains, in the order of the route table).
+    """
+    Types = df_bump['Type'].to_numpy(dtype=object)
+    Default_Connections = set(Route_Table.loc[Route_Table['Status'] == 'Default', 'Connection'])
+    Bump_Class = np.where(df_bump['Spare'] == True, 'SPARE',
+                 np.where(~df_bump['Name'].isin(Default_Connections) & (Types != 'DATA'), 'NONE', Types))
+    Class = (np.array([Fault_Reparation[Class] == 'Repair' for Class in Bump_Class], dtype=np.int8) * Bump_Class_Bits['Repair']
+             | (Types == 'POWER').astype(np.int8) * Bump_Class_Bits['POWER']
+             | (Types == 'GND').astype(np.int8) * Bump_Class_Bits['GND'])
+
+    Chain_Names = list(dict.fromkeys(Route_Table['RepairChain']))
+    Chain_Index = {RepairChain: index for index, RepairChain in enumerate(Chain_Names)}
+    First_Chain = Route_Table.drop_duplicates('Connection').set_index('Connection')['RepairChain'].to_dict()
+    Chain = np.array([Chain_Index[First_Chain[name]] if name in First_Chain else -1 for name in df_bump['Name']], dtype=np.int32)
+
+    return {'Names': df_bump['Name'].tolist(), 'Class': Class, 'Chain': Chain, 'Chain_Names': Chain_Names}
+
+def Classify_Faults(Classes, Faults, Fault_Type):
+    """
+    This function classifies a batch of faults of the same number of bumps, with the classes of the bumps of the interface (see Bump_Fault_Classes),
+    with the result of Fault_Classification : the bumps are checked in the order of the fault, a short of a POWER and a GND connection being
+    Catastrophic unless its last bump needs a repair action, and a fault affecting a bump needing a repair action being 'Repair'.
+
+    Parameters:
+    - Classes (dict): The classes of the bumps of the interface.
+    - Faults (np.ndarray): The indices of the bumps of each fault, one fault per row.
+    - Fault_Type (str): 'Short' or 'Open'.
+
+    Returns:
+    - np.ndarray: The class of each fault, as an index in Fault_Classes.
+    """
+    Faults = np.asarray(Faults, dtype=np.intp).reshape(len(Faults), -1)
+    Fault_Class = np.zeros(len(Faults), dtype=np.int8)
+    if Faults.size == 0:
+        return Fault_Class
+
+    Bits = Classes['Class'][Faults]
+    Repair = (Bits & Bump_Class_Bits['Repair']) != 0
+    Fault_Class[Repair.any(axis=1)] = Fault_Classes.index('Repair')
+    if Fault_Type == 'Short':
+        Power_and_GND = Bump_Class_Bits['POWER'] | Bump_Class_Bits['GND']
+        Catastrophic = (np.bitwise_or.reduce(Bits, axis=1) & Power_and_GND) == Power_and_GND
+        Fault_Class[Catastrophic & ~Repair[:, -1]] = Fault_Classes.index('Catastrophic')
+    return Fault_Class
+
+def Classify_Fault_Rows(Classes, Faults, Fault_Type):
+    """
+    This function classifies a list of faults with the classes of the bumps of the interface (see Bump_Fault_Classes),
+    the faults of the same number of bumps being classified together (see Classify_Faults).
+
+    Parameters:
+    - Classes (dict): The classes of the bumps of the interface.
+    - Faults (list): The indices of the bumps of each fault.
+    - Fault_Type (str): 'Short' or 'Open'.
+
+    Returns:
+    - list: [fault, Repair_Type, Chain_list] for each fault, as returned by Fault_Classification.
+    """
+    Repair_Types = [None] * len(Faults)
+    Lengths = defaultdict(list)
+    for position, index_list in enumerate(Faults):
+        Lengths[len(index_list)].append(position)
+    for Positions in Lengths.values():
+        for position, Fault_Class in zip(Positions, Classify_Faults(Classes, [Faults[position] for position in Positions], Fault_Type).tolist()):
+            Repair_Types[position] = Fault_Classes[Fault_Class]
+
+    Names = Classes['Names']
+    Chain = Classes['Chain']
+    Chain_Names = Classes['Chain_Names']
+    return [[[Names[i] for i in index_list], Repair_Type, {Chain_Names[c] for c in Chain[list(index_list)].tolist() if c >= 0}]
+            for index_list, Repair_Type in zip(Faults, Repair_Types)]
+
+def Classify_Fault(Classes, index_list, Fault_Type):
+    """
+    This function classifies a single fault with the classes of the bumps of the interface (see Classify_Fault_Rows).
+
+    Returns:
+    - list: [fault, Repair_Type, Chain_list], as returned by Fault_Classification.
+    """
+    return Classify_Fault_Rows(Classes, [index_list], Fault_Type)[0]
+
+def Model_Fault_Types(Model, Faults, Fault_Type):
+    """
+    This function classifies and solves a list of faults with an interface model (see Interface_Model), with the same result as Fault_Classification
+    followed by LogicSolver, or as Bundle_Fault_Class followed by BundleSolver in the bundle mode.
+
+    Parameters:
+    - Model (dict): The interface model.
+    - Faults (list): The indices of the bumps of each fault, in the order of the fault.
+    - Fault_Type (str): 'Short' or 'Open'.
+
+    Returns:
+    - list: (Fault_Class, Repair_Type, Chain_list) for each fault, the type of the fault before and after the solver, and the set of affected repair chains.
+    """
+    if Model['Bundle_Flag']:
+        Rows = [[index_list, Bundle_Fault_Class([Model['Types'][i] for i in index_list], Fault_Type), set()] for index_list in Faults]
+    else:
+        Rows = [[index_list, Fault_Class, Chain_list] for index_list, (fault, Fault_Class, Chain_list) in zip(Faults, Classify_Fault_Rows(Model['Classes'], Faults, Fault_Type))]
+
+    # The faults needing a repair action are solved together
+    Repair_Positions = [position for position, (index_list, Fault_Class, Chain_list) in enumerate(Rows) if Fault_Class == 'Repair']
+    Repair_Types = [Fault_Class for index_list, Fault_Class, Chain_list in Rows]
+    for position, Repair_Type in zip(Repair_Positions, Model_Repair_Types(Model, [Rows[position][0] for position in Repair_Positions])):
+        Repair_Types[position] = Repair_Type
+    return [(Fault_Class, Repair_Type, Chain_list) for (index_list, Fault_Class, Chain_list), Repair_Type in zip(Rows, Repair_Types)]
+
+def Fault_Classification(combo_bumps, Route_Table, Fault_Type):
+    """
+    This function classifies a fault before any solver is called.
+    A fault is Catastrophic if it shorts a POWER and a GND connection, it needs a repair action ('Repair')
+    if it affects a functional connection, otherwise it is Benign.
+    The analyses classify their faults with the classes of the bumps computed once (see Bump_Fault_Classes), this function
+    classifies a single fault given by its bumps.
+
+    Parameters:
+    - combo_bumps (list): The bumps affected by the fault, as pandas Series.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+    - Fault_Type (str): 'Short' or 'Open'.
+
+    Returns:
+    - list: [fault, Repair_Type, Chain_list], the names of the affected bumps, the type of the fault and the set of affected repair chains.
+    """
+    Classes = Bump_Fault_Classes(pd.DataFrame(combo_bumps), Route_Table)
+    return Classify_Fault(Classes, list(range(len(combo_bumps))), Fault_Type)
+
+def Fault_Table_Generator(Interface_IRL_file_name, BumpMap_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name, Reuse=False):
+    """
+    This function generates the Fault_Table of an interface: every fault of the fault model (see Fault_Enumerator)
+    with its classification (see Fault_Classification). The table is saved to a CSV file.
+    With Reuse, the Fault_Table already written for the same interface and fault model is read instead (see Reusable_Table),
+    and the fingerprint of a computed table is written with it (see Write_Table_Fingerprint).
+
+    Returns:
+    - pd.DataFrame: The Fault_Table, with the columns 'Fault', 'Repair_Type' and 'Chain_list'.
+    """
+    Fingerprint = Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance)
+    if Reuse and Reusable_Table(Fault_Table_file_name, Fingerprint):
+        print(f'Reusing the Fault_Table {Fault_Table_file_name}')
+        with Profile_Stage('Reading tables'):
+            return Read_Fault_Table(Fault_Table_file_name)
+
+    # Get the IRL and Bumpmap file 
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+
+    # Classify every fault and build the table, by batches of faults
+    # The enumeration time is the time of this stage minus the time of the 'Fault classification' stage
+    rows = []
+    with Profile_Stage('Fault enumeration and classification'):
+        Classes = Bump_Fault_Classes(df_bump, Route_Table)
+        Faults = Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Progress=True)
+        while Batch := list(islice(Faults, Fault_Batch_Size)):
+            with Profile_Stage('Fault classification'):
+                Batch_rows = Classify_Fault_Rows(Classes, Batch, Fault_Type)
+            rows.extend(Batch_rows)
+            Progress_Update(Done=0, Tallies=Counter(Repair_Type for fault, Repair_Type, Chain_list in Batch_rows))
+
+    Fault_Table = pd.DataFrame(rows, columns=['Fault', 'Repair_Type', 'Chain_list'])
+    with Profile_Stage('Writing tables'):
+        Fault_Table.to_csv(Fault_Table_file_name, index=True)
+        if Reuse:
+            Write_Table_Fingerprint(Fault_Table_file_name, Fingerprint)
+
+    return Fault_Table
+            
+def Checkpointed_Fault_Analysis(BumpMap_file_name, Interface_IRL_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type,
+                                Fault_Table_file_name, Output_Table_file_name, Solver, Checkpoint_file_name, Checkpoint_Interval, Resume, Print_Fault, Solution_Encoding='Full',
+                                Intern_Solutions=False, Solution_Dictionary_file_name=None, Solution_Cache_Size=100000, Reuse=False):
+    """
+    This function enumerates, classifies and solves every fault in a single pass, and writes the Fault_Table and the
+    Repair_Table (or Repair_Solutions_Table) to disk as it goes, so that a long run can be resumed after being killed.
+    Every Checkpoint_Interval seconds, the rows analyzed are appended to the tables and a checkpoint is written, recording
+    the position of the enumeration, the number of rows written and the statistics. A checkpoint is also written when the
+    run is interrupted (Ctrl+C or SIGTERM, as sent by a batch scheduler before preempting a job), once the fault being
+    analyzed is done, and KeyboardInterrupt is then raised to the caller.
+    With Resume, the tables are truncated to the rows of the checkpoint and the enumeration restarts at its position,
+    giving the same tables and statistics as an uninterrupted run.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Fault_Table_file_name (str): Path to the Fault_Table CSV file.
+    - Output_Table_file_name (str): Path to the Repair_Table or Repair_Solutions_Table CSV file.
+    - Solver (str): 'LogicSolver' for the Repair_Table, 'RecursiveSolver' for the Repair_Solutions_Table.
+    - Checkpoint_file_name (str): Path to the JSON checkpoint file, the name of the solver is added to it.
+    - Checkpoint_Interval (float): Time between two checkpoints, in seconds, 0 to only write the checkpoint at the end of the run or when it is interrupted.
+    - Resume (bool): Flag to resume the run from the checkpoint.
+    - Print_Fault (bool): Flag to print each fault.
+    - Solution_Encoding (str): 'Full' or 'Delta', the encoding of the repair solutions (see Repair_Solutions_using_RecursiveSolver).
+    - Intern_Solutions (bool): Flag to replace the repair solutions by their IDs, the solution dictionary being written with the tables.
+    - Solution_Dictionary_file_name (str): Path to the solution dictionary CSV file.
+    - Solution_Cache_Size (int): Maximum number of solutions of repair chains cached (see New_Solution_Cache).
+    - Reuse (bool): Flag to write the fingerprints of the complete tables, to reuse them in a later run (see Reusable_Table).
+
+    Returns:
+    - tuple: (Output_Table, Statistics), the Repair_Table or Repair_Solutions_Table read back from its file, and the
+      number of faults of each repair type.
+    """
+    # Each solver has its own checkpoint, so the statistics and the solutions can be checkpointed in the same run
+    root, extension = os.path.splitext(Checkpoint_file_name)
+    Checkpoint_file_name = f'{root}_{Solver}{extension}'
+
+    # The parameters of the run, a checkpoint can only be resumed by the same run
+    Parameters = {'BumpMap_file_name': BumpMap_file_name, 'IRL_file_name': Interface_IRL_file_name, 'Faults_Number': Faults_Number,
+                  'Shorted_Bumps_Number': Shorted_Bumps_Number, 'Short_Distance': Short_Distance, 'Fault_Type': Fault_Type,
+                  'Fault_Table_file_name': Fault_Table_file_name, 'Output_Table_file_name': Output_Table_file_name, 'Solver': Solver}
+    if Fault_Type == 'Short':
+        # The positions of the enumeration count the candidates of the pools of neighbours (see Fault_Enumerator)
+        Parameters['Enumeration'] = 'Anchors'
+    if Solver == 'RecursiveSolver':
+        Parameters['Solution_Encoding'] = Solution_Encoding
+        Parameters['Intern_Solutions'] = Intern_Solutions
+    Fault_columns = ['Fault', 'Repair_Type', 'Chain_list']
+    Output_columns = Fault_columns + (['Repair_Solutions'] if Solver == 'RecursiveSolver' else [])
+
+    Position = 0
+    Rows_written = 0
+    Statistics = {'Repairable': 0, 'Benign': 0, 'Catastrophic': 0, 'Unrepairable': 0}
+
+    if Resume and os.path.exists(Checkpoint_file_name):
+        with open(Checkpoint_file_name, 'r') as file:
+            Checkpoint = json.load(file)
+        if Checkpoint['Parameters'] != Parameters:
+            raise ValueError(f'The checkpoint {Checkpoint_file_name} was written by another run : {Checkpoint["Parameters"]}')
+        Position = Checkpoint['Position']
+        Rows_written = Checkpoint['Rows']
+        Statistics = Checkpoint['Statistics']
+
+        if Checkpoint['Completed']:
+            print(f'The run of the checkpoint {Checkpoint_file_name} is already completed')
+            return Read_Fault_Table(Output_Table_file_name), Statistics
+
+        # Rows appended after the checkpoint are removed, they will be analyzed again
+        for file_name in [Fault_Table_file_name, Output_Table_file_name]:
+            with open(file_name, 'r+') as file:
+                lines = file.readlines()[:Rows_written + 1]
+                file.seek(0)
+                file.writelines(lines)
+                file.truncate()
+        print(f'Resuming from {Checkpoint_file_name} : {Rows_written} faults already analyzed')
+    elif Resume:
+        print(f'Warning : no checkpoint {Checkpoint_file_name}, starting from the beginning.')
+
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Model = Interface_Model(df_bump, Route_Table)
+    Classes = Model['Classes']
+    Configurations = Default_Configurations(Route_Table) if Solution_Encoding == 'Delta' else None
+    Solution_Cache = New_Solution_Cache(Solution_Cache_Size)
+    # The solution dictionary of a resumed run already holds the solutions of the rows kept
+    Solution_Dictionary = {}
+    if Intern_Solutions and Rows_written and os.path.exists(Solution_Dictionary_file_name):
+        Solution_Dictionary = Read_Solution_Dictionary(Solution_Dictionary_file_name)
+
+    Fault_rows = []
+    Output_rows = []
+
+    def Write_Checkpoint(Completed):
+        nonlocal Rows_written
+        # The rows are appended to the tables before the checkpoint is written, the checkpoint never counts missing rows
+        with Profile_Stage('Writing tables'):
+            index = range(Rows_written, Rows_written + len(Fault_rows))
+            pd.DataFrame(Fault_rows, columns=Fault_columns, index=index).to_csv(Fault_Table_file_name, mode='a' if Rows_written else 'w', header=not Rows_written)
+            pd.DataFrame(Output_rows, columns=Output_columns, index=index).to_csv(Output_Table_file_name, mode='a' if Rows_written else 'w', header=not Rows_written)
+            if Intern_Solutions:
+                Write_Solution_Dictionary(Solution_Dictionary, Solution_Dictionary_file_name)
+        Rows_written += len(Fault_rows)
+        Fault_rows.clear()
+        Output_rows.clear()
+
+        # The checkpoint is replaced atomically, a crash while writing it leaves the previous one
+        with open(Checkpoint_file_name + '.tmp', 'w') as file:
+            json.dump({'Parameters': Parameters, 'Position': Position, 'Rows': Rows_written, 'Statistics': Statistics, 'Completed': Completed}, file, indent=1)
+        os.replace(Checkpoint_file_name + '.tmp', Checkpoint_file_name)
+
+    # Ctrl+C and a preemption (SIGTERM) stop the analysis once the current fault is done, so the last checkpoint is consistent
+    Interrupted = []
+    previous_handlers = {}
+    for signal_number in [signal.SIGINT, signal.SIGTERM]:
+        try:
+            previous_handlers[signal_number] = signal.signal(signal_number, lambda signum, frame: Interrupted.append(signum))
+        except ValueError:
+            # Signals can only be handled by the main thread
+            pass
+
+    last_checkpoint = time.perf_counter()
+    Completed = False
+    try:
+        for Fault_position, index_list in Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type,
+                                                           Progress=True, Start=Position, With_Position=True):
+            with Profile_Stage('Fault classification'):
+                fault, Repair_Type, Chain_list = Classify_Fault(Classes, index_list, Fault_Type)
+            Fault_row = [fault, Repair_Type, Chain_list]
+
+            if Print_Fault:
+                print(fault)
+
+            # Solve the faults that need a repair action
+            Repair_Solution = None
+            if Repair_Type == 'Repair':
+                with Profile_Stage(Solver):
+                    if Solver == 'LogicSolver':
+                        Repair_Type = Model_Repair_Type(Model, index_list, Chain_list)
+                    else:
+                        Repair_Type, Repair_Solution = Repair_Solution_of_Fault(fault, Route_Table, df_bump, Configurations, Solution_Cache)
+                        if Intern_Solutions:
+                            Repair_Solution = Intern_Repair_Solution(Repair_Solution, Solution_Dictionary)
+
+            # The fault is recorded once it is fully analyzed
+            Fault_rows.append(Fault_row)
+            Output_rows.append([fault, Repair_Type, Chain_list] + ([Repair_Solution] if Solver == 'RecursiveSolver' else []))
+            Statistics[Repair_Type] += 1
+            Position = Fault_position
+            Progress_Update(Repair_Type, Done=0)
+
+            if Interrupted:
+                break
+            # Without an interval (a resumed run for example), the checkpoint is only written at the end or on an interruption
+            if Checkpoint_Interval > 0 and time.perf_counter() - last_checkpoint >= Checkpoint_Interval:
+                Write_Checkpoint(False)
+                last_checkpoint = time.perf_counter()
+        else:
+            Completed = True
+    finally:
+        Write_Checkpoint(Completed)
+        for signal_number, previous_handler in previous_handlers.items():
+            signal.signal(signal_number, previous_handler)
+
+    if not Completed:
+        print(f'Interrupted, wrote the checkpoint {Checkpoint_file_name} : {Rows_written} faults analyzed. Add --Resume to continue.')
+        raise KeyboardInterrupt
+
+    # With Reuse, the complete tables can be reused by a later run (see Reusable_Table)
+    if Reuse:
+        Options = {'Solution_Encoding': Solution_Encoding, 'Intern_Solutions': Intern_Solutions} if Solver == 'RecursiveSolver' else {}
+        Write_Table_Fingerprint(Fault_Table_file_name, Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance))
+        Write_Table_Fingerprint(Output_Table_file_name, Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance, **Options),
+                                [Solution_Dictionary_file_name] if Intern_Solutions else [])
+
+    return Read_Fault_Table(Output_Table_file_name), Statistics
+
+def Print_Repair_Counts(Solver_name, Statistics, Total_fault):
+    """
+    This function prints the number of faults of each repair type and the reparability percentage, in the format of every analysis.
+
+    Parameters:
+    - Solver_name (str): The name printed before the statistics.
+    - Statistics (dict): The number of faults of each repair type.
+    - Total_fault (int): The total number of faults.
+
+    Returns:
+    - float: The reparability percentage, NaN without faults.
+    """
+    Reparability_percentage = (Statistics['Repairable'] + Statistics['Benign']) / Total_fault * 100 if Total_fault else float('nan')
+    print(f"{Solver_name} : Total faults : {Total_fault} , Repairable faults : {Statistics['Repairable']}, Benign faults :  {Statistics['Benign']}, Catastrophic faults : {Statistics['Catastrophic']}, Unrepairable faults : {Statistics['Unrepairable']}, {Reparability_percentage}%")
+    return Reparability_percentage
+
+def Print_Repair_Statistics(Solver_name, Repair_Table):
+    """
+    This function prints the number of faults of each repair type of a Repair_Table or Repair_Solutions_Table, and the reparability percentage.
+
+    Parameters:
+    - Solver_name (str): The name printed before the statistics.
+    - Repair_Table (pd.DataFrame): The table, with a 'Repair_Type' column.
+
+    Returns:
+    - float: The reparability percentage.
+    """
+    return Print_Repair_Counts(Solver_name, Counter(Repair_Table['Repair_Type']), len(Repair_Table))
+
+def Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, Faults_Number, Interface_IRL_file_name, Reparability_Table_file_name, Fault_Table_file_name, Print_Fault,
+                                        Checkpoint_Interval=0, Checkpoint_file_name=None, Resume=False, Reuse=False):
+    """
+    This function generates repair statistics using a logic solver.
+    It first generates a fault table using the Fault_Table_Generator function.
+    Then, it iterates over each fault in the fault table, determines the reparability of the fault using the LogicSolver function,
+    and updates the repair type in the fault table.
+    Finally, it calculates and prints the repair statistics and saves the repair table to a CSV file.
+    With Checkpoint_Interval or Resume, the analysis is checkpointed and can be resumed (see Checkpointed_Fault_Analysis).
+    With Reuse, the Repair_Table, or else the Fault_Table, already written for the same interface and fault model is read instead of being computed (see Reusable_Table).
+    """
+    Fingerprint = Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance)
+    if Reuse and Reusable_Table(Reparability_Table_file_name, Fingerprint):
+        print(f'Reusing the Repair_Table {Reparability_Table_file_name}')
+        with Profile_Stage('Reading tables'):
+            Repair_Table = Read_Fault_Table(Reparability_Table_file_name)
+        Print_Repair_Statistics('Repair Statistics using LogicSolver', Repair_Table)
+        return Repair_Table
+
+    if Checkpoint_Interval > 0 or Resume:
+        Repair_Table, Statistics = Checkpointed_Fault_Analysis(BumpMap_file_name, Interface_IRL_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type,
+                                                               Fault_Table_file_name, Reparability_Table_file_name, 'LogicSolver', Checkpoint_file_name, Checkpoint_Interval, Resume, Print_Fault,
+                                                               Reuse=Reuse)
+        Print_Repair_Counts('Repair Statistics using LogicSolver', Statistics, sum(Statistics.values()))
+        return Repair_Table
+
+    # Generate the fault table using the Fault_Table_Generator function
+    Fault_Table = Fault_Table_Generator(Interface_IRL_file_name, BumpMap_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name, Reuse)
+
+    # Load the route table and bumpmap 
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)  
+    # The lookups of LogicSolver are done once (see Interface_Model)
+    Model = Interface_Model(df_bump, Route_Table)
+    Index_of = {name: index for index, name in enumerate(Model['Names'])}
+
+    # Solve the faults of the fault table by batches, the faults needing a repair action being solved together (see Model_Repair_Types)
+    Progress_Start('LogicSolver', len(Fault_Table))
+    Repair_Types = Fault_Table['Repair_Type'].tolist()
+    with Profile_Stage('LogicSolver'):
+        for start in range(0, len(Fault_Table), Fault_Batch_Size):
+            Batch = range(start, min(start + Fault_Batch_Size, len(Fault_Table)))
+            if Print_Fault:
+                for position in Batch:
+                    print(Fault_Table['Fault'].iat[position])
+
+            # If the repair type is 'Repair', determine the reparability using the LogicSolver rule
+            Repair_Positions = [position for position in Batch if Repair_Types[position] == 'Repair']
+            Faults = [[Index_of[name] for name in Fault_Table['Fault'].iat[position]] for position in Repair_Positions]
+            for position, Repair_Type in zip(Repair_Positions, Model_Repair_Types(Model, Faults)):
+                Repair_Types[position] = Repair_Type
+            Progress_Update(Done=len(Batch), Tallies=Counter(Repair_Types[position] for position in Batch))
+    Progress_End()
+
+    # Update the repair type in the fault table
+    Fault_Table['Repair_Type'] = Repair_Types
+
+    # Create a copy of the fault table to use as the repair table
+    Repair_Table = Fault_Table.copy()
+
+    # Print the number of repairable, benign, catastrophic, and unrepairable faults, and the reparability percentage
+    Print_Repair_Statistics('Repair Statistics using LogicSolver', Repair_Table)
+
+    # Save the Repair_Table to a CSV file
+    with Profile_Stage('Writing tables'):
+        Repair_Table.to_csv(Reparability_Table_file_name, index=True)
+        if Reuse:
+            Write_Table_Fingerprint(Reparability_Table_file_name, Fingerprint)
+
+    # Return the Repair_Table DataFrame
+    return Repair_Table
+
+def Breakdown_Counts(Table, Groups, Repair_Codes):
+    """
+    This function adds a batch of faults to the counters of a breakdown : each fault is counted once in each group of its bumps.
+
+    Parameters:
+    - Table (np.ndarray): The counters, one row per group (the last one for the bumps without group) and one column per repair type.
+    - Groups (np.ndarray): The group of each bump of each fault, one fault per row (-1 without group).
+    - Repair_Codes (np.ndarray): The repair type of each fault, as a column of Table.
+    """
+    Groups = np.where(Groups < 0, len(Table) - 1, Groups)
+    Pairs = np.unique(np.arange(len(Groups))[:, None] * len(Table) + Groups)
+    np.add.at(Table, (Pairs % len(Table), Repair_Codes[Pairs // len(Table)]), 1)
+
+def Streamed_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                               Breakdown_file_name=None, Print_Fault=False):
+    """
+    This function computes the repair statistics of Repair_Statistics_using_LogicSolver without any fault table : the faults are streamed
+    from Fault_Enumerator by batches, classified (see Classify_Faults) and solved (see Model_Repair_Types), and only added to counters,
+    so that the memory does not depend on the number of faults and nothing is written per fault.
+    With Breakdown_file_name, the counters are also broken down per repair chain and per bump type (a fault being counted once in
+    each repair chain, as in its Chain_list, and once for each type of its bumps) and written to this CSV file.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Breakdown_file_name (str): Path to the CSV file of the breakdown, or None.
+    - Print_Fault (bool): Flag to print every fault.
+
+    Returns:
+    - dict: The number of faults of each repair type, and the total.
+    """
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Model = Interface_Model(df_bump, Route_Table)
+    Classes = Model['Classes']
+
+    # Counters of the repair types, and of the breakdown per repair chain (the last row for the bumps without repair chain) and per bump type
+    Repair_Types = ['Repairable', 'Benign', 'Catastrophic', 'Unrepairable']
+    Codes = {Repair_Type: code for code, Repair_Type in enumerate(Repair_Types)}
+    Class_Codes = np.array([Codes.get(Fault_Class, -1) for Fault_Class in Fault_Classes], dtype=np.int64)
+    Counts = np.zeros(len(Repair_Types), dtype=np.int64)
+    Type_Names = list(dict.fromkeys(Model['Types']))
+    Bump_Type = np.array([Type_Names.index(Type) for Type in Model['Types']], dtype=np.int64)
+    Chain_Table = np.zeros((len(Classes['Chain_Names']) + 1, len(Repair_Types)), dtype=np.int64)
+    Type_Table = np.zeros((len(Type_Names) + 1, len(Repair_Types)), dtype=np.int64)
+
+    with Profile_Stage('Fault enumeration and classification'):
+        Faults = Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Progress=True)
+        while Batch := list(islice(Faults, Fault_Batch_Size)):
+            if Print_Fault:
+                for index_list in Batch:
+                    print([Classes['Names'][i] for i in index_list])
+            Batch = np.array(Batch, dtype=np.int64).reshape(len(Batch), -1)
+
+            with Profile_Stage('Fault classification'):
+                Repair_Codes = Class_Codes[Classify_Faults(Classes, Batch, Fault_Type)]
+            with Profile_Stage('LogicSolver'):
+                Repair = np.flatnonzero(Repair_Codes < 0)
+                Repair_Codes[Repair] = [Codes[Repair_Type] for Repair_Type in Model_Repair_Types(Model, Batch[Repair].tolist())]
+
+            Batch_Counts = np.bincount(Repair_Codes, minlength=len(Repair_Types))
+            Counts += Batch_Counts
+            if Breakdown_file_name is not None:
+                Breakdown_Counts(Chain_Table, Classes['Chain'][Batch], Repair_Codes)
+                Breakdown_Counts(Type_Table, Bump_Type[Batch], Repair_Codes)
+            Progress_Update(Done=0, Tallies=dict(zip(Repair_Types, Batch_Counts.tolist())))
+
+    Statistics = {'Total': int(Counts.sum()), **dict(zip(Repair_Types, Counts.tolist()))}
+    Print_Repair_Counts('Repair Statistics using LogicSolver', Statistics, Statistics['Total'])
+
+    if Breakdown_file_name is not None:
+        Rows = []
+        for Group, Names, Table in [('RepairChain', Classes['Chain_Names'] + ['None'], Chain_Table), ('Type', Type_Names, Type_Table)]:
+            for Name, Row in zip(Names, Table.tolist()):
+                if sum(Row) > 0:
+                    Rows.append({'Group': Group, 'Name': Name, 'Total': sum(Row), **dict(zip(Repair_Types, Row))})
+        with Profile_Stage('Writing tables'):
+            pd.DataFrame(Rows, columns=['Group', 'Name', 'Total'] + Repair_Types).to_csv(Breakdown_file_name, index=False)
+
+    return Statistics
+
+def Short_Threshold(points):
+    """
+    This function returns the smallest Short_Distance above which a set of bumps forms a short (see is_short) : the longest edge of
+    the minimum spanning tree of the bumps, as the bumps are connected by the distances below the threshold once this edge is.
+
+    Parameters:
+    - points (np.ndarray): Coordinates of the bumps, one row per bump.
+
+    Returns:
+    - float: The set of bumps is a short for every Short_Distance strictly above this value (0 for a single bump).
+    """
+    # Prim's algorithm, the sets of bumps being small
+    n = len(points)
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True
+    best = np.sqrt(((points - points[0])**2).sum(axis=1))
+    Threshold = 0.0
+    for _ in range(n - 1):
+        candidates = np.where(in_tree, np.inf, best)
+        nearest = int(np.argmin(candidates))
+        Threshold = max(Threshold, float(candidates[nearest]))
+        in_tree[nearest] = True
+        best = np.minimum(best, np.sqrt(((points - points[nearest])**2).sum(axis=1)))
+    return Threshold
+
+def Short_Distance_Sweep_Statistics(BumpMap_file_name, Interface_IRL_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distances,
+                                    Reparability_Table_file_name, Fault_Table_file_name, Sweep_file_name, Print_Fault):
+    """
+    This function computes the repair statistics of the shorts for several Short_Distance values in a single pass.
+    The shorts of a Short_Distance are also shorts of every larger one, so the shorts are enumerated once, for the largest distance, and each short
+    is classified and solved once. Its admission threshold (see Short_Threshold) gives the distances for which it is a short : the shorts of each
+    distance are the ones admitted below it, as the threshold rises. 
+    The Fault_Table and Repair_Table of each distance are the ones of Repair_Statistics_using_LogicSolver, their file names being suffixed with the distance,
+    and the reparability versus distance curve is saved to Sweep_file_name.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distances (list): The Short_Distance values, in µm.
+    - Reparability_Table_file_name (str): Path to the Repair_Table CSV file, suffixed with each distance.
+    - Fault_Table_file_name (str): Path to the Fault_Table CSV file, suffixed with each distance.
+    - Sweep_file_name (str): Path to the CSV file of the reparability versus distance curve.
+    - Print_Fault (bool): Flag to print each fault.
+
+    Returns:
+    - pd.DataFrame: The reparability versus distance curve, one row per distance.
+    """
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Model = Interface_Model(df_bump, Route_Table)
+    Classes = Model['Classes']
+    points = Bump_Points(df_bump)
+    Short_Distances = sorted(Short_Distances)
+
+    # Every short of the largest distance, with its admission threshold, classification and repair type
+    rows = []
+    with Profile_Stage('Fault enumeration and classification'):
+        for index_list in Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distances[-1], 'Short', Progress=True):
+            Threshold = Short_Threshold(points[index_list])
+            with Profile_Stage('Fault classification'):
+                fault, Fault_Class, Chain_list = Classify_Fault(Classes, index_list, 'Short')
+            if Print_Fault:
+                print(fault)
+            Repair_Type = Fault_Class
+            if Repair_Type == 'Repair':
+                with Profile_Stage('LogicSolver'):
+                    Repair_Type = Model_Repair_Type(Model, index_list, Chain_list)
+            rows.append([Threshold, fault, Fault_Class, Repair_Type, Chain_list])
+            Progress_Update(Repair_Type, Done=0)
+
+    Curve = []
+    Fault_root, Fault_extension = os.path.splitext(Fault_Table_file_name)
+    Repair_root, Repair_extension = os.path.splitext(Reparability_Table_file_name)
+    for Short_Distance in Short_Distances:
+        # The shorts admitted below the distance, in the order of the enumeration
+        Admitted = [row for row in rows if row[0] < Short_Distance]
+        Fault_Table = pd.DataFrame([[fault, Fault_Class, Chain_list] for Threshold, fault, Fault_Class, Repair_Type, Chain_list in Admitted], columns=['Fault', 'Repair_Type', 'Chain_list'])
+        Repair_Table = pd.DataFrame([[fault, Repair_Type, Chain_list] for Threshold, fault, Fault_Class, Repair_Type, Chain_list in Admitted], columns=['Fault', 'Repair_Type', 'Chain_list'])
+        with Profile_Stage('Writing tables'):
+            Fault_Table.to_csv(f'{Fault_root}_{Short_Distance:g}{Fault_extension}', index=True)
+            Repair_Table.to_csv(f'{Repair_root}_{Short_Distance:g}{Repair_extension}', index=True)
+
+        Counts = Repair_Table['Repair_Type'].value_counts()
+        Statistics = {Type: int(Counts.get(Type, 0)) for Type in ['Repairable', 'Benign', 'Catastrophic', 'Unrepairable']}
+        Total_fault = len(Repair_Table)
+        Reparability_percentage = Print_Repair_Counts(f'Short_Distance {Short_Distance:g}', Statistics, Total_fault)
+        Curve.append({'Short_Distance': Short_Distance, 'Total': Total_fault, **Statistics, 'Reparability': Reparability_percentage})
+
+    Curve = pd.DataFrame(Curve)
+    with Profile_Stage('Writing tables'):
+        Curve.to_csv(Sweep_file_name, index=False)
+
+    return Curve
+
+def Interface_Dependencies(df_bump, Route_Table):
+    """
+    This function describes what the analysis of the faults depends on, to find the faults to analyze again after an edit of the interface.
+    The classification of a fault depends on the type, spare flag, default route and first repair chain of its bumps, the short filter on their position,
+    and LogicSolver on the routes of the affected repair chains, on the spare flag and default route of their connections, and on the repair routes of their signals.
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+
+    Returns:
+    - dict: 'Bumps', the names of the bumps in the order of the bump map, 'Positions' and 'Classes', the position and the classification inputs of each bump,
+      and 'Chains', a fingerprint of each repair chain.
+    """
+    Default_Connections = set(Route_Table.loc[Route_Table['Status'] == 'Default', 'Connection'])
+    Repair_Signals = set(Route_Table.loc[Route_Table['Status'] != 'Default', 'Signal'])
+    First_Chain = Route_Table.drop_duplicates('Connection').set_index('Connection')['RepairChain'].to_dict()
+    Spare = dict(zip(df_bump['Name'], (df_bump['Spare'] == True).tolist()))
+
+    Dependencies = {'Bumps': df_bump['Name'].tolist(), 'Positions': {}, 'Classes': {}, 'Chains': {}}
+    for name, position, Type in zip(df_bump['Name'], Bump_Points(df_bump).tolist(), df_bump['Type']):
+        Dependencies['Positions'][name] = position
+        Dependencies['Classes'][name] = [Type, Spare[name], name in Default_Connections, First_Chain.get(name)]
+
+    for RepairChain, Chain_Routes in Route_Table.groupby('RepairChain', sort=False):
+        Routes = Chain_Routes[['Signal', 'Connection', 'Mux', 'Sel', 'Status']].values.tolist()
+        Connections = [[connection, Spare.get(connection), connection in Default_Connections] for connection in dict.fromkeys(Chain_Routes['Connection'])]
+        Signals = [[signal, signal in Repair_Signals] for signal in dict.fromkeys(Chain_Routes['Signal'])]
+        Dependencies['Chains'][RepairChain] = hashlib.blake2b(repr([Routes, Connections, Signals]).encode(), digest_size=16).hexdigest()
+
+    return Dependencies
+
+def Incremental_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                                  Reparability_Table_file_name, Fault_Table_file_name, Incremental_State_file_name, Print_Fault, Reuse=False):
+    """
+    This function gives the same Fault_Table, Repair_Table and statistics as Repair_Statistics_using_LogicSolver, reusing the results of the previous run
+    saved in Incremental_State_file_name with the dependencies of the interface (see Interface_Dependencies), so that only the faults affected
+    by an edit of the bump map or of the IRL are analyzed again :
+    - for single shorts, only the shorts containing a moved bump are enumerated again, the shorts of the bumps that did not move being unchanged,
+    - a fault is classified and solved again if one of its bumps has new classification inputs or one of its repair chains changed.
+    If there is no previous run, or if it was made with another fault model or bump list, every fault is analyzed, and the state is written for the next run.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Reparability_Table_file_name (str): Path to the Repair_Table CSV file.
+    - Fault_Table_file_name (str): Path to the Fault_Table CSV file.
+    - Incremental_State_file_name (str): Path to the JSON file of the results and dependencies of the previous run.
+    - Print_Fault (bool): Flag to print each fault analyzed.
+    - Reuse (bool): Flag to write the fingerprints of the tables, to reuse them in a later run (see Reusable_Table).
+
+    Returns:
+    - pd.DataFrame: The Repair_Table.
+    """
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Model = Interface_Model(df_bump, Route_Table)
+    Classes = Model['Classes']
+    Dependencies = Interface_Dependencies(df_bump, Route_Table)
+    Parameters = {'Fault_Type': Fault_Type, 'Faults_Number': Faults_Number, 'Shorted_Bumps_Number': Shorted_Bumps_Number, 'Short_Distance': Short_Distance}
+
+    # Results of the previous run, by fault
+    Previous = {}
+    Moved = None
+    if os.path.exists(Incremental_State_file_name):
+        with open(Incremental_State_file_name, 'r') as file:
+            State = json.load(file)
+        if State['Parameters'] != Parameters or State['Dependencies']['Bumps'] != Dependencies['Bumps']:
+            print('Warning : the previous run was made with another fault model or bump list, every fault is analyzed.')
+        else:
+            Old = State['Dependencies']
+            Moved = {name for name in Dependencies['Bumps'] if Old['Positions'][name] != Dependencies['Positions'][name]}
+            Changed_Bumps = {name for name in Dependencies['Bumps'] if Old['Classes'][name] != Dependencies['Classes'][name]}
+            Changed_Chains = {Chain for Chain in set(Old['Chains']) | set(Dependencies['Chains']) if Old['Chains'].get(Chain) != Dependencies['Chains'].get(Chain)}
+            for fault, Fault_Class, Repair_Type, Chain_list in State['Faults']:
+                # The position of a bump only matters to the short filter, not to the analysis of a fault
+                if Changed_Bumps.isdisjoint(fault) and Changed_Chains.isdisjoint(Chain_list):
+                    Previous[tuple(fault)] = (Fault_Class, Repair_Type, set(Chain_list))
+            print(f'Incremental analysis : {len(Moved)} bumps moved, {len(Changed_Bumps)} bumps and {len(Changed_Chains)} repair chains changed, {len(Previous)} of {len(State["Faults"])} faults reused')
+    else:
+        print(f'Warning : no previous run {Incremental_State_file_name}, every fault is analyzed.')
+
+    # Faults of the fault model, as lists of indices in the order of Fault_Enumerator
+    with Profile_Stage('Fault enumeration and classification'):
+        if Moved is not None and Fault_Type == 'Short' and Faults_Number == 1:
+            # The shorts without moved bumps are unchanged, the shorts with a moved bump are searched around it
+            Index_of = {name: index for index, name in enumerate(Dependencies['Bumps'])}
+            Faults = {tuple(Index_of[name] for name in fault) for fault, Fault_Class, Repair_Type, Chain_list in State['Faults'] if Moved.isdisjoint(fault)}
+            Moved_Bump_Shorts(Bump_Points(df_bump), [Index_of[name] for name in Moved], Faults, Shorted_Bumps_Number, Short_Distance)
+            Faults = sorted(Faults)
+        else:
+            Faults = Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type)
+
+        Fault_rows = []
+        Repair_rows = []
+        Analyzed = 0
+        for index_list in Faults:
+            fault = [Dependencies['Bumps'][i] for i in index_list]
+            if tuple(fault) in Previous:
+                Fault_Class, Repair_Type, Chain_list = Previous[tuple(fault)]
+            else:
+                Analyzed += 1
+                with Profile_Stage('Fault classification'):
+                    fault, Fault_Class, Chain_list = Classify_Fault(Classes, index_list, Fault_Type)
+                if Print_Fault:
+                    print(fault)
+                Repair_Type = Fault_Class
+                if Repair_Type == 'Repair':
+                    with Profile_Stage('LogicSolver'):
+                        Repair_Type = Model_Repair_Type(Model, index_list, Chain_list)
+            Fault_rows.append([fault, Fault_Class, Chain_list])
+            Repair_rows.append([fault, Repair_Type, Chain_list])
+
+    Fault_Table = pd.DataFrame(Fault_rows, columns=['Fault', 'Repair_Type', 'Chain_list'])
+    Repair_Table = pd.DataFrame(Repair_rows, columns=['Fault', 'Repair_Type', 'Chain_list'])
+
+    Print_Repair_Statistics('Repair Statistics using LogicSolver', Repair_Table)
+    print(f'Incremental analysis : {Analyzed} faults analyzed, {len(Repair_Table) - Analyzed} reused')
+
+    Fingerprint = Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance)
+    with Profile_Stage('Writing tables'):
+        Fault_Table.to_csv(Fault_Table_file_name, index=True)
+        Repair_Table.to_csv(Reparability_Table_file_name, index=True)
+        if Reuse:
+            Write_Table_Fingerprint(Fault_Table_file_name, Fingerprint)
+            Write_Table_Fingerprint(Reparability_Table_file_name, Fingerprint)
+        # The state is replaced atomically, as the checkpoints
+        State = {'Parameters': Parameters, 'Dependencies': Dependencies,
+                 'Faults': [[fault, Fault_Class, Repair_Type, sorted(Chain_list)] for (fault, Fault_Class, Chain_list), (_, Repair_Type, _) in zip(Fault_rows, Repair_rows)]}
+        with open(Incremental_State_file_name + '.tmp', 'w') as file:
+            json.dump(State, file)
+        os.replace(Incremental_State_file_name + '.tmp', Incremental_State_file_name)
+
+    return Repair_Table
+
+def Pruned_Open_Statistics(BumpMap_file_name, Interface_IRL_file_name, Faults_Number, Minimal_Sets_file_name, Print_Fault):
+    """
+    This function computes the exact repair statistics of Repair_Statistics_using_LogicSolver for Faults_Number opens, pruning the enumeration.
+    LogicSolver is monotone : if a set of opens is unrepairable, every set containing it is unrepairable too, as it overloads the same repair chain
+    or opens the same signal without repair route. The sets of opens are enumerated as a tree, each set being extended by bumps of higher index,
+    and every set is solved as a fault before being extended. When a set is unrepairable, the faults extending it are counted as unrepairable
+    without being enumerated : there are C(N - 1 - i, k - j) of them, for a set of j opens whose last bump has the index i.
+    The unrepairable sets found are reduced to minimal unrepairable sets (every proper subset is repairable), which are recorded,
+    and a set containing a recorded one is counted the same way without being solved. Only the minimal sets are kept in memory,
+    the repairable sets being solved again when a reduction needs them.
+    The minimal sets are saved to their own CSV file, the Repair_Table being left untouched.
+    The gain grows with Faults_Number, as more faults extend each unrepairable set.
+    The shorts are not monotone (shorting a POWER and a GND connection makes a fault catastrophic), so they are not pruned.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Faults_Number (int): Number of opens happening at the same time.
+    - Minimal_Sets_file_name (str): Path of the CSV file of the minimal unrepairable sets.
+    - Print_Fault (bool): Flag to print each solved fault.
+
+    Returns:
+    - dict: The number of faults of each repair type.
+    """
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Model = Interface_Model(df_bump, Route_Table)
+    Classes = Model['Classes']
+    N = len(df_bump)
+    k = Faults_Number
+
+    Statistics = {'Total': comb(N, k), 'Repairable': 0, 'Benign': 0, 'Catastrophic': 0, 'Unrepairable': 0}
+    # Minimal unrepairable sets found so far, as sets of indices
+    Minimal_Sets = set()
+
+    def Solve(index_list):
+        # Classify the set of opens as a fault, and solve it if it needs a repair action
+        fault, Repair_Type, Chain_list = Classify_Fault(Classes, index_list, 'Open')
+        if Print_Fault:
+            print(fault)
+        if Repair_Type == 'Repair':
+            Repair_Type = Model_Repair_Type(Model, index_list, Chain_list)
+        return Repair_Type
+
+    def Contains_Minimal_Set(index_list, Proper=True):
+        # Check if a subset of the set (a proper one by default) is a known minimal unrepairable set
+        return any(frozenset(subset) in Minimal_Sets for r in range(1, len(index_list) + (not Proper)) for subset in combinations(index_list, r))
+
+    def Minimize(index_list):
+        # Remove opens from an unrepairable set as long as it stays unrepairable
+        Reduced = True
+        while Reduced and len(index_list) > 1:
+            Reduced = False
+            for i in range(len(index_list)):
+                subset = index_list[:i] + index_list[i + 1:]
+                if Contains_Minimal_Set(subset, Proper=False) or Solve(subset) == 'Unrepairable':
+                    index_list = subset
+                    Reduced = True
+                    break
+        return index_list
+
+    def Extend(prefix):
+        # Extend the set of opens prefix by every bump of higher index
+        first = prefix[-1] + 1 if prefix else 0
+        for i in range(first, N - k + len(prefix) + 1):
+            index_list = prefix + (i,)
+            # Number of faults extending the set of opens, itself included
+            Extensions = comb(N - 1 - i, k - len(index_list))
+
+            if Minimal_Sets and Contains_Minimal_Set(index_list):
+                Repair_Type = 'Unrepairable'
+                Profile_Count('Pruned faults', Extensions)
+            else:
+                Repair_Type = Solve(index_list)
+                if Repair_Type == 'Unrepairable':
+                    Minimal_Sets.add(frozenset(Minimize(index_list)))
+                    if len(index_list) < k:
+                        Profile_Count('Pruned faults', Extensions)
+
+            if Repair_Type == 'Unrepairable':
+                Statistics['Unrepairable'] += Extensions
+                Progress_Update(Done=Extensions, Tallies={'Unrepairable': Extensions})
+            elif len(index_list) == k:
+                Statistics[Repair_Type] += 1
+                Progress_Update(Repair_Type)
+            else:
+                Extend(index_list)
+
+    Progress_Start('Pruned LogicSolver', Statistics['Total'])
+    with Profile_Stage('LogicSolver'):
+        Extend(())
+    Progress_End()
+
+    # Save the minimal unrepairable sets to a CSV file
+    with Profile_Stage('Writing tables'):
+        Minimal_Table = pd.DataFrame([[[Classes['Names'][i] for i in sorted(index_set)], 'Unrepairable'] for index_set in Minimal_Sets], columns=['Fault', 'Repair_Type'])
+        Minimal_Table.to_csv(Minimal_Sets_file_name, index=True)
+
+    return Statistics
+
+def Fault_Space_Anchors(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type):
+    """
+    This function describes the fault space enumerated by Fault_Enumerator by anchors, the anchor of a fault being its bump of lowest index.
+    A fault only contains its anchor and bumps of the pool of the anchor, ie the bumps of higher index that can be in the same fault:
+    all of them for the opens, and for the shorts, the bumps closer than the longest chain of shorted bumps (Faults_Number * Shorted_Bumps_Number - 1 times Short_Distance),
+    strictly as two bumps are only shorted if their distance is below Short_Distance (see Short_Kernel).
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Fault_Type (str): 'Short' or 'Open'.
+
+    Returns:
+    - tuple: (pools, masses), the pool of each anchor (sequence of indices) and the number of candidate combinations of each anchor,
+      the shorts among them being a subset.
+    """
+    N = len(df_bump)
+    Bumps_Number = Shorted_Bumps_Number if Fault_Type == 'Short' else 1
+
+    if Fault_Type == 'Open':
+        pools = [range(anchor + 1, N) for anchor in range(N)]
+    else:
+        points = Bump_Points(df_bump)
+        Radius = (Faults_Number * Bumps_Number - 1) * Short_Distance
+
+        # Grid of cells of side Radius, the neighbours of a bump are in its cell or the 8 around
+        cells = defaultdict(list)
+        cell_of = np.floor(points[:, :2] / max(Radius, 1e-12)).astype(np.int64)
+        for index, (cx, cy) in enumerate(cell_of.tolist()):
+            cells[(cx, cy)].append(index)
+        cells = {cell: np.array(indices) for cell, indices in cells.items()}
+
+        pools = []
+        for anchor, (cx, cy) in enumerate(cell_of.tolist()):
+            candidates = np.concatenate([cells.get((cx + dx, cy + dy), np.empty(0, dtype=np.int64)) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]).astype(np.int64)
+            candidates = candidates[candidates > anchor]
+            distances = np.sqrt(((points[candidates] - points[anchor])**2).sum(axis=1))
+            pools.append(sorted(candidates[distances < Radius].tolist()))
+
+    masses = np.array([Anchor_Combinations_Number(len(pool), Bumps_Number, Faults_Number) for pool in pools], dtype=float)
+
+    return pools, masses
+
+def Draw_Fault(anchor, pool, Bumps_Number, Faults_Number, rng):
+    """
+    This function draws uniformly one of the candidate combinations of an anchor (see Fault_Space_Anchors).
+    The bumps are ordered as by Fault_Enumerator, so the fault is classified exactly as in the exhaustive mode.
+
+    Parameters:
+    - anchor (int): Index of the anchor.
+    - pool (sequence): Indices of the pool of the anchor.
+    - Bumps_Number (int): Number of bumps affected by a fault.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - rng (random.Random): Random number generator.
+
+    Returns:
+    - list: The indices of the bumps of the fault.
+    """
+    if Faults_Number == 1:
+        return [anchor] + sorted(rng.sample(pool, Bumps_Number - 1))
+    if Bumps_Number == 1:
+        return [anchor] + sorted(rng.sample(pool, Faults_Number - 1))
+
+    # Multiple shorts : distinct combinations are drawn until one of them contains the anchor
+    members = [anchor] + list(pool)
+    while True:
+        combos = set()
+        while len(combos) < Faults_Number:
+            combos.add(tuple(sorted(rng.sample(members, Bumps_Number))))
+        if any(anchor in combo for combo in combos):
+            return [index for combo in sorted(combos) for index in combo]
+
+# Minimum number of faults accepted in each stratum of the Stratified mode before the sampling can stop
+Min_Stratum_Samples = 30
+# Maximum number of faults proposed for each of the Max_Samples faults sampled, the proposals that are not shorts being rejected
+Max_Proposals_per_Sample = 100
+
+def Sampled_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                              Sampling_Mode, Precision, Confidence_Level, Max_Samples, Sampled_Table_file_name, Print_Fault, seed=None):
+    """
+    This function estimates the repair statistics of Repair_Statistics_using_LogicSolver by sampling the fault space, for fault spaces too large to be enumerated.
+    The faults are drawn uniformly from exactly the fault space of the exhaustive mode, including the short distance constraint:
+    an anchor is drawn with a probability proportional to its number of candidate combinations, then one of its candidate combinations,
+    which is rejected if it is not a short (see Fault_Space_Anchors).
+    In the Stratified mode, the anchors are grouped in strata by repair chain and bump type, and each stratum receives a share of the samples
+    proportional to its candidate combinations. The weight of a stratum is its share of the fault space, estimated from its acceptance rate for the shorts.
+    The variance of each stratum is computed from the floored estimate (x + 1) / (n + 2), so that a stratum whose faults all fall in one class
+    does not count as exact, and the strata below Min_Stratum_Samples accepted faults are sampled more until they reach it.
+    The sampling stops once the confidence interval of the reparability percentage is narrower than Precision (and, in the Stratified mode,
+    every stratum with an accepted fault has Min_Stratum_Samples of them), or after Max_Samples faults, or after Max_Proposals_per_Sample times
+    Max_Samples proposals, so that a fault space of shorts with a very low acceptance rate cannot keep the sampling running.
+    Once as many faults are sampled as the fault space contains, sampling is slower than enumerating it: the sampling is abandoned and None is returned.
+    The sampled faults, which can repeat, are written to their own table, never to the Repair_Table.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Sampling_Mode (str): 'Uniform' or 'Stratified'.
+    - Precision (float): Half-width of the confidence interval of the reparability percentage, in percentage points.
+    - Confidence_Level (float): Confidence level of the confidence intervals.
+    - Max_Samples (int): Maximum number of faults sampled.
+    - Sampled_Table_file_name (str): Path to the CSV file where the sampled faults are written.
+    - Print_Fault (bool): Flag to print each fault.
+    - seed (int, optional): Seed of the sampling.
+
+    Returns:
+    - pd.DataFrame or None: The table of the sampled faults (a fault can be sampled several times), None if the fault space is to be enumerated.
+    """
+    if Sampling_Mode not in ['Uniform', 'Stratified']:
+        raise ValueError(f'Unknown sampling mode {Sampling_Mode}, choose Uniform or Stratified')
+
+    rng = random.Random(seed)
+    Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+    df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Model = Interface_Model(df_bump, Route_Table)
+    Classes = Model['Classes']
+    points = Bump_Points(df_bump)
+    Bumps_Number = Shorted_Bumps_Number if Fault_Type == 'Short' else 1
+
+    pools, masses = Fault_Space_Anchors(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type)
+    if masses.sum() == 0:
+        raise ValueError('The fault space is empty')
+
+    # Strata of the anchors : the repair chain (as in Fault_Classification) and the type of the anchor
+    if Sampling_Mode == 'Stratified':
+        First_RepairChain = Route_Table.drop_duplicates('Connection').set_index('Connection')['RepairChain']
+        keys = list(zip(df_bump['Name'].map(First_RepairChain).fillna('None'), np.where(df_bump['Spare'] == True, 'SPARE', df_bump['Type'])))
+    else:
+        keys = ['All'] * len(df_bump)
+    strata = defaultdict(list)
+    for anchor, key in enumerate(keys):
+        if masses[anchor] > 0:
+            strata[key].append(anchor)
+    Stratum_anchors = {key: anchors for key, anchors in strata.items()}
+    Stratum_cum_weights = {key: np.cumsum(masses[anchors]).tolist() for key, anchors in strata.items()}
+    Stratum_mass = {key: cum_weights[-1] for key, cum_weights in Stratum_cum_weights.items()}
+    Total_mass = sum(Stratum_mass.values())
+
+    Repair_Types = ['Repairable', 'Unrepairable', 'Benign', 'Catastrophic']
+    proposed = defaultdict(int)
+    accepted = defaultdict(int)
+    class_counts = defaultdict(lambda: defaultdict(int))
+    rows = []
+    z = NormalDist().inv_cdf(0.5 + Confidence_Level / 2)
+
+    def Sample(key):
+        # Draw an anchor of the stratum, then one of its candidate combinations
+        anchor = Stratum_anchors[key][rng.choices(range(len(Stratum_anchors[key])), cum_weights=Stratum_cum_weights[key])[0]]
+        index_list = Draw_Fault(anchor, pools[anchor], Bumps_Number, Faults_Number, rng)
+        proposed[key] += 1
+        if Fault_Type == 'Short' and not Short_Kernel(points, np.array(index_list, dtype=np.int64), Short_Distance):
+            return 0
+
+        fault, Repair_Type, Chain_list = Classify_Fault(Classes, index_list, Fault_Type)
+        if Print_Fault:
+            print(fault)
+        if Repair_Type == 'Repair':
+            Repair_Type = Model_Repair_Type(Model, index_list, Chain_list)
+        accepted[key] += 1
+        class_counts[key][Repair_Type] += 1
+        rows.append([fault, Repair_Type, Chain_list])
+        Progress_Update(Repair_Type)
+        return 1
+
+    def Estimate(Group):
+        # Estimate of the share of the fault space in the classes of Group, and the half-width of its confidence interval
+        if Sampling_Mode == 'Uniform':
+            n = accepted['All']
+            p = sum(class_counts['All'][c] for c in Group) / n
+            # Wilson score interval, reliable for the rare classes
+            center = (p + z**2 / (2 * n)) / (1 + z**2 / n)
+            half_width = z * sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / (1 + z**2 / n)
+            return p, center - half_width, center + half_width
+        # Weights of the strata, from their acceptance rates for the shorts
+        weights = {key: Stratum_mass[key] * accepted[key] / proposed[key] for key in Stratum_mass if proposed[key] > 0}
+        total = sum(weights.values())
+        p = 0
+        variance = 0
+        for key, weight in weights.items():
+            if accepted[key] > 0:
+                x = sum(class_counts[key][c] for c in Group)
+                p += weight / total * x / accepted[key]
+                # The floored estimate never gives a null variance, even if every fault of the stratum is in the same classes
+                p_floor = (x + 1) / (accepted[key] + 2)
+                variance += (weight / total)**2 * p_floor * (1 - p_floor) / accepted[key]
+        return p, max(p - z * sqrt(variance), 0), min(p + z * sqrt(variance), 1)
+
+    def Space_Size():
+        # Size of the fault space, exact for the opens, estimated from the acceptance rate for the shorts
+        return sum(Stratum_mass[key] * accepted[key] / proposed[key] for key in Stratum_mass if proposed[key] > 0)
+
+    # The sampling stops on the precision, Max_Samples is only a bound : the reports give the half-width reached instead of an ETA
+    Progress_Start('Sampling', None)
+    Samples = 0
+    Proposals = 0
+    Max_Proposals = Max_Proposals_per_Sample * Max_Samples
+    Proposals_per_batch = 1000
+    first_batch = True
+    while Samples < Max_Samples and Proposals < Max_Proposals:
+        if Sampling_Mode == 'Uniform':
+            for _ in range(Proposals_per_batch):
+                Samples += Sample('All')
+                if Samples >= Max_Samples or proposed['All'] >= Max_Proposals:
+                    break
+        else:
+            # Proportional allocation of the proposals, with at least 2 per stratum in the first batch,
+            # and enough for the strata below Min_Stratum_Samples accepted faults to reach it
+            for key in Stratum_mass:
+                share = Proposals_per_batch * Stratum_mass[key] / Total_mass
+                allocation = int(share) + (rng.random() < share - int(share))
+                if first_batch:
+                    allocation = max(allocation, 2)
+                elif accepted[key] < Min_Stratum_Samples:
+                    allocation = max(allocation, Min_Stratum_Samples - accepted[key])
+                for _ in range(allocation):
+                    Samples += Sample(key)
+            first_batch = False
+        Proposals = sum(proposed.values())
+
+        if Samples > 0 and Samples >= Space_Size():
+            Progress_End()
+            return None
+        # The strata without any accepted fault have no weight in the estimate
+        if Samples >= 100 and all(accepted[key] >= Min_Stratum_Samples for key in Stratum_mass if accepted[key] > 0):
+            p, low, high = Estimate(['Repairable', 'Benign'])
+            Progress_Update(Done=0, Status=f'half-width {(high - low) / 2 * 100:.4f}% (target {Precision}%)')
+            if (high - low) / 2 * 100 <= Precision:
+                break
+    Progress_End()
+
+    if Samples == 0 and Proposals >= Max_Proposals > 0:
+        raise ValueError(f'The fault space is empty : none of the {Proposals} faults proposed is a short')
+    if Samples == 0:
+        raise ValueError('No fault was sampled, increase Max_Samples')
+
+    Fault_space_size = Space_Size()
+    print(f'Sampled Repair Statistics using LogicSolver ({Sampling_Mode}, {Confidence_Level * 100:g}% confidence) : {Samples} faults sampled, out of {Fault_space_size:.6g} faults')
+    for Group in [[c] for c in Repair_Types] + [['Repairable', 'Benign']]:
+        p, low, high = Estimate(Group)
+        name = 'Reparability' if len(Group) == 2 else f'{Group[0]} faults'
+        print(f'{name} : {p * 100:.4f}% [{low * 100:.4f}%, {high * 100:.4f}%]')
+    if (high - low) / 2 * 100 > Precision:
+        print(f'Warning : the precision of {Precision}% is not reached after {Samples} faults ({Proposals} proposed), increase Max_Samples.')
+
+    Sampled_Table = pd.DataFrame(rows, columns=['Fault', 'Repair_Type', 'Chain_list'])
+    Sampled_Table.to_csv(Sampled_Table_file_name, index=True)
+
+    return Sampled_Table
+
+def Polynomial_Product(P, Q, Degree):
+    """
+    This function multiplies two polynomials, given as lists of coefficients, and truncates the product to the given degree.
+    """
+    Product = [0] * min(len(P) + len(Q) - 1, Degree + 1)
+    for i, p in enumerate(P[:Degree + 1]):
+        if p:
+            for j, q in enumerate(Q[:Degree + 1 - i]):
+                Product[i + j] += p * q
+    return Product
+
+def Counted_Open_Statistics(BumpMap_file_name, Interface_IRL_file_name, Faults_Number):
+    """
+    This function computes the exact repair statistics of Repair_Statistics_using_LogicSolver for Faults_Number opens, without enumerating them.
+    Under the rule of LogicSolver, the reparability of a fault only depends on the number of opens in each repair chain, compared to its spares,
+    and on the opens of signals without any repair route. When every connection belongs to at most one repair chain, and the signals without
+    repair route are only in the repair chain of their connection, the repair chains are independent. The number of ways to open j connections
+    of a chain while keeping it repairable is then the coefficient of x^j of its generating polynomial, and the polynomials of the chains
+    and of the connections outside the chains are multiplied to count the repairable faults.
+    The benign faults are the faults without any connection needing a repair action, as in Fault_Classification.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Faults_Number (int): Number of opens happening at the same time.
+
+    Returns:
+    - dict: The number of faults of each repair type, or None if the repair chains of the interface are not independent.
     """
-    
-    # Base case: If all PFS are routed, store the solution
-    if Routed_PFS_list == PFS_to_route_list: #If we have routed every PFS 
-        Solutions_dict_per_RepairChain[f'Solution_{len(Solutions_dict_per_RepairChain)}'] = Solution.set_index('Mux')['Sel'].to_dict()
-        return
+    Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+    df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    k = Faults_Number
+
+    # Class of each bump, as in Fault_Classification
+    Default_Connections = set(Route_Table.loc[Route_Table['Status'] == 'Default', 'Connection'])
+    Classes = Bump_Fault_Classes(df_bump, Route_Table)
+    Needs_Repair = dict(zip(Classes['Names'], ((Classes['Class'] & Bump_Class_Bits['Repair']) != 0).tolist()))
+    Spare = dict(zip(df_bump['Name'], df_bump['Spare'] == True))
+
+    # The repair chains are independent if every connection belongs to one repair chain at most
+    Connection_Chains = Route_Table.groupby('Connection')['RepairChain'].nunique()
+    if (Connection_Chains > 1).any():
+        return None
+    Chain_of_Connection = Route_Table.drop_duplicates('Connection').set_index('Connection')['RepairChain'].to_dict()
+
+    # ... and if the signals without repair route are only in the repair chain of their connection
+    Repair_Signals = set(Route_Table.loc[Route_Table['Status'] != 'Default', 'Signal'])
+    Signal_Chains = Route_Table.groupby('Signal')['RepairChain'].agg(set).to_dict()
+    Dead = set()
+    for name in df_bump['Name']:
+        signal_name = name.replace('_phy', '')
+        if signal_name in Signal_Chains and signal_name not in Repair_Signals:
+            if Signal_Chains[signal_name] - {Chain_of_Connection.get(name)}:
+                return None
+            Dead.add(name)
+
+    # Generating polynomials of the repairable faults : every faulty bump, and the faulty bumps not needing a repair action
+    All_Polynomial = [1]
+    Benign_Polynomial = [1]
+    Free_bumps = [name for name in df_bump['Name'] if name not in Chain_of_Connection]
+    All_Polynomial = Polynomial_Product(All_Polynomial, [comb(len(Free_bumps), j) for j in range(len(Free_bumps) + 1)], k)
+    Free_benign = sum(not Needs_Repair[name] for name in Free_bumps)
+    Benign_Polynomial = Polynomial_Product(Benign_Polynomial, [comb(Free_benign, j) for j in range(Free_benign + 1)], k)
+
+    for Chain, Chain_Routes in Route_Table.groupby('RepairChain'):
+        Members = list(dict.fromkeys(Chain_Routes['Connection']))
+        # Spares of the chain, as counted by LogicSolver
+        Spare_Count = sum(Spare.get(connection, False) or connection not in Default_Connections for connection in Members)
+        # A chain is repairable if no more connections than spares are open, and no signal without repair route
+        # The connections of the route table missing from the bump map cannot be open
+        Alive = [connection for connection in Members if connection not in Dead and connection in Spare]
+        Alive_benign = sum(not Needs_Repair.get(connection, False) for connection in Alive)
+        All_Polynomial = Polynomial_Product(All_Polynomial, [comb(len(Alive), j) for j in range(min(Spare_Count, len(Alive)) + 1)], k)
+        Benign_Polynomial = Polynomial_Product(Benign_Polynomial, [comb(Alive_benign, j) for j in range(min(Spare_Count, Alive_benign) + 1)], k)
+
+    N = len(df_bump)
+    Total_fault = comb(N, k)
+    Benign_fault = comb(sum(not Needs_Repair[name] for name in df_bump['Name']), k)
+    Repairable_fault = (All_Polynomial[k] if len(All_Polynomial) > k else 0) - (Benign_Polynomial[k] if len(Benign_Polynomial) > k else 0)
+
+    return {'Total': Total_fault, 'Repairable': Repairable_fault, 'Benign': Benign_fault, 'Catastrophic': 0,
+            'Unrepairable': Total_fault - Benign_fault - Repairable_fault}
+
+def Bundle_Fault_Class(combo_bumps, Fault_Type):
+    """
+    This function classifies a fault of an interface made of bundles before BundleSolver is called, as Fault_Classification does,
+    except that the type of each connection is taken as it is in the bump map, as in the bundle mode of MetaCIRA :
+    the repair routes of these interfaces are given between bundles, not between connections.
 
-    # if there exists no solution for the fault yet
-    if len(Solutions_dict_per_RepairChain) == 0:
+    Parameters:
+    - combo_bumps (list): The types of the bumps affected by the fault, in the order of the fault.
+    - Fault_Type (str): 'Short' or 'Open'.
 
-        # Get the current PFS to route
-        PFS_to_route = PFS_to_route_list[PFS_counter]
-        
-        # Find possible routes for the current PFS in Route_Table
-        possible_PFS_route = Route_Table[(Route_Table['Signal'] == PFS_to_route)]
+    Returns:
+    - str: 'Catastrophic', 'Repair' or 'Benign'.
+    """
+    Repair_Type = 'Benign'
+    GNDFlag = False
+    POWERFlag = False
+    for Type in combo_bumps:
+        if Type == 'GND':
+            GNDFlag = True
+        if Type == 'POWER':
+            POWERFlag = True
+        if POWERFlag == True and GNDFlag == True and Fault_Type == 'Short':
+            Repair_Type = 'Catastrophic'
+        if Fault_Reparation[Type] == 'Repair':
+            Repair_Type = 'Repair'
+    return Repair_Type
+
+def Bundle_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Class_Table_file_name):
+    """
+    This function computes the exact repair statistics of an interface made of bundles (--Bundle_Flag), every fault being solved by the rule of BundleSolver.
+    BundleSolver only looks at the set of bundles affected by a fault, so the faults are collapsed to bundle-level fault classes :
+    the set of affected bundles and the classification of the fault (see Bundle_Fault_Class). Each class is solved once against
+    the precomputed repair bundles (see Bundle_Repair_Map), and its number of faults is added to the statistics.
+    For the opens, nothing is enumerated : the number of ways to open k bumps hitting exactly a set of bundles is the coefficient of x^k
+    of the product of the ((1+x)^n - 1) of its bundles, n being the number of bumps of the bundle (or of its bumps not needing a repair action for the benign faults).
+    For the shorts, the shorts are enumerated as by Fault_Enumerator, within the neighbourhood of each bump for the single shorts (see Fault_Space_Anchors),
+    but only the bundles and the types of their bumps are kept.
+    The fault classes are saved to their own CSV file, with their number of faults, the Repair_Table being left untouched.
 
-        for index, route in possible_PFS_route.iterrows():
-            # We marked the connection corresponding to the current route as used
-            Used_IS = route['Connection']
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Fault_Class_Table_file_name (str): Path of the CSV file of the fault classes.
 
-            # Check if the IS and PFS are not already used or routed
-            if Used_IS not in Used_IS_list and PFS_to_route not in Routed_PFS_list:
+    Returns:
+    - dict: The number of faults of each repair type.
+    """
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    if 'Bundle' not in df_bump.columns:
+        raise ValueError('The bundle mode needs the Bundle of each bump in the bump map')
+
+    Repair_Map = Bundle_Repair_Map(Route_Table)
+    # The bumps without bundle are gathered in a bundle None, which has no repair route
+    Bundle_of = [None if pd.isna(Bundle) else Bundle for Bundle in df_bump['Bundle']]
+    Types = df_bump['Type'].tolist()
+    k = Faults_Number
+
+    # Number of faults of each fault class (set of affected bundles, classification)
+    Classes = Counter()
+
+    with Profile_Stage('Fault enumeration and classification'):
+        if Fault_Type == 'Open':
+            Bundle_Sizes = Counter(Bundle_of)
+            Bundle_Benign = Counter(Bundle for Bundle, Type in zip(Bundle_of, Types) if Bundle_Fault_Class([Type], Fault_Type) == 'Benign')
+            Bundles = list(Bundle_Sizes)
+            # Polynomial of the ways to open at least one bump of a bundle of n bumps
+            def Hit_Polynomial(n):
+                return [0] + [comb(n, j) for j in range(1, min(n, k) + 1)]
+            Hit_All = [Hit_Polynomial(Bundle_Sizes[Bundle]) for Bundle in Bundles]
+            Hit_Benign = [Hit_Polynomial(Bundle_Benign[Bundle]) for Bundle in Bundles]
+
+            for t in range(1, min(k, len(Bundles)) + 1):
+                for Hit in combinations(range(len(Bundles)), t):
+                    All_Polynomial = [1]
+                    Benign_Polynomial = [1]
+                    for b in Hit:
+                        All_Polynomial = Polynomial_Product(All_Polynomial, Hit_All[b], k)
+                        Benign_Polynomial = Polynomial_Product(Benign_Polynomial, Hit_Benign[b], k)
+                    All_faults = All_Polynomial[k] if len(All_Polynomial) > k else 0
+                    Benign_faults = Benign_Polynomial[k] if len(Benign_Polynomial) > k else 0
+                    Fault_Class = frozenset(Bundles[b] for b in Hit)
+                    if Benign_faults:
+                        Classes[(Fault_Class, 'Benign')] += Benign_faults
+                    if All_faults - Benign_faults:
+                        Classes[(Fault_Class, 'Repair')] += All_faults - Benign_faults
 
-                # Update the lists and the current solution
-                Used_IS_list.append(Used_IS)
-                Routed_PFS_list.append(PFS_to_route)
-                Solution = Solution._append(route, ignore_index=True)
+        else:
+            for index_list in Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type):
+                Fault_Class = frozenset(Bundle_of[i] for i in index_list)
+                Classes[(Fault_Class, Bundle_Fault_Class([Types[i] for i in index_list], Fault_Type))] += 1
+
+    # Each fault class needing a repair action is solved once
+    Statistics = {'Total': 0, 'Repairable': 0, 'Benign': 0, 'Catastrophic': 0, 'Unrepairable': 0}
+    Rows = []
+    for (Fault_Class, Repair_Type), Faults_count in Classes.items():
+        if Repair_Type == 'Repair':
+            Repair_Type = Bundle_Reparability(Fault_Class, Repair_Map)
+        Statistics['Total'] += Faults_count
+        Statistics[Repair_Type] += Faults_count
+        Rows.append([sorted(Fault_Class, key=str), Repair_Type, Faults_count])
 
-                # Recursively solve for the next PFS
-                RecursiveSolver(Used_IS_list, Routed_PFS_list, PFS_to_route_list, PFS_counter + 1, Solution, Solutions_dict_per_RepairChain, Route_Table, Repair_Type)
+    with Profile_Stage('Writing tables'):
+        Class_Table = pd.DataFrame(Rows, columns=['Fault_Class', 'Repair_Type', 'Faults'])
+        Class_Table.to_csv(Fault_Class_Table_file_name, index=False)
 
-                if len(Solutions_dict_per_RepairChain) == 0:
-                    # Backtrack to explore other routes
-                    Routed_PFS_list.pop()
-                    Used_IS_list.pop()
-                    Solution = Solution.drop(Solution.index[-1])
+    return Statistics
 
-def BundleSolver(df_bump, fault, Route_Table):
+def Default_Configurations(Route_Table):
     """
-    This function determines the reparability of a fault based on the available bundles and route table.
-    It only works with interface made of bundles. 
-    See the README for more informations.
+    This function returns the default configuration of the muxes of each repair chain, ie the selection of the default route of each connection.
 
     Parameters:
-    - df_bump (pd.DataFrame): DataFrame containing bump information.
-    - fault (list): List of faulty connections.
     - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
 
     Returns:
-    - str: 'Repairable' if the fault can be repaired, 'Unrepairable' otherwise.
+    - dict: For each repair chain, the dictionary {mux: sel} of its default routes, in the order of the route table.
     """
-    # Initialize an empty list to store unique bundles associated with the faulty connections
-    Bundle_list = []
-
-    # Initialize a flag to determine if the fault is unrepairable
-    UnrepairableFlag = False
+    Default_Routes = Route_Table[Route_Table['Status'] == 'Default']
+    return {RepairChain: dict(zip(Chain_Routes['Mux'], Chain_Routes['Sel'])) for RepairChain, Chain_Routes in Default_Routes.groupby('RepairChain', sort=False)}
 
-    # Iterate through each connection in the fault list
-    for connection in fault:
-        # Get the bundle associated with the current connection
-        Bundle = df_bump.loc[df_bump['Name'] == connection, 'Bundle'].values[0]
-        
-        # If the bundle is not already in the Bundle_list, add it
-        if Bundle not in Bundle_list:
-            Bundle_list.append(Bundle)
+def Encode_Repair_Solution(Solution_Total, Default_Configuration_Table):
+    """
+    This function encodes the repair solutions of a fault as deltas from the default configuration of each repair chain (see Default_Configurations).
+    Only the muxes whose selection changes are kept : [mux, sel] for a mux selecting another route than its default one (or without default route),
+    and [mux, None] for a mux of the default configuration left unused by the solution, such as the mux of the faulty connection.
 
-    # Iterate through each unique bundle in the Bundle_list
-    for Bundle in Bundle_list:
-        # If the fault is not already marked as unrepairable and the bundle is not None
-        if UnrepairableFlag == False and Bundle != None:
-            # Check if there is a default route for the bundle in the Route_Table, in other words : check if the bundle is for repair purpose only 
-            if not Route_Table[(Route_Table['Connection'] == Bundle) & (Route_Table['Status'] == 'Default')].empty:
-                # Get the signal name associated with the bundle
-                Bundle_Signal = Bundle.replace('_phy', '')
+    Parameters:
+    - Solution_Total (list): The list of [RepairChain, [[mux, sel], ...]] solutions of the affected repair chains (see Repair_Solution_of_Fault).
+    - Default_Configuration_Table (dict): The default configuration of each repair chain.
 
-                # Get the repair connection for the bundle signal
-                Repair_Bundle = Route_Table[(Route_Table['Signal'] == Bundle_Signal) & (Route_Table['Status'] == 'Repair')]['Connection'].values[0]
+    Returns:
+    - list: The list of [RepairChain, [[mux, sel], ...]] deltas of the affected repair chains.
+    """
+    Delta_Total = []
+    for RepairChain, Repair_Solution in Solution_Total:
+        Default = Default_Configuration_Table.get(RepairChain, {})
+        Configuration = dict(Repair_Solution)
+        Delta = [[mux, sel] for mux, sel in Repair_Solution if Default.get(mux) != sel]
+        Delta += [[mux, None] for mux in Default if mux not in Configuration]
+        Delta_Total.append([RepairChain, Delta])
+    return Delta_Total
+
+def Decode_Repair_Solution(Delta_Total, Default_Configuration_Table):
+    """
+    This function rebuilds the full repair solutions of a fault from their deltas (see Encode_Repair_Solution).
+    The muxes of each repair chain are given in the order of its default configuration, followed by the muxes without default route.
 
-                # If the repair bundle assigned to the current bundle is in the Bundle_list, mark the fault as unrepairable
-                if Repair_Bundle in Bundle_list:
-                    UnrepairableFlag = True
+    Parameters:
+    - Delta_Total (list): The list of [RepairChain, [[mux, sel], ...]] deltas of the affected repair chains.
+    - Default_Configuration_Table (dict): The default configuration of each repair chain.
 
-    # Return the reparability status based on the UnrepairableFlag
-    if UnrepairableFlag == True: 
-        return 'Unrepairable'
-    else:
-        return 'Repairable'
-    
-# Section 4 : Reparability Statistics
-def Fault_Table_Generator(Interface_IRL_file_name, BumpMap_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name):
-     
+    Returns:
+    - list: The list of [RepairChain, [[mux, sel], ...]] full solutions of the affected repair chains.
+    """
+    Solution_Total = []
+    for RepairChain, Delta in Delta_Total:
+        Configuration = dict(Default_Configuration_Table.get(RepairChain, {}))
+        for mux, sel in Delta:
+            if sel is None:
+                del Configuration[mux]
+            else:
+                Configuration[mux] = sel
+        Solution_Total.append([RepairChain, [[mux, sel] for mux, sel in Configuration.items()]])
+    return Solution_Total
 
-    # Get the IRL and Bumpmap file 
-    Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
-    df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+def Solution_ID(RepairChain, Repair_Solution):
+    """
+    This function returns the ID of the solution of a repair chain, a digest of the chain and of its [[mux, sel], ...] list.
+    The ID only depends on the solution, so it is the same across faults, runs and resumed runs. Two different solutions can share
+    a digest : Intern_Repair_Solution compares the solutions and suffixes the ID of the later one.
+    """
+    return hashlib.blake2b(repr([RepairChain, Repair_Solution]).encode(), digest_size=8).hexdigest()
 
-    # Define the type of each connection regarding the reparability
-    fault_reparation = {
-        'POWER': 'Benign',
-        'GND': 'Benign',
-        'DATA': 'Repair', 
-        'CLK': 'Repair', 
-        'ADDR': 'Repair', 
-        'SIDEBAND': 'Repair', 
-        'SPARE': 'Benign', 
-        'NONE': 'Benign'}
-    
-    # Initiate the fault table as an empty dataframe
-    Fault_Table = pd.DataFrame()
+def Intern_Repair_Solution(Solution_Total, Solution_Dictionary):
+    """
+    This function replaces the solution of each repair chain of a fault by its ID, and adds the solutions not seen yet to the solution dictionary.
+    If the ID is already given to another solution (a collision of the digests), the solution takes the first free ID among ID_1, ID_2, ...
 
-    def euclidean_distance(point1, point2):
+    Parameters:
+    - Solution_Total (list): The list of [RepairChain, [[mux, sel], ...]] solutions of the affected repair chains (full or delta encoded).
+    - Solution_Dictionary (dict): The solutions seen so far, {ID: [RepairChain, [[mux, sel], ...]]}, updated in place.
 
-        """
-        Calculate the Euclidean distance between two bumps.
-        
-        Args:
-            point1: First point with coordinates accessible via dictionary-like access (e.g., point1['X'], point1['Y'])
-            point2: Second point with coordinates accessible via dictionary-like access
-        
-        Returns:
-            float: Euclidean distance between the bumps
-        """
-        # Assumes both bumps have the same dimensions
-        # Extract all columns that might represent coordinates (e.g., X, Y, Z...)
+    Returns:
+    - list: The list of [RepairChain, ID] of the affected repair chains.
+    """
+    Interned_Total = []
+    for RepairChain, Repair_Solution in Solution_Total:
+        Digest = Solution_ID(RepairChain, Repair_Solution)
+        ID = Digest
+        Collisions = 0
+        while ID in Solution_Dictionary and Solution_Dictionary[ID] != [RepairChain, Repair_Solution]:
+            Collisions += 1
+            ID = f'{Digest}_{Collisions}'
+        if ID not in Solution_Dictionary:
+            Solution_Dictionary[ID] = [RepairChain, Repair_Solution]
+        Interned_Total.append([RepairChain, ID])
+    return Interned_Total
+
+def Resolve_Repair_Solution(Interned_Total, Solution_Dictionary):
+    """
+    This function rebuilds the solutions of a fault from their IDs (see Intern_Repair_Solution).
+    """
+    return [Solution_Dictionary[ID] for RepairChain, ID in Interned_Total]
 
-        coords = [col for col in point1.index if col in point2.index and col.upper() in ['X', 'Y', 'Z']]
-        
-        # Calculate sum of squared differences for each coordinate
-        sum_squared_diff = sum((point1[coord] - point2[coord])**2 for coord in coords)
-        
-        # Return the square root of the sum
-        return np.sqrt(sum_squared_diff)
-
-    def is_short(bumps, threshold):
-        """
-        Determine if a set of bumps forms a short.
-        A short is defined as:
-        1. Each point is connected to at least one other point (distance < threshold)
-        2. All bumps form a single connected component (can reach any point from any other)
-        
-        Args:
-            bumps: List of bumps, where each point is a pandas Series or similar with X, Y, etc. coordinates
-            threshold: Maximum distance for two bumps to be considered connected
-        
-        Returns:
-            bool: True if bumps form a short, False otherwise
-        """
+def Write_Solution_Dictionary(Solution_Dictionary, Solution_Dictionary_file_name):
+    """
+    This function saves the solution dictionary to a CSV file, one solution per row.
+    """
+    Rows = [[ID, RepairChain, Repair_Solution] for ID, (RepairChain, Repair_Solution) in Solution_Dictionary.items()]
+    pd.DataFrame(Rows, columns=['ID', 'RepairChain', 'Repair_Solution']).to_csv(Solution_Dictionary_file_name, index=False)
 
-        if len(bumps) == 0:
-            # Empty list can't be short
-            return False
-        
-        elif len(bumps) == 1:
-            # A single point is an Open
-            return True
-        
-        else:
-            # Build an adjacency list representing the graph
-            # Each point is a node, and edges connect bumps with distance < threshold
-            graph = defaultdict(list)
-            
-            # Check if each point has at least one connection
-            has_connection = [False] * len(bumps)
-            
-            # Build the graph
-            for i in range(len(bumps)):
-                for j in range(i+1, len(bumps)):  # Only check each pair once
-                    if euclidean_distance(bumps[i], bumps[j]) < threshold:
-                        graph[i].append(j)
-                        graph[j].append(i)
-                        has_connection[i] = True
-                        has_connection[j] = True
-            
-            # Check if any point has no connections
-            if not all(has_connection):
-                return False
-            
-            # Use BFS to check if the graph is connected
-            # Start from the first point (index 0)
-            visited = [False] * len(bumps)
-            queue = deque([0])
-            visited[0] = True
-            
-            while queue:
-                node = queue.popleft()
-                for neighbor in graph[node]:
-                    if not visited[neighbor]:
-                        visited[neighbor] = True
-                        queue.append(neighbor)
-            
-            # If all nodes are visited, the graph is connected
-            return all(visited)
+def Read_Solution_Dictionary(Solution_Dictionary_file_name):
+    """
+    This function reads back a solution dictionary written by Write_Solution_Dictionary.
+    """
+    df = pd.read_csv(Solution_Dictionary_file_name, dtype={'ID': str})
+    return {ID: [RepairChain, ast.literal_eval(Repair_Solution)] for ID, RepairChain, Repair_Solution in zip(df['ID'], df['RepairChain'], df['Repair_Solution'])}
 
-    # Convert the df_bump as a list of Series. Each containing the informations of a connections=
-    all_bumps = [df_bump.iloc[i] for i in range(len(df_bump))]
+def New_Solution_Cache(Max_Size):
+    """
+    This function creates a cache of the solutions of the repair chains, shared by the faults of an analysis.
+    The solution of a repair chain only depends on its PFS to route and on which of its connections are faulty, so the faults
+    touching a repair chain in the same way (for example all the shorts of a data bump with a benign neighbour) reuse the same solution.
+    The cache keeps the Max_Size solutions used most recently, None being the solution of a repair chain that cannot be repaired.
+    A cache is only valid for one Route_Table.
 
-    # Check if n_bumps is valid
-    if Shorted_Bumps_Number < 1 or Shorted_Bumps_Number > len(all_bumps):
-        raise ValueError(f"Shorted_Bumps_Number must be between 1 and {len(all_bumps)}")
-    
-    # Set the number of bumps that will be affected by the fault.  
-    if Fault_Type == 'Open':
-        Bumps_Number = 1
+    Parameters:
+    - Max_Size (int): Maximum number of solutions kept.
 
-    if Fault_Type == 'Short':
-        Bumps_Number = Shorted_Bumps_Number
+    Returns:
+    - dict: The cache, or None if Max_Size is 0.
+    """
+    if Max_Size <= 0:
+        return None
+    return {'Max_Size': Max_Size, 'Entries': OrderedDict(), 'Connections': {}, 'Chains': {}}
 
-    # Test each combination
-    # The first use of combinations is for the short faults. For example, for the 3-bump short, we will check every combination of three connections (Bumps_Number)
-    # The second use of combinations is for the multiple fault scenario. For example, for the two 2-bump short, we will check every combination of two combinations (Faults_Number) of two connections
-    for combo_of_combo in combinations(combinations(range(len(all_bumps)), Bumps_Number), Faults_Number):  
-
-        index_list = []
-        for combo_index in combo_of_combo:
-         
-            # FIXME : Does not work for scenarios with multiple short faults. The code puts the indices of each connection in the same list.
-            # A double short with two connections will be treated as a short with 4 connections.
-            # Furthermore, in two different short (happening at the same time): the same connection may appear twice.
-            for index in combo_index:
-                index_list.append(index)
-            
-        combo_bumps = [all_bumps[i] for i in index_list]
-     
-        # Initialize a flag to determine if the fault is valid
-        FaultFlag = True
-        # If the fault type is 'Short', check if the bumps form a valid short
-        if Fault_Type == 'Short':
-            FaultFlag = is_short(combo_bumps, Short_Distance)
-
-        # If the FaultFlag is True, proceed with the fault analysis
-        if FaultFlag == True:
-            # Initialize lists and variables to store fault information
-            new_row = []
-            Chain_list = []
-            Route_Table_copy = Route_Table.copy()
-            fault = []
-            Repair_Type = 'Benign'
-            GNDFlag = False
-            POWERFlag = False
-
-            # Iterate through each bump in the combination of bumps
-            for bump in combo_bumps:  
-                # Add the bump name to the fault list
-                fault.append(bump['Name'])  
-
-                # Check if the fault is catastrophic
-                if bump['Type'] == 'GND':
-                    GNDFlag = True
-                if bump['Type'] == 'POWER':
-                    POWERFlag = True
-                if POWERFlag == True and GNDFlag == True and Fault_Type == 'Short':
-                    Repair_Type = 'Catastrophic'
-
-                # Generate a list containing the involved repair chains 
-                if not Route_Table[(Route_Table['Connection'] == bump['Name'])]['RepairChain'].empty:
-                    RepairChain = Route_Table[(Route_Table['Connection'] == bump['Name'])]['RepairChain'].values[0]
-                    Chain_list.append(RepairChain)
-
-                # If the bump is a spare, update its type to 'SPARE'
-                if bump['Spare'] == True:
-                    bump = bump.copy()
-                    bump['Type'] = 'SPARE'
-
-                # If the bump does not have a default route and is not of type 'DATA', update its type to 'NONE' # HBM2 Mode 1 DBI specifics
-                if Route_Table_copy[(Route_Table_copy['Connection'] == bump['Name']) & (Route_Table_copy['Status'] == 'Default')].empty and bump['Type'] != 'DATA':
-                    bump = bump.copy()
-                    bump['Type'] = 'NONE'
-
-                # Check if the fault needs a repair action
-                if fault_reparation[bump['Type']] == 'Repair' and Fault_Type != 'Catastrophic':
-                    Repair_Type = 'Repair'
-
-            # Add the fault information to the new row
-            new_row.insert(0, set(Chain_list))
-            new_row.insert(0, Repair_Type)
-            new_row.insert(0, fault)
-
-            # Append the new row to the Fault_Table
-            Fault_Table = Fault_Table._append([new_row], ignore_index=True)
-
-    Fault_Table = Fault_Table.rename(columns={0: 'Fault', 1: 'Repair_Type', 2: 'Chain_list'})
-    Fault_Table.set_index('Fault')
-    Fault_Table.to_csv(Fault_Table_file_name, index=True)
+def Solution_Cache_Lookup(Solution_Cache, Cache_Key):
+    """
+    This function checks if the solution of a repair chain is in the cache, and marks it as used most recently.
+    """
+    if Cache_Key in Solution_Cache['Entries']:
+        Solution_Cache['Entries'].move_to_end(Cache_Key)
+        Profile_Count('Solution cache hits')
+        return True
+    Profile_Count('Solution cache misses')
+    return False
+
+def Solution_Cache_Store(Solution_Cache, Cache_Key, Repair_Solution):
+    """
+    This function adds the solution of a repair chain to the cache, removing the solution used least recently if the cache is full.
+    """
+    Solution_Cache['Entries'][Cache_Key] = Repair_Solution
+    if len(Solution_Cache['Entries']) > Solution_Cache['Max_Size']:
+        Solution_Cache['Entries'].popitem(last=False)
 
-    return Fault_Table
-            
-def Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, Faults_Number, Interface_IRL_file_name, Reparability_Table_file_name, Fault_Table_file_name, Print_Fault):
+def Faulty_Connection_RepairChain(connection, Route_Table, df_bump):
     """
-    This function generates repair statistics using a logic solver.
-    It first generates a fault table using the Fault_Table_Generator function.
-    Then, it iterates over each fault in the fault table, determines the reparability of the fault using the LogicSolver function,
-    and updates the repair type in the fault table.
-    Finally, it calculates and prints the repair statistics and saves the repair table to a CSV file.
+    This function returns the repair chain rerouted when a connection is faulty, None if the connection does not need a repair action
+    (not a functional bump, or a spare).
     """
-    # Generate the fault table using the Fault_Table_Generator function
-    Fault_Table = Fault_Table_Generator(Interface_IRL_file_name, BumpMap_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name)
+    # Define a list of functional types that require routing
+    Functionnal_type_list = ['DATA', 'ADDR', 'SIDEBAND', 'CLK']
 
-    # Load the route table and bumpmap 
-    Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
-    df_bump = Avoid_bump_name_iteration(BumpMap_file_name)  
+    # Get the bump details from the DataFrame
+    bump = df_bump[df_bump['Name'] == connection]
+    if bump['Type'].values[0] in Functionnal_type_list and bump['Spare'].values[0] != True:
+        return Route_Table[(Route_Table['Connection'] == connection)]['RepairChain'].values[0]
+    return None
 
-    # Iterate over each fault in the fault table
-    for index, Fault_row in Fault_Table.iterrows():
-        # Extract the fault information
-        fault = Fault_row['Fault']
-        Chain_list = list(set(Fault_row['Chain_list']))
-        Repair_Type = Fault_row['Repair_Type']
+def RepairChain_Routing(RepairChain, Route_Table, df_bump):
+    """
+    This function returns what the RecursiveSolver needs to reroute a repair chain, whatever the fault.
 
-        if Print_Fault: 
-            print(fault)
+    Returns:
+    - dict: 'PFS' the list of PFS to route (the signals of the non spare connections of the chain, in the order of the Route_Table),
+      'Position' the position of each of them in this list, 'Connections' the set of the connections of their routes,
+      and 'Routes' the rows of the Route_Table of their routes.
+    """
+    # Spare flag of each connection, the first bump of a name being used as in Repair_Solution_of_Fault
+    Spare_of = df_bump.drop_duplicates('Name').set_index('Name')['Spare']
+    Chain_Routes = Route_Table[(Route_Table['RepairChain'] == RepairChain)]
 
-        # If the repair type is 'Repair', determine the reparability using the LogicSolver function
-        if Repair_Type == 'Repair':
-            Repair_Type = LogicSolver(Chain_list, Route_Table, df_bump, fault)
+    PFS_list = []
+    for Connection, Signal in zip(Chain_Routes['Connection'], Chain_Routes['Signal']):
+        # Check if the connection is not a spare and is not already in the PFS_list
+        if Spare_of[Connection] != True and Signal not in PFS_list:
+            PFS_list.append(Signal)
 
-        # Update the repair type in the fault table
-        Fault_row['Repair_Type'] = Repair_Type
+    Routes = Route_Table[(Route_Table['Signal'].isin(PFS_list))]
+    return {'PFS': PFS_list, 'Position': {PFS: position for position, PFS in enumerate(PFS_list)},
+            'Connections': set(Routes['Connection']), 'Routes': Routes}
 
-    # Create a copy of the fault table to use as the repair table
-    Repair_Table = Fault_Table.copy()
+def Repair_Solution_of_Fault(fault, Route_Table, df_bump, Default_Configuration_Table=None, Solution_Cache=None):
+    """
+    This function searches a repair solution for a fault that needs a repair action, using the RecursiveSolver.
+    Each affected repair chain is solved separately, the routes ending on a faulty connection being removed.
 
-    # Calculate the number of repairable, benign, catastrophic, and unrepairable faults
-    Repairable_fault = len(Repair_Table[(Repair_Table['Repair_Type'] == 'Repairable')])
-    Benign_fault = len(Repair_Table[(Repair_Table['Repair_Type'] == 'Benign')])
-    Catastrophic_fault = len(Repair_Table[(Repair_Table['Repair_Type'] == 'Catastrophic')])
-    Unrepairable_fault = len(Repair_Table[(Repair_Table['Repair_Type'] == 'Unrepairable')])
-    Total_fault = len(Repair_Table)
+    Parameters:
+    - fault (list): List of faulty connections.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - Default_Configuration_Table (dict): If given, the default configuration of each repair chain, the solutions being encoded as deltas from it (see Encode_Repair_Solution).
+    - Solution_Cache (dict): If given, the cache of the solutions of the repair chains (see New_Solution_Cache), the repair chains already solved
+      for the same faulty connections being taken from it instead of being solved again. The repair chain of each faulty connection and the routing
+      of each repair chain (see RepairChain_Routing) are also kept in it, so a cache hit does not touch the DataFrames.
 
-    # Calculate the reparability percentage
-    Reparability_percentage = (Repairable_fault + Benign_fault) / Total_fault * 100
-    print(f'Repair Statistics using LogicSolver : Total faults : {Total_fault} , Repairable faults : {Repairable_fault}, Benign faults :  {Benign_fault}, Catastrophic faults : {Catastrophic_fault}, Unrepairable faults : {Unrepairable_fault}, {Reparability_percentage}%')
+    Returns:
+    - tuple: (Repair_Type, Solution_Total), 'Repairable' or 'Unrepairable', and the list of [RepairChain, [[mux, sel], ...]]
+      solutions of the affected repair chains.
+    """
+    # Repair chain of the faulty connections and routing of the repair chains, kept across faults by the cache
+    Connection_RepairChain = Solution_Cache['Connections'] if Solution_Cache is not None else {}
+    Routing = Solution_Cache['Chains'] if Solution_Cache is not None else {}
 
-    # Save the Repair_Table to a CSV file
-    Repair_Table.to_csv(Reparability_Table_file_name, index=True)
+    # Map each repair chain affected to its list of Physical Functional Sources (PFS) to route
+    PFS_to_route_dict = {}
 
-    # Return the Repair_Table DataFrame
-    return Repair_Table
+    # Iterate over each connection in the fault list
+    for connection in fault:
+        if connection not in Connection_RepairChain:
+            Connection_RepairChain[connection] = Faulty_Connection_RepairChain(connection, Route_Table, df_bump)
+        faulty_bump_RepairChain = Connection_RepairChain[connection]
+
+        if faulty_bump_RepairChain is not None:
+            if faulty_bump_RepairChain not in Routing:
+                Routing[faulty_bump_RepairChain] = RepairChain_Routing(faulty_bump_RepairChain, Route_Table, df_bump)
+            PFS_to_route_list = Routing[faulty_bump_RepairChain]['PFS']
+
+            # If the bump signal is in the PFS_to_route_list and is in the second half of the list, reverse the list, to accelerate the solver.
+            # The signal name is the connection name without the '_phy' suffix
+            position = Routing[faulty_bump_RepairChain]['Position'].get(connection.replace('_phy',''))
+            if position is not None and position > len(PFS_to_route_list)/2:
+                PFS_to_route_list = list(reversed(PFS_to_route_list))
+
+            # Add the PFS_to_route_list to the PFS_to_route_dict with the repair chain as the key
+            PFS_to_route_dict[faulty_bump_RepairChain] = PFS_to_route_list
+
+    # Initialize a list to store repair chains
+    Solution_Total = []
+    Repair_Flag = True
+    Repair_Type = 'Unrepairable'
+
+    # Iterate over each repair chain and its associated PFS list in the PFS_to_route_dict
+    for RepairChain, PFS_to_route_list in PFS_to_route_dict.items():
+   
+        if Repair_Flag == True:
+
+            # The solution of a repair chain only depends on its PFS to route, in this order, and on its faulty connections
+            Cache_Key = None
+            if Solution_Cache is not None:
+                Chain_Connections = Routing[RepairChain]['Connections']
+                Cache_Key = (RepairChain, tuple(PFS_to_route_list), frozenset(connection for connection in fault if connection in Chain_Connections))
+
+            if Cache_Key is not None and Solution_Cache_Lookup(Solution_Cache, Cache_Key):
+                Repair_Solution = Solution_Cache['Entries'][Cache_Key]
+            else:
+                # Routes of the PFS of the repair chain, without the routes ending on a faulty connection
+                Chain_Route_Table = Routing[RepairChain]['Routes']
+                Chain_Route_Table = Chain_Route_Table[~Chain_Route_Table['Connection'].isin(fault)]
+
+                # Initialize a dictionary to store all possible solutions for the repair chain
+                Solutions_dict_per_RepairChain = defaultdict(list)
+
+                # Initialize a DataFrame to store the current solution
+                Solution = pd.DataFrame(columns=['Signal', 'Connection', 'Mux', 'Sel', 'Status'])
+
+                # Initialize lists to keep track of used Interconnect Sources (IS) and routed Physical Functional Sources (PFS)
+                Used_IS_list = []
+                Routed_PFS_list = []
+
+                # Start the recursive solver with an empty list                       
+                # This will initiate the recursive process to find all possible routing solutions for the given PFS list.
+                RecursiveSolver(Used_IS_list, Routed_PFS_list, PFS_to_route_list, 0, Solution, Solutions_dict_per_RepairChain, Chain_Route_Table, Repair_Type)
+
+                # No solution is recorded as None
+                Repair_Solution = None
+                if len(Solutions_dict_per_RepairChain) > 0:
+                    Repair_Solution = [] 
+
+                    # Iterate over each solution in the Solutions_dict_per_RepairChain
+                    # This loop will extract the mux and sel values from each solution.
+                    for Solution_key, Solution_value in Solutions_dict_per_RepairChain.items():
+                        # Iterate over each mux and sel in the solution value
+                        # This nested loop will append each mux and sel pair to the Repair_Solution list.
+                        for mux, sel in Solution_value.items():
+                            # Append the mux and sel to the new solution list
+                            Repair_Solution.append([mux, sel])
+                        # Insert the repair chain at the beginning of the new solution list
+                        # This will ensure that the repair chain is associated with the solution.
+                        Repair_Solution = [RepairChain, Repair_Solution]
+
+                if Cache_Key is not None:
+                    Solution_Cache_Store(Solution_Cache, Cache_Key, Repair_Solution)
+ 
+            # Check if any solutions were found
+            # If no solutions are found, mark the fault as unrepairable.
+            if Repair_Solution is None:
+                Repair_Flag = False
+                Repair_Type = 'Unrepairable'
+            else:
+                Repair_Type = 'Repairable'
+                Solution_Total.insert(0, Repair_Solution)
+
+    if Default_Configuration_Table is not None:
+        Solution_Total = Encode_Repair_Solution(Solution_Total, Default_Configuration_Table)
+
+    return Repair_Type, Solution_Total
 
-def Repair_Solutions_using_RecursiveSolver(BumpMap_file_name, Interface_IRL_file_name, Repair_Solutions_Table_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name, Print_Fault):
+def Repair_Solutions_using_RecursiveSolver(BumpMap_file_name, Interface_IRL_file_name, Repair_Solutions_Table_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name, Print_Fault,
+                                           Checkpoint_Interval=0, Checkpoint_file_name=None, Resume=False, Solution_Encoding='Full',
+                                           Intern_Solutions=False, Solution_Dictionary_file_name=None, Solution_Cache_Size=100000, Reuse=False):
     """
     This function generates repair solutions using a recursive solver. It first generates a fault table using the Fault_Table_Generator function.
     Then, it iterates over each fault in the fault table, determines the reparability of the fault using the RecursiveSolver function,
     and updates the repair type in the fault table. Finally, it calculates and prints the repair statistics and saves the repair solutions table to a CSV file.
+    With Checkpoint_Interval or Resume, the analysis is checkpointed and can be resumed (see Checkpointed_Fault_Analysis).
+    With the 'Delta' Solution_Encoding, the solutions are stored as deltas from the default configuration of each repair chain (see Encode_Repair_Solution
+    and Decode_Repair_Solution).
+    With Intern_Solutions, the table only gives the ID of the solution of each repair chain, and each distinct solution is written once
+    to the solution dictionary Solution_Dictionary_file_name (see Intern_Repair_Solution).
+    The solutions of the repair chains are cached and reused by the faults touching a repair chain in the same way (see New_Solution_Cache),
+    Solution_Cache_Size being the maximum number of solutions kept (0 to solve every fault).
+    With Reuse, the Repair_Solutions_Table, or else the Fault_Table, already written for the same interface, fault model and encoding is read instead
+    of being computed (see Reusable_Table).
     """
+    if Solution_Encoding not in ['Full', 'Delta']:
+        raise ValueError(f'Unknown solution encoding {Solution_Encoding}, choose Full or Delta')
+
+    Fingerprint = Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                                    Solution_Encoding=Solution_Encoding, Intern_Solutions=Intern_Solutions)
+    Dependencies = [Solution_Dictionary_file_name] if Intern_Solutions else []
+    if Reuse and Reusable_Table(Repair_Solutions_Table_file_name, Fingerprint, Dependencies):
+        print(f'Reusing the Repair_Solutions_Table {Repair_Solutions_Table_file_name}')
+        with Profile_Stage('Reading tables'):
+            Repair_Solutions_Table = Read_Fault_Table(Repair_Solutions_Table_file_name)
+        Print_Repair_Statistics('RecursiveSolver', Repair_Solutions_Table)
+        return Repair_Solutions_Table
+
+    if Checkpoint_Interval > 0 or Resume:
+        Repair_Solutions_Table, Statistics = Checkpointed_Fault_Analysis(BumpMap_file_name, Interface_IRL_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type,
+                                                                         Fault_Table_file_name, Repair_Solutions_Table_file_name, 'RecursiveSolver', Checkpoint_file_name, Checkpoint_Interval, Resume, Print_Fault,
+                                                                         Solution_Encoding, Intern_Solutions, Solution_Dictionary_file_name, Solution_Cache_Size, Reuse)
+        Print_Repair_Counts('RecursiveSolver', Statistics, sum(Statistics.values()))
+        return Repair_Solutions_Table
+
 
     # Generate the fault table using the Fault_Table_Generator function
-    Fault_Table = Fault_Table_Generator(Interface_IRL_file_name, BumpMap_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name)
+    Fault_Table = Fault_Table_Generator(Interface_IRL_file_name, BumpMap_file_name, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name, Reuse)
 
     # Load the route table and bumpmap
-    Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
-    df_bump = Avoid_bump_name_iteration(BumpMap_file_name) 
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name) 
+    Configurations = Default_Configurations(Route_Table) if Solution_Encoding == 'Delta' else None
+    Solution_Dictionary = {}
+    Solution_Cache = New_Solution_Cache(Solution_Cache_Size)
     
     # Initialize an empty DataFrame to store repair solutions
     Repair_Solutions_Table = pd.DataFrame()
 
-    # Define a list of functional types that require routing
-    Functionnal_type_list = ['DATA', 'ADDR', 'SIDEBAND', 'CLK']
-
     # Iterate over each row in the fault table
+    Progress_Start('RecursiveSolver', len(Fault_Table))
     for Fault_index, Fault_row in Fault_Table.iterrows():
         
-        Route_Table_copy = Route_Table.copy()
         new_row = []
         Chain_list = list(set(Fault_row['Chain_list']))
         fault = Fault_row['Fault']
@@ -1053,103 +4077,11 @@ def Repair_Solutions_using_RecursiveSolver(BumpMap_file_name, Interface_IRL_file
 
         # Check if a repair action is needed
         if Repair_Type == 'Repair':
-        # if fault == ['rxdata32_phy', 'rxvldRD_phy'] or fault == ['VSS_phy_18', 'rxdata0_phy']:
-
-            # Initialize a dictionary to map Physical Functional Sources (PFS) to their possible routes
-            PFS_to_route_dict = defaultdict(list)
-
-            # Iterate over each connection in the fault list
-            for connection in fault:
 
-                # Get the bump details from the DataFrame
-                bump = df_bump[df_bump['Name'] == connection]
-                # Extract the signal name by removing the '_phy' suffix
-                bump_signal = bump['Name'].values[0].replace('_phy','')
-                # Initialize a list to store the PFS that need to be routed
-                PFS_to_route_list = []
-
-                # Check if the bump type is in the list of functional types and is not a spare
-                if bump['Type'].values[0] in Functionnal_type_list and bump['Spare'].values[0] != True:
-                    # Get the repair chain associated with the faulty bump
-                    faulty_bump_RepairChain = Route_Table[(Route_Table['Connection'] == bump['Name'].values[0])]['RepairChain'].values[0]
-                    # Get the PFS to reroute for the repair chain
-                    PFS_to_route = Route_Table[(Route_Table['RepairChain'] == faulty_bump_RepairChain)]
-
-                    # Iterate over each PFS to route
-                    for index, PFS in PFS_to_route.iterrows():
-                        # Check if the connection is not a spare and is not already in the PFS_to_route_list
-                        if df_bump.loc[df_bump['Name'] == PFS['Connection'], 'Spare'].values[0] != True and PFS['Signal'] not in PFS_to_route_list:
-                            # Add the signal to the PFS_to_route_list
-                            PFS_to_route_list.append(PFS['Signal'])
-
-                    # If the bump signal is in the PFS_to_route_list and is in the second half of the list, reverse the list, to accelerate the solver. 
-                    if bump_signal in PFS_to_route_list and PFS_to_route_list.index(bump_signal) > len(PFS_to_route_list)/2:
-                        PFS_to_route_list = list(reversed(PFS_to_route_list))
-
-                    # Add the PFS_to_route_list to the PFS_to_route_dict with the repair chain as the key
-                    PFS_to_route_dict[faulty_bump_RepairChain] = PFS_to_route_list
-
-                # Filter the Route_Table to exclude the current bump connection
-                Route_Table_copy = Route_Table_copy[(Route_Table_copy['Connection'] != bump['Name'].values[0])]
-
-            # Initialize a list to store unique PFS that need to be routed
-            PFS_filter_list = []
-    
-            # Iterate over each repair chain and its associated PFS list in the PFS_to_route_dict
-            for RepairChain, PFS_list in PFS_to_route_dict.items():
-                for PFS in PFS_list:
-                    # If the PFS is not already in the PFS_filter_list, add it
-                    if PFS not in PFS_filter_list:
-                        PFS_filter_list.append(PFS)
-
-            # Filter Route_Table with the PFS we want to repair
-            Route_Table_copy = Route_Table_copy[(Route_Table_copy['Signal'].isin(PFS_filter_list))]
-
-            # Initialize a list to store repair chains
-            Solution_Total = []
-            Repair_Flag = True
-            Repair_Type = 'Unrepairable'
-
-            # Iterate over each repair chain and its associated PFS list in the PFS_to_route_dict
-            for RepairChain, PFS_to_route_list in PFS_to_route_dict.items():
-           
-                if Repair_Flag == True:
-                    
-                    # Initialize a dictionary to store all possible solutions for the repair chain
-                    Solutions_dict_per_RepairChain = defaultdict(list)
-
-                    # Initialize a DataFrame to store the current solution
-                    Solution = pd.DataFrame(columns=['Signal', 'Connection', 'Mux', 'Sel', 'Status'])
-
-                    # Initialize lists to keep track of used Interconnect Sources (IS) and routed Physical Functional Sources (PFS)
-                    Used_IS_list = []
-                    Routed_PFS_list = []
-
-                    # Start the recursive solver with an empty list                       
-                    # This will initiate the recursive process to find all possible routing solutions for the given PFS list.
-                    RecursiveSolver(Used_IS_list, Routed_PFS_list, PFS_to_route_list, 0, Solution, Solutions_dict_per_RepairChain, Route_Table_copy, Repair_Type)
-         
-                    # Check if any solutions were found
-                    # If no solutions are found, mark the fault as unrepairable.
-                    if len(Solutions_dict_per_RepairChain) == 0:
-                        Repair_Flag = False
-                        Repair_Type = 'Unrepairable'
-                    else:
-                        Repair_Type = 'Repairable'
-                        Repair_Solution = [] 
-
-                        # Iterate over each solution in the Solutions_dict_per_RepairChain
-                        # This loop will extract the mux and sel values from each solution.
-                        for Solution_key, Solution_value in Solutions_dict_per_RepairChain.items():
-                            # Iterate over each mux and sel in the solution value
-                            # This nested loop will append each mux and sel pair to the Repair_Solution list.
-                            for mux, sel in Solution_value.items():
-                                # Append the mux and sel to the new solution list
-                                Repair_Solution.append([mux, sel])
-                            # Insert the repair chain at the beginning of the new solution list
-                            # This will ensure that the repair chain is associated with the solution.
-                            Repair_Solution = [RepairChain, Repair_Solution]
-                        Solution_Total.insert(0, Repair_Solution)
+            with Profile_Stage('RecursiveSolver'):
+                Repair_Type, Solution_Total = Repair_Solution_of_Fault(fault, Route_Table, df_bump, Configurations, Solution_Cache)
+            if Intern_Solutions:
+                Solution_Total = Intern_Repair_Solution(Solution_Total, Solution_Dictionary)
 
             # Insert the Solution for all the repair chain in the new row
             new_row.insert(0, Solution_Total)
@@ -1161,51 +4093,129 @@ def Repair_Solutions_using_RecursiveSolver(BumpMap_file_name, Interface_IRL_file
        
         # Build the new table row per row
         Repair_Solutions_Table = Repair_Solutions_Table._append([new_row], ignore_index=True)
+        Progress_Update(Repair_Type)
+    Progress_End()
     
     # Rename and set the index to the 'Fault' column
     Repair_Solutions_Table = Repair_Solutions_Table.rename(columns={0: 'Fault', 1: 'Repair_Type', 2: 'Chain_list', 3: 'Repair_Solutions'})
     Repair_Solutions_Table.set_index('Fault')
 
-    # Calculate the total number of faults
-    Total_fault = len(Repair_Solutions_Table['Repair_Type'])
-
-    # Calculate the number of repairable faults
-    Repairable_fault = len(Repair_Solutions_Table[(Repair_Solutions_Table['Repair_Type'] == 'Repairable')])
-
-    # Calculate the number of benign faults
-    Benign_fault = len(Repair_Solutions_Table[(Repair_Solutions_Table['Repair_Type'] == 'Benign')])
-
-    # Calculate the number of catastrophic faults
-    Catastrophic_fault = len(Repair_Solutions_Table[(Repair_Solutions_Table['Repair_Type'] == 'Catastrophic')])
-
-    # Calculate the number of unrepairable faults
-    Unrepairable_fault = len(Repair_Solutions_Table[(Repair_Solutions_Table['Repair_Type'] == 'Unrepairable')])
-
-    # Calculate the reparability percentage
-    Reparability_percentage = (Repairable_fault + Benign_fault) / Total_fault * 100
-
     # Save the Repair_Solutions_Table to a CSV file
-    Repair_Solutions_Table.to_csv(Repair_Solutions_Table_file_name, index=True)
+    with Profile_Stage('Writing tables'):
+        Repair_Solutions_Table.to_csv(Repair_Solutions_Table_file_name, index=True)
+        if Intern_Solutions:
+            Write_Solution_Dictionary(Solution_Dictionary, Solution_Dictionary_file_name)
+        if Reuse:
+            Write_Table_Fingerprint(Repair_Solutions_Table_file_name, Fingerprint, Dependencies)
 
     # Print the repair statistics
-    print(f'RecursiveSolver : Total faults : {Total_fault} , Repairable faults : {Repairable_fault}, Benign faults :  {Benign_fault}, Catastrophic faults : {Catastrophic_fault}, Unrepairable faults : {Unrepairable_fault}, {Reparability_percentage}%')
+    Print_Repair_Statistics('RecursiveSolver', Repair_Solutions_Table)
     
     # Return the Repair_Solutions_Table DataFrame
     return Repair_Solutions_Table
 
+def Single_Pass_Analysis(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Table_file_name,
+                         Reparability_Table_file_name=None, Repair_Solutions_Table_file_name=None, Print_Fault=False, Solution_Encoding='Full',
+                         Intern_Solutions=False, Solution_Dictionary_file_name=None, Solution_Cache_Size=100000, Reuse=False):
+    """
+    This function runs Repair_Statistics_using_LogicSolver and Repair_Solutions_using_RecursiveSolver in a single pass : the interface is loaded once,
+    the faults are enumerated and classified once, by batches, and each batch is given to both solvers.
+    The Fault_Table, the Repair_Table and the Repair_Solutions_Table are the same as those of the two functions, and the Fault_Table is written once.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file.
+    - Interface_IRL_file_name (str): Path to the IRL file.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Fault_Table_file_name (str): Path to the CSV file of the Fault_Table.
+    - Reparability_Table_file_name (str): Path to the CSV file of the Repair_Table.
+    - Repair_Solutions_Table_file_name (str): Path to the CSV file of the Repair_Solutions_Table, or None to only run the LogicSolver.
+    - Print_Fault (bool): Flag to print every fault.
+    - Solution_Encoding, Intern_Solutions, Solution_Dictionary_file_name, Solution_Cache_Size: See Repair_Solutions_using_RecursiveSolver.
+    - Reuse (bool): Flag to write the fingerprints of the tables, to reuse them in a later run (see Reusable_Table).
+
+    Returns:
+    - tuple: (Repair_Table, Repair_Solutions_Table), Repair_Solutions_Table being None without Repair_Solutions_Table_file_name.
+    """
+    if Solution_Encoding not in ['Full', 'Delta']:
+        raise ValueError(f'Unknown solution encoding {Solution_Encoding}, choose Full or Delta')
+    Solutions_Flag = Repair_Solutions_Table_file_name is not None
+
+    # Load the interface once, for the enumeration and both solvers
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Model = Interface_Model(df_bump, Route_Table)
+    Classes = Model['Classes']
+    Index_of = {name: index for index, name in enumerate(Model['Names'])}
+    Configurations = Default_Configurations(Route_Table) if Solution_Encoding == 'Delta' else None
+    Solution_Dictionary = {}
+    Solution_Cache = New_Solution_Cache(Solution_Cache_Size)
+
+    # Each batch of faults is classified, then solved by the LogicSolver rule and by the RecursiveSolver
+    rows = []
+    Repair_Types = []
+    Solutions_rows = []
+    with Profile_Stage('Fault enumeration and classification'):
+        Faults = Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Progress=True)
+        while Batch := list(islice(Faults, Fault_Batch_Size)):
+            with Profile_Stage('Fault classification'):
+                Batch_rows = Classify_Fault_Rows(Classes, Batch, Fault_Type)
+            rows.extend(Batch_rows)
+            if Print_Fault:
+                for fault, Repair_Type, Chain_list in Batch_rows:
+                    print(fault)
+
+            with Profile_Stage('LogicSolver'):
+                Batch_Types = [Repair_Type for fault, Repair_Type, Chain_list in Batch_rows]
+                Repair_Positions = [position for position, Repair_Type in enumerate(Batch_Types) if Repair_Type == 'Repair']
+                Repair_Faults = [[Index_of[name] for name in Batch_rows[position][0]] for position in Repair_Positions]
+                for position, Repair_Type in zip(Repair_Positions, Model_Repair_Types(Model, Repair_Faults)):
+                    Batch_Types[position] = Repair_Type
+            Repair_Types.extend(Batch_Types)
+
+            if Solutions_Flag:
+                for fault, Repair_Type, Chain_list in Batch_rows:
+                    Solution_Total = None
+                    if Repair_Type == 'Repair':
+                        with Profile_Stage('RecursiveSolver'):
+                            Repair_Type, Solution_Total = Repair_Solution_of_Fault(fault, Route_Table, df_bump, Configurations, Solution_Cache)
+                        if Intern_Solutions:
+                            Solution_Total = Intern_Repair_Solution(Solution_Total, Solution_Dictionary)
+                    Solutions_rows.append([fault, Repair_Type, set(Chain_list), Solution_Total])
+            Progress_Update(Done=0, Tallies=Counter(Batch_Types))
+
+    Fault_Table = pd.DataFrame(rows, columns=['Fault', 'Repair_Type', 'Chain_list'])
+    Repair_Table = Fault_Table.copy()
+    Repair_Table['Repair_Type'] = Repair_Types
+    Fingerprint = Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance)
+    with Profile_Stage('Writing tables'):
+        for Table, Table_file_name in [(Fault_Table, Fault_Table_file_name), (Repair_Table, Reparability_Table_file_name)]:
+            Table.to_csv(Table_file_name, index=True)
+            if Reuse:
+                Write_Table_Fingerprint(Table_file_name, Fingerprint)
+    Print_Repair_Statistics('Repair Statistics using LogicSolver', Repair_Table)
+
+    Repair_Solutions_Table = None
+    if Solutions_Flag:
+        Repair_Solutions_Table = pd.DataFrame(Solutions_rows, columns=['Fault', 'Repair_Type', 'Chain_list', 'Repair_Solutions'])
+        with Profile_Stage('Writing tables'):
+            Repair_Solutions_Table.to_csv(Repair_Solutions_Table_file_name, index=True)
+            if Intern_Solutions:
+                Write_Solution_Dictionary(Solution_Dictionary, Solution_Dictionary_file_name)
+            if Reuse:
+                Write_Table_Fingerprint(Repair_Solutions_Table_file_name, Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number,
+                                        Shorted_Bumps_Number, Short_Distance, Solution_Encoding=Solution_Encoding, Intern_Solutions=Intern_Solutions),
+                                        [Solution_Dictionary_file_name] if Intern_Solutions else [])
+        Print_Repair_Statistics('RecursiveSolver', Repair_Solutions_Table)
+
+    return Repair_Table, Repair_Solutions_Table
+
 # Section 5 : Yield and Cost Analysis
 def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file_name, System_Analysis, Min_Yield, Max_Yield, Number_of_faults_tested, Number_of_electrical_yield_tested, Bundle_Flag, Log_Scale, seed=None):
 
-    fault_reparation = {
-        'POWER': 'Benign',
-        'GND': 'Benign',
-        'DATA': 'Repair', 
-        'CLK': 'Repair', 
-        'ADDR': 'Repair', 
-        'SIDEBAND': 'Repair', 
-        'SPARE': 'Benign', 
-        'NONE': 'Benign'}
-
     if seed is not None:
         random.seed(seed)
 
@@ -1242,74 +4252,19 @@ def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file
 
         # Shuffle the combinations to ensure randomness.
         random.shuffle(Faulty_Combinations)
+        Profile_Count('MetaCIRA faults tested', len(Faulty_Combinations))
 
-        # Iterate over each combination of faulty connections.
-        for Combination in Faulty_Combinations:
-            # Get the faulty connections from the DataFrame.
-            Faulty_Connections = df_bump.iloc[Combination].copy()
-            Chain_list = []
-            Route_Table_copy = Route_Table.copy()
-            fault = []
-            Repair_Type = 'Benign'
-            RepairFlag = False 
-
-            # If Bundle_Flag is True, use BundleSolver to determine reparability.
-            if Bundle_Flag:
-                # Iterate through every connections in the fault.
-                for index, bump in Faulty_Connections.iterrows(): 
-                    # Add the bump name to the fault list.
-                    fault.append(bump['Name'])
-                    # Check if the fault type requires repair.
-                    if fault_reparation[bump['Type']] == 'Repair':
-                        RepairFlag = True
-                # If any fault requires repair, determine the reparability using BundleSolver.
-                if RepairFlag == True:
-                    Repair_Type = BundleSolver(df_bump, fault, Route_Table)
-                    # If the fault is repairable, increment the repair counter.
-                    if Repair_Type == 'Repairable':
-                        RepairCounter += 1 
-                # If the fault is benign, increment the benign counter.
-                if Repair_Type == 'Benign':
-                    BenignCounter += 1
-
-            # If Bundle_Flag is False, use LogicSolver to determine reparability.
-            else:
-                # Iterate through each connection in the fault.
-                for index, bump in Faulty_Connections.iterrows(): 
-                    # Append the bump name to the fault list.
-                    fault.append(bump['Name'])
-                    # Generate a list containing the repair chains involved.
-                    if not Route_Table[(Route_Table['Connection'] == bump['Name'])]['RepairChain'].empty:
-                        RepairChain = Route_Table[(Route_Table['Connection'] == bump['Name'])]['RepairChain'].values[0]
-                        Chain_list.append(RepairChain)
-
-                    # If the bump is a spare, update its type to 'SPARE'.
-                    if bump['Spare'] == True:
-                        bump = bump.copy()
-                        bump['Type'] = 'SPARE'
-
-                    # If the bump does not have a default route and is not of type 'DATA', update its type to 'NONE'.
-                    if Route_Table_copy[(Route_Table_copy['Connection'] == bump['Name']) & (Route_Table_copy['Status'] == 'Default')].empty and bump['Type'] != 'DATA':
-                        bump = bump.copy()
-                        bump['Type'] = 'NONE'
-
-                    # If the bump type requires repair, set the RepairFlag to True.
-                    if fault_reparation[bump['Type']] == 'Repair':
-                        RepairFlag = True
-
-                # If the RepairFlag is True, determine the reparability using the LogicSolver function.
-                if RepairFlag == True:  
-                    # Remove duplicate repair chains from the Chain_list.
-                    Chain_list = list(set(Chain_list))
-                    Repair_Type = LogicSolver(Chain_list, Route_Table, df_bump, fault)
-
-                    # If the fault is repairable, increment the repair counter.
-                    if Repair_Type == 'Repairable':
-                        RepairCounter += 1 
-
-                # If the fault is benign, increment the benign counter.
-                if Repair_Type == 'Benign':
-                    BenignCounter += 1
+        # The faults are classified and solved with the model of the interface (see Interface_Model), by BundleSolver in the bundle mode
+        Model = Interface_Model(df_bump, Route_Table, Bundle_Flag)
+        for Fault_Class, Repair_Type, Chain_list in Model_Fault_Types(Model, Faulty_Combinations, 'Open'):
+            # If the fault is repairable, increment the repair counter.
+            if Repair_Type == 'Repairable':
+                RepairCounter += 1
+            # If the fault is benign, increment the benign counter.
+            if Repair_Type == 'Benign':
+                BenignCounter += 1
+
+            Progress_Update(Repair_Type)
 
         # Return the number of benign and repairable faults.
         return BenignCounter, RepairCounter
@@ -1359,6 +4314,8 @@ def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file
             Surface_repair = (Number_Spares/len(Interface_df_bump)) * Interface_Surface * Interface_Number
             Total_Surface_repair += Surface_repair
 
+    # One progress item per fault tested, for every electrical yield and interface
+    Progress_Start('MetaCIRA', Number_of_faults_tested * len(yield_range) * (len(System_description) if System_Analysis else 1))
     for Electrical_Yield in yield_range:  # Iterate over each electrical yield value in the yield range
 
         print(Electrical_Yield)  # Print the current electrical yield value for debugging purposes
@@ -1373,12 +4330,14 @@ def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file
                 Interface_BumpMap_file_name = System_description[interface]['BumpMap_file_name']  # Get the bump map file name for the current interface
                 Interface_IRL_file_name = System_description[interface]['IRL_file_name']  # Get the IRL file name for the current interface
 
-                Interface_df_bump = Avoid_bump_name_iteration(Interface_BumpMap_file_name)  # Load the bump information from the bump map file into a DataFrame
-                Interface_Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)  # Load the route table from the IRL file into a DataFrame
+                with Profile_Stage('Loading'):
+                    Interface_df_bump = Avoid_bump_name_iteration(Interface_BumpMap_file_name)  # Load the bump information from the bump map file into a DataFrame
+                    Interface_Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)  # Load the route table from the IRL file into a DataFrame
 
                 N = len(Interface_df_bump)  # Get the number of bumps in the current interface
 
-                BenignCounter, RepairCounter = Fault_Classifier(N, Number_of_faults_tested, Electrical_Yield, Interface_Route_Table, Interface_df_bump)  # Classify the faults and get the number of benign and repairable faults
+                with Profile_Stage('MetaCIRA fault classification'):
+                    BenignCounter, RepairCounter = Fault_Classifier(N, Number_of_faults_tested, Electrical_Yield, Interface_Route_Table, Interface_df_bump)  # Classify the faults and get the number of benign and repairable faults
 
                 yield_without_repair = BenignCounter/Number_of_faults_tested  # Calculate the yield without repair for the current interface
                 yield_with_repair = (RepairCounter + BenignCounter)/Number_of_faults_tested  # Calculate the yield with repair for the current interface
@@ -1394,8 +4353,9 @@ def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file
             Surface_ratio_list.append(Surface_ratio)  # Append the surface ratio to the list
 
         else:
-            Interface_df_bump = Avoid_bump_name_iteration(BumpMap_file_name)  
-            Interface_Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+            with Profile_Stage('Loading'):
+                Interface_df_bump = Avoid_bump_name_iteration(BumpMap_file_name)  
+                Interface_Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
             Number_Spares = len(Interface_df_bump[Interface_df_bump['Spare'] == True])
 
             max_X = max(Interface_df_bump['X']) # In µm²
@@ -1408,7 +4368,8 @@ def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file
 
             N = len(Interface_df_bump)
     
-            BenignCounter, RepairCounter = Fault_Classifier(N, Number_of_faults_tested, Electrical_Yield, Interface_Route_Table, Interface_df_bump)
+            with Profile_Stage('MetaCIRA fault classification'):
+                BenignCounter, RepairCounter = Fault_Classifier(N, Number_of_faults_tested, Electrical_Yield, Interface_Route_Table, Interface_df_bump)
             yield_without_repair = BenignCounter / Number_of_faults_tested
             yield_with_repair = (RepairCounter + BenignCounter) / Number_of_faults_tested
             yield_without_repair_list.append(yield_without_repair)
@@ -1418,6 +4379,8 @@ def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file
             # Surface_ratio = Wasted_Surface / Surface_repair
             # Surface_ratio_list.append(Surface_ratio) 
 
+    Progress_End()
+
     # Print the yield without repair and yield with repair lists for debugging purposes
     print(f'Interface yield without repair action : {yield_without_repair_list}')
     print(f'Interface yield with repair action : {yield_with_repair_list}')
@@ -1471,22 +4434,420 @@ def MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file
     print('Wrote graph to plot.svg')
     plt.show()
 
+    # Return the electrical yields and the interface yields without and with repair
+    return yield_range, yield_without_repair_list, yield_with_repair_list
 
-if Create_SVG:
-    Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name, Open_SVG, Bump_Diameter, Pitch, 
-    Input_X_scale, Input_Y_scale, Legend, Margin, Bump_Name, Stroke_Color, Font, Font_Size, Display_Reparability_SVG)
- 
-if Reparability_Statistics:
-    Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, 
-    Faults_Number, Interface_IRL_file_name, Reparability_Table_file_name, Fault_Table_file_name, Print_Fault)
 
-if Repair_Solutions:
-    Repair_Solutions_using_RecursiveSolver(BumpMap_file_name, Interface_IRL_file_name, Repair_Solutions_Table_file_name, 
-    Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name, Print_Fault)
+# Section 6 : Design Exploration
+
+def Apply_Interface_Modifications(df_bump, Route_Table, Modifications):
+    """
+    This function applies a list of modifications to copies of a bump map and of a route table, to describe a candidate design of the repair.
+    Each modification is a dictionary with a single key :
+    - Add_Bumps : list of bumps (Name, Type, Spare, X, Y and Bundle for the bundle interfaces) added to the bump map.
+    - Remove_Bumps : list of names of bumps removed from the bump map, with the routes to them.
+    - Move_Bumps : dictionary {Name: [X, Y]} of the new positions of bumps.
+    - Swap_Bumps : list of pairs of names of bumps whose positions are swapped.
+    - Add_Routes : list of routes (Signal, Connection, Mux, Sel, Status, RepairChain) added to the route table.
+    - Remove_Routes : list of filters, every route matching all the columns given in a filter is removed.
+    - Add_Spare : {RepairChain, Name, X, Y, Signals, and optionally Type (DATA), Mux, Bundle} adds a spare bump, with a repair route from each given signal,
+      the status of the route being the first free one among Repair, Repair_1, Repair_2... of the signal.
+    - Move_Signals : {Signals, RepairChain} moves the routes of the signals to another repair chain.
+    - Interleave_Chains : {RepairChains: [A, B]} swaps the positions of every second default connection of the two repair chains, in the order of the routes, to interleave the two chains.
+    - Bundle_Repair : {Bundle, Repair_Bundle} changes the repair bundle of a bundle, a null Repair_Bundle removing its repair route.
+
+    Parameters:
+    - df_bump (pd.DataFrame): DataFrame containing bump information.
+    - Route_Table (pd.DataFrame): DataFrame containing the route table with repair information.
+    - Modifications (list): The modifications, applied in order.
+
+    Returns:
+    - tuple: (df_bump, Route_Table), the modified copies.
+    """
+    df_bump = df_bump.copy()
+    Route_Table = Route_Table.copy()
+    coordinates = Coordinate_Columns(df_bump.columns)
+
+    def Row_of(name):
+        rows = np.flatnonzero(df_bump['Name'].to_numpy() == name)
+        if len(rows) == 0:
+            raise ValueError(f'Unknown bump {name}')
+        return rows[0]
+
+    def Add_Bumps(Bumps):
+        nonlocal df_bump
+        for bump in Bumps:
+            if (df_bump['Name'] == bump['Name']).any():
+                raise ValueError(f"The bump {bump['Name']} already exists")
+        df_bump = pd.concat([df_bump.astype({column: object for column in ['Type', 'Bundle'] if column in df_bump}), pd.DataFrame(Bumps)], ignore_index=True)
+
+    def Add_Routes(Routes):
+        nonlocal Route_Table
+        Route_Table = pd.concat([Route_Table, pd.DataFrame(Routes, columns=Route_Table.columns)], ignore_index=True).astype(object)
+
+    def New_Route(Signal, Connection, Mux, RepairChain, Status=None):
+        # First free repair status of the signal, and next input of the mux
+        if Status is None:
+            Status = 'Repair'
+            Statuses = set(Route_Table.loc[Route_Table['Signal'] == Signal, 'Status'])
+            k = 0
+            while Status in Statuses:
+                k += 1
+                Status = f'Repair_{k}'
+        Sel = f"m{(Route_Table['Mux'] == Mux).sum() + 1}"
+        return {'Signal': Signal, 'Connection': Connection, 'Mux': Mux, 'Sel': Sel, 'Status': Status, 'RepairChain': RepairChain}
+
+    for Modification in Modifications:
+        (Kind, Arguments), = Modification.items()
+        if Kind == 'Add_Bumps':
+            Add_Bumps(Arguments)
+        elif Kind == 'Remove_Bumps':
+            df_bump = df_bump[~df_bump['Name'].isin(Arguments)].reset_index(drop=True)
+            Route_Table = Route_Table[~Route_Table['Connection'].isin(Arguments)].reset_index(drop=True)
+        elif Kind == 'Move_Bumps':
+            for name, position in Arguments.items():
+                df_bump.loc[Row_of(name), coordinates] = [float(value) for value in position]
+        elif Kind == 'Swap_Bumps':
+            for first, second in Arguments:
+                rows = [Row_of(first), Row_of(second)]
+                df_bump.loc[rows, coordinates] = df_bump.loc[rows[::-1], coordinates].to_numpy()
+        elif Kind == 'Add_Routes':
+            Add_Routes(Arguments)
+        elif Kind == 'Remove_Routes':
+            for Filter in Arguments:
+                mask = np.ones(len(Route_Table), dtype=bool)
+                for column, value in Filter.items():
+                    mask &= (Route_Table[column] == value).to_numpy()
+                Route_Table = Route_Table[~mask].reset_index(drop=True)
+        elif Kind == 'Add_Spare':
+            bump = {'Name': Arguments['Name'], 'Type': Arguments.get('Type', 'DATA'), 'Spare': True, 'X': float(Arguments['X']), 'Y': float(Arguments['Y'])}
+            if 'Bundle' in Arguments:
+                bump['Bundle'] = Arguments['Bundle']
+            Add_Bumps([bump])
+            Mux = Arguments.get('Mux', Arguments['Name'].replace('_phy', '_mux'))
+            for Signal in Arguments['Signals']:
+                Add_Routes([New_Route(Signal, Arguments['Name'], Mux, Arguments['RepairChain'])])
+        elif Kind == 'Move_Signals':
+            Route_Table.loc[Route_Table['Signal'].isin(Arguments['Signals']), 'RepairChain'] = Arguments['RepairChain']
+        elif Kind == 'Interleave_Chains':
+            First, Second = [Route_Table.loc[(Route_Table['RepairChain'] == RepairChain) & (Route_Table['Status'] == 'Default'), 'Connection'].drop_duplicates().tolist()
+                             for RepairChain in Arguments['RepairChains']]
+            for i in range(1, min(len(First), len(Second)), 2):
+                rows = [Row_of(First[i]), Row_of(Second[i])]
+                df_bump.loc[rows, coordinates] = df_bump.loc[rows[::-1], coordinates].to_numpy()
+        elif Kind == 'Bundle_Repair':
+            Signal = Arguments['Bundle'].replace('_phy', '')
+            Route_Table = Route_Table[~((Route_Table['Signal'] == Signal) & (Route_Table['Status'] == 'Repair'))].reset_index(drop=True)
+            if Arguments.get('Repair_Bundle') is not None:
+                Default_Routes = Route_Table[(Route_Table['Signal'] == Signal) & (Route_Table['Status'] == 'Default')]
+                if Default_Routes.empty:
+                    raise ValueError(f"The bundle {Arguments['Bundle']} has no default route")
+                Add_Routes([New_Route(Signal, Arguments['Repair_Bundle'], Arguments['Repair_Bundle'].replace('_phy', '_mux'), Default_Routes['RepairChain'].values[0], 'Repair')])
+        else:
+            raise ValueError(f'Unknown modification {Kind}')
+
+    return Bump_Column_Types(df_bump), Route_Table
+
+def What_If_Base(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance):
+    """
+    This function loads the base interface of a design exploration once, with its single shorts (the short groups), which are reused by every candidate :
+    the shorts only depend on the positions of the bumps, so the shorts of a candidate are the shorts of the base between bumps at the same positions,
+    and the shorts containing a bump at a new position, searched around it.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file (or binary interface, see Write_Interface_Binary).
+    - Interface_IRL_file_name (str): Path to the IRL file (or binary interface).
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+
+    Returns:
+    - dict: 'df_bump', 'Route_Table', 'Position_Index' (the index of the bump at each position) and 'Shorts' (the shorts of the base, as sorted tuples of indices, or None if they are not reused).
+    """
+    with Profile_Stage('Loading'):
+        Route_Table = Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name)
+        df_bump = Avoid_bump_name_iteration(BumpMap_file_name)
+    Position_Index = {tuple(position): index for index, position in enumerate(Bump_Points(df_bump).tolist())}
+    Base = {'df_bump': df_bump, 'Route_Table': Route_Table, 'Position_Index': Position_Index, 'Shorts': None}
+
+    # The shorts are reused for the single shorts, if no two bumps share a position
+    if Fault_Type == 'Short' and Faults_Number == 1 and len(Position_Index) == len(df_bump):
+        with Profile_Stage('Short groups'):
+            Base['Shorts'] = [tuple(index_list) for index_list in Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type)]
+    return Base
+
+def Candidate_Faults(Base, df_bump, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance):
+    """
+    This function gives the faults of a candidate interface, as lists of indices in df_bump ordered as by Fault_Enumerator,
+    the single shorts being taken from the short groups of the base (see What_If_Base).
+
+    Parameters:
+    - Base (dict): The base interface.
+    - df_bump (pd.DataFrame): DataFrame containing the bump information of the candidate.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+
+    Returns:
+    - iterable: The faults of the candidate.
+    """
+    if Fault_Type == 'Open':
+        return (list(index_list) for index_list in combinations(range(len(df_bump)), Faults_Number))
+    if Base['Shorts'] is None:
+        return Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type)
+
+    points = Bump_Points(df_bump)
+    Candidate_of = {}
+    New = []
+    for index, position in enumerate(points.tolist()):
+        base_index = Base['Position_Index'].get(tuple(position))
+        if base_index is None or base_index in Candidate_of:
+            New.append(index)
+        else:
+            Candidate_of[base_index] = index
+
+    # Shorts of the base whose bumps are all still at their position, then the shorts containing a bump at a new position
+    Faults = {tuple(sorted(Candidate_of[i] for i in short)) for short in Base['Shorts'] if all(i in Candidate_of for i in short)}
+    Moved_Bump_Shorts(points, New, Faults, Shorted_Bumps_Number, Short_Distance)
+    return (list(index_list) for index_list in sorted(Faults))
+
+def What_If_Analysis(BumpMap_file_name, Interface_IRL_file_name, Candidates_file_name, What_If_Metric, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                     Min_Yield, Max_Yield, Number_of_faults_tested, Number_of_electrical_yield_tested, Log_Scale, Bundle_Flag, What_If_file_name, seed=None):
+    """
+    This function evaluates a batch of candidate designs of the repair of an interface, each candidate being the base interface with a list of
+    modifications (see Apply_Interface_Modifications). The base interface is loaded once, ideally from a binary interface, its short groups are
+    reused by the candidates (see What_If_Base), and the faults of each candidate are classified and solved with its interface model (see Interface_Model),
+    with the results of Repair_Statistics_using_LogicSolver (or Bundle_Repair_Statistics), or of MetaCIRA for a single interface.
+    The candidates file is a YAML dictionary {candidate: list of modifications}. The base interface is evaluated first, as the candidate 'Base'.
+
+    Parameters:
+    - BumpMap_file_name (str): Path to the bump map file of the base interface.
+    - Interface_IRL_file_name (str): Path to the IRL file of the base interface.
+    - Candidates_file_name (str): Path to the YAML file of the candidates.
+    - What_If_Metric (str): 'Reparability' for the repair statistics of the fault model, 'Yield' for the yield of MetaCIRA.
+    - Fault_Type (str): 'Short' or 'Open'.
+    - Faults_Number (int): Number of faults happening at the same time.
+    - Shorted_Bumps_Number (int): Number of bumps affected by a short.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Min_Yield, Max_Yield (float): Range of the electrical yield, for the Yield metric.
+    - Number_of_faults_tested (int): Number of faults drawn per electrical yield, for the Yield metric.
+    - Number_of_electrical_yield_tested (int): Number of electrical yields, for the Yield metric.
+    - Log_Scale (bool): Flag to set the electrical yield in log scale, for the Yield metric.
+    - Bundle_Flag (bool): Flag for the interfaces made of bundles.
+    - What_If_file_name (str): Path to the CSV file of the results.
+    - seed (int): Seed of the faults drawn for the Yield metric, the same faults being drawn for the candidates with the same number of bumps.
+
+    Returns:
+    - pd.DataFrame: The results, one row per candidate (and per electrical yield for the Yield metric).
+    """
+    if What_If_Metric not in ['Reparability', 'Yield']:
+        raise ValueError(f'Unknown what-if metric {What_If_Metric}, choose Reparability or Yield')
+    with open(Candidates_file_name, 'r') as file:
+        Candidates = yaml.load(file, Loader=YAML_Loader) or {}
+    if 'Base' in Candidates:
+        raise ValueError('The candidate name Base is reserved for the base interface')
+
+    Base = What_If_Base(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance)
+    if Log_Scale:
+        yield_range = [1- 10 ** (-exp) for exp in range(1, Number_of_electrical_yield_tested + 1)]
+    else:
+        yield_range = np.linspace(Min_Yield, Max_Yield, num = Number_of_electrical_yield_tested + 1)
 
-if Meta_Analysis:
-    MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file_name, System_Analysis, Min_Yield, 
-    Max_Yield, Number_of_faults_tested, Number_of_electrical_yield_tested, Bundle_Flag, Log_Scale, seed = None)
+    Rows = []
+    Progress_Start('What-if candidates', len(Candidates) + 1)
+    for Candidate, Modifications in [('Base', [])] + list(Candidates.items()):
+        with Profile_Stage('Candidate modifications'):
+            df_bump, Route_Table = Apply_Interface_Modifications(Base['df_bump'], Base['Route_Table'], Modifications or [])
+            Model = Interface_Model(df_bump, Route_Table, Bundle_Flag)
+        N = len(df_bump)
+        Design = {'Candidate': Candidate, 'Bumps': N, 'Spares': int((df_bump['Spare'] == True).sum())}
+
+        if What_If_Metric == 'Reparability':
+            Statistics = {'Total': 0, 'Repairable': 0, 'Benign': 0, 'Catastrophic': 0, 'Unrepairable': 0}
+            with Profile_Stage('Candidate faults'):
+                Faults = list(Candidate_Faults(Base, df_bump, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance))
+                for Fault_Class, Repair_Type, Chain_list in Model_Fault_Types(Model, Faults, Fault_Type):
+                    Statistics[Repair_Type] += 1
+                Statistics['Total'] = len(Faults)
+            Reparability_percentage = Print_Repair_Counts(Candidate, Statistics, Statistics['Total'])
+            Rows.append({**Design, **Statistics, 'Reparability': Reparability_percentage})
 
-end = time.time()
-print(f'Execution time = {end - start} s')    
+        else:
+            # Faults of A or A + 1 opens, as drawn by MetaCIRA, the random generator being restarted for each candidate
+            rng = random.Random(seed)
+            with Profile_Stage('Candidate faults'):
+                for Electrical_Yield in yield_range:
+                    Nc = round((1-Electrical_Yield) * N, 8)
+                    A = int(Nc)
+                    Nsup = int(Number_of_faults_tested * round((Nc - A), 8))
+                    Faults = [rng.sample(range(N), A + (i < Nsup)) for i in range(Number_of_faults_tested)]
+                    Counts = Counter(Repair_Type for Fault_Class, Repair_Type, Chain_list in Model_Fault_Types(Model, Faults, 'Open'))
+                    Rows.append({**Design, 'Electrical_Yield': Electrical_Yield, 'Yield_without_repair': Counts['Benign'] / Number_of_faults_tested,
+                                 'Yield_with_repair': (Counts['Benign'] + Counts['Repairable']) / Number_of_faults_tested})
+            print(f"{Candidate} : Interface yield with repair action : {[Row['Yield_with_repair'] for Row in Rows[-len(yield_range):]]}")
+        Progress_Update()
+    Progress_End()
+
+    Results = pd.DataFrame(Rows)
+    with Profile_Stage('Writing tables'):
+        Results.to_csv(What_If_file_name, index=False)
+    return Results
+
+
+if __name__ == '__main__':
+
+    Progress_Data['Interval'] = Progress_Interval
+
+    # Enable the instrumentation, and cProfile on top of it if a dump file is given
+    if Profile:
+        Profile_Enable()
+        if cProfile_file_name is not None:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+    # Compile the interface into the binary format, or write back the bump map and the IRL of a binary interface
+    if Compile_Interface is not None:
+        with Profile_Stage('Write_Interface_Binary'):
+            Write_Interface_Binary(Avoid_bump_name_iteration(BumpMap_file_name), Repair_IRL_file_loading_into_a_dataframe(Interface_IRL_file_name), Compile_Interface)
+    if Decompile_Interface is not None:
+        Interface = Read_Interface_Binary(Decompile_Interface)
+        Write_BumpMap_yaml(Interface_Binary_to_DataFrame(Interface, 'Bumps'), BumpMap_file_name)
+        Write_IRL(Interface_Binary_to_DataFrame(Interface, 'Routes'), Interface_IRL_file_name)
+
+    # The Repair_Table is computed once and shared with the SVG when both are requested
+    # With the repair solutions, the faults are enumerated once for the LogicSolver and the RecursiveSolver (see Single_Pass_Analysis)
+    Repair_Table = None
+    Repair_Solutions_Table = None
+    Single_Pass = Repair_Solutions and Checkpoint_Interval == 0 and not Resume
+    # With --Reuse_Tables, the tables of a previous run are read by each analysis instead (see Reusable_Table)
+    if Single_Pass and Reuse_Tables:
+        Fingerprint = Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance)
+        Solutions_Fingerprint = Table_Fingerprint(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                                                  Solution_Encoding=Solution_Encoding, Intern_Solutions=Intern_Solutions)
+        Single_Pass = not (Reusable_Table(Fault_Table_file_name, Fingerprint, Warn=False) or Reusable_Table(Reparability_Table_file_name, Fingerprint, Warn=False)
+                           or Reusable_Table(Repair_Solutions_Table_file_name, Solutions_Fingerprint, [Solution_Dictionary_file_name] if Intern_Solutions else [], Warn=False))
+    if Reparability_Statistics:
+        if Sampling_Mode not in ['Exhaustive', 'Uniform', 'Stratified', 'Counting']:
+            raise ValueError(f'Unknown sampling mode {Sampling_Mode}, choose Exhaustive, Uniform, Stratified or Counting')
+        Statistics = None
+        if Bundle_Flag:
+            # The bundle mode writes fault classes instead of faults, the other analyses and the per-fault displays cannot use them
+            Incompatible_flags = [flag for flag, used in [('--Sampling_Mode', Sampling_Mode != 'Exhaustive'), ('--Short_Distance_Sweep', Short_Distance_Sweep is not None),
+                                                          ('--Incremental', Incremental), ('--Pruning', Pruning), ('--Stats_Only', Stats_Only),
+                                                          ('--Checkpoint_Interval', Checkpoint_Interval > 0), ('--Resume', Resume),
+                                                          ('--Display_Reparability_SVG', Create_SVG and Display_Reparability_SVG),
+                                                          ('--Reparability_Heatmap', Create_SVG and Reparability_Heatmap)] if used]
+            if Incompatible_flags:
+                raise ValueError(f"The bundle mode counts the faults by fault classes, it cannot be combined with {', '.join(Incompatible_flags)}")
+            with Profile_Stage('Bundle_Repair_Statistics'):
+                Statistics = Bundle_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                Fault_Class_Table_file_name)
+            Print_Repair_Counts('Repair Statistics using BundleSolver', Statistics, Statistics['Total'])
+
+        elif Sampling_Mode == 'Counting':
+            if Fault_Type != 'Open':
+                raise ValueError('The Counting mode only works with open faults')
+            with Profile_Stage('Counted_Open_Statistics'):
+                Statistics = Counted_Open_Statistics(BumpMap_file_name, Interface_IRL_file_name, Faults_Number)
+            if Statistics is None:
+                print('Warning : the repair chains of the interface are not independent, the faults are enumerated.')
+            else:
+                Print_Repair_Counts('Repair Statistics using exact counting', Statistics, Statistics['Total'])
+
+        # The sampled faults are not a Repair_Table, the SVG computes its own
+        Sampled_Table = None
+        if Statistics is None and Sampling_Mode in ['Uniform', 'Stratified']:
+            with Profile_Stage('Sampled_Repair_Statistics'):
+                Sampled_Table = Sampled_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                Sampling_Mode, Precision, Confidence_Level, Max_Samples, Sampled_Table_file_name, Print_Fault, Sampling_Seed)
+            if Sampled_Table is None:
+                print('Warning : the samples cover the whole fault space, the faults are enumerated.')
+
+        # The faults are enumerated unless their statistics were counted or sampled
+        Enumerate = Statistics is None and Sampled_Table is None
+        if Enumerate and Short_Distance_Sweep is not None:
+            if Fault_Type != 'Short':
+                raise ValueError('The Short_Distance sweep only works with short faults')
+            with Profile_Stage('Short_Distance_Sweep_Statistics'):
+                Short_Distance_Sweep_Statistics(BumpMap_file_name, Interface_IRL_file_name, Faults_Number, Shorted_Bumps_Number,
+                [float(Distance) for Distance in Short_Distance_Sweep.split(',')], Reparability_Table_file_name, Fault_Table_file_name, Sweep_file_name, Print_Fault)
+        elif Enumerate and Incremental:
+            with Profile_Stage('Incremental_Repair_Statistics'):
+                Repair_Table = Incremental_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                Reparability_Table_file_name, Fault_Table_file_name, Incremental_State_file_name, Print_Fault, Reuse_Tables)
+        elif Enumerate and Pruning and Fault_Type == 'Open':
+            with Profile_Stage('Pruned_Open_Statistics'):
+                Statistics = Pruned_Open_Statistics(BumpMap_file_name, Interface_IRL_file_name, Faults_Number, Minimal_Sets_file_name, Print_Fault)
+            Print_Repair_Counts('Repair Statistics using pruned LogicSolver', Statistics, Statistics['Total'])
+        elif Enumerate and Stats_Only:
+            if Pruning:
+                print('Warning : the shorts are not monotone, the faults are enumerated without pruning.')
+            if Checkpoint_Interval > 0 or Resume:
+                print('Warning : the statistics only mode does not write checkpoints, the checkpoint arguments are ignored.')
+            with Profile_Stage('Streamed_Repair_Statistics'):
+                Statistics = Streamed_Repair_Statistics(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                Stats_Breakdown_file_name, Print_Fault)
+        elif Enumerate:
+            if Pruning:
+                print('Warning : the shorts are not monotone, the faults are enumerated without pruning.')
+            if Single_Pass:
+                with Profile_Stage('Single_Pass_Analysis'):
+                    Repair_Table, Repair_Solutions_Table = Single_Pass_Analysis(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                    Fault_Table_file_name, Reparability_Table_file_name, Repair_Solutions_Table_file_name, Print_Fault, Solution_Encoding, Intern_Solutions, Solution_Dictionary_file_name, Solution_Cache_Size, Reuse_Tables)
+            else:
+                try:
+                    with Profile_Stage('Repair_Statistics_using_LogicSolver'):
+                        Repair_Table = Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, 
+                        Faults_Number, Interface_IRL_file_name, Reparability_Table_file_name, Fault_Table_file_name, Print_Fault,
+                        Checkpoint_Interval, Checkpoint_file_name, Resume, Reuse_Tables)
+                except KeyboardInterrupt:
+                    # The checkpoint is written, the run stops
+                    sys.exit(1)
+
+    if Create_SVG:
+        if Single_Pass and Repair_Table is None and Repair_Solutions_Table is None and (Display_Reparability_SVG or Reparability_Heatmap):
+            with Profile_Stage('Single_Pass_Analysis'):
+                Repair_Table, Repair_Solutions_Table = Single_Pass_Analysis(BumpMap_file_name, Interface_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                Fault_Table_file_name, Reparability_Table_file_name, Repair_Solutions_Table_file_name, Print_Fault, Solution_Encoding, Intern_Solutions, Solution_Dictionary_file_name, Solution_Cache_Size, Reuse_Tables)
+        if Tiled_SVG:
+            with Profile_Stage('Display_Tiled_SVG'):
+                Display_Tiled_SVG(BumpMap_file_name, Aspect_file_name, Tile_Directory, Bump_Diameter, Pitch, Input_X_scale, Input_Y_scale,
+                Bump_Name, Stroke_Color, Font, Font_Size, Display_Reparability_SVG, Tile_Size, Tile_Format, LOD_Cell_Size, LOD_Color_Mode, Tile_Workers,
+                Reparability_Heatmap, Heatmap_Colormap, Repair_Table)
+        else:
+            with Profile_Stage('Display_SVG'):
+                Display_SVG(BumpMap_file_name, Aspect_file_name, BumpMap_SVG_image_file_name, Open_SVG, Bump_Diameter, Pitch, 
+                Input_X_scale, Input_Y_scale, Legend, Margin, Bump_Name, Stroke_Color, Font, Font_Size, Display_Reparability_SVG,
+                Reparability_Heatmap, Heatmap_Colormap, Repair_Table)
+
+    if Repair_Solutions and Repair_Solutions_Table is None:
+        try:
+            with Profile_Stage('Repair_Solutions_using_RecursiveSolver'):
+                Repair_Solutions_using_RecursiveSolver(BumpMap_file_name, Interface_IRL_file_name, Repair_Solutions_Table_file_name, 
+                Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type, Fault_Table_file_name, Print_Fault,
+                Checkpoint_Interval, Checkpoint_file_name, Resume, Solution_Encoding, Intern_Solutions, Solution_Dictionary_file_name, Solution_Cache_Size, Reuse_Tables)
+        except KeyboardInterrupt:
+            # The checkpoint is written, the run stops
+            sys.exit(1)
+
+    if Meta_Analysis:
+        with Profile_Stage('MetaCIRA'):
+            MetaCIRA(BumpMap_file_name, Interface_IRL_file_name, System_description_file_name, System_Analysis, Min_Yield, 
+            Max_Yield, Number_of_faults_tested, Number_of_electrical_yield_tested, Bundle_Flag, Log_Scale, seed = None)
+
+    if What_If is not None:
+        with Profile_Stage('What_If_Analysis'):
+            What_If_Analysis(BumpMap_file_name, Interface_IRL_file_name, What_If, What_If_Metric, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+            Min_Yield, Max_Yield, Number_of_faults_tested, Number_of_electrical_yield_tested, Log_Scale, Bundle_Flag, What_If_file_name, Sampling_Seed)
+
+    end = time.time()
+    print(f'Execution time = {end - start} s')    
+
+    if Profile:
+        if cProfile_file_name is not None:
+            profiler.disable()
+            profiler.dump_stats(cProfile_file_name)
+            print(f'Wrote the cProfile statistics to {cProfile_file_name}')
+        Write_Profile(Profile_file_name, end - start)
@@ -0,0 +1,332 @@
+# ----------------------------------------------------------------------------
+#                        LIST / DSCIN / LSTA
+# ----------------------------------------------------------------------------
+#
+#
+#  File        : CIRA_Benchmark
+#
+#  Description : This program times each stage of CIRA on a ladder of
+#                synthetic interfaces of increasing size, and checks the
+#                results against golden values. See the file README.md for
+#                user instructions.
+#
+#  Copyright (C) 2025 CEA-LIST
+#
+#  Maintainer  : Adrian Evans (adrian.evans@cea.fr)
+#
+# Licensed under the LGPL-3.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+# https://www.gnu.org/licenses/lgpl-3.0.fr.html#license-text
+#
+# THE SOFTWARE IS PROVIDED “AS IS” AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+#
+# ----------------------------------------------------------------------------
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+# The benchmark never opens a window, MetaCIRA only saves its plot
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+
+import CIRA
+from CIRA_Generator import Generate_Interface
+
+# Bumps of a repair chain of the bundle interfaces : 4 bundles of 16 bumps and 2 repair bundles, like HYDRA 16-1 2RB
+Bundle_Chain_Bumps = (4 + 2) * 16
+
+# Stages of CIRA timed by the benchmark, in execution order
+Stages = ['Loading', 'Fault enumeration', 'Classification', 'Model solver', 'RecursiveSolver', 'Bundle model solver', 'MetaCIRA sweep', 'SVG rendering']
+
+# Modes computing the exact repair statistics without solving each fault, checked against the exhaustive analyses on small interfaces
+Exact_Stages = ['Counted opens', 'Pruned opens', 'Streamed statistics', 'Bundle statistics']
+Exact_Bumps_Number = 64
+# Fault models of the exact modes, as (Fault_Type, Faults_Number, Shorted_Bumps_Number)
+Fault_Models = {'2 opens': ('Open', 2, 1), '3 opens': ('Open', 3, 1), '2-bump shorts': ('Short', 1, 2), '3-bump shorts': ('Short', 1, 3)}
+
+def Timed(function, *arguments):
+    """
+    This function calls a function and measures its wall-clock time, its prints being discarded.
+
+    Returns:
+    - tuple: (result of the function, time in seconds)
+    """
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = function(*arguments)
+    return result, time.perf_counter() - start
+
+def Count_Repair_Types(Repair_Types):
+    """
+    This function counts the faults of each repair type, in the format of the golden results.
+    """
+    return {Repair_Type: Repair_Types.count(Repair_Type) for Repair_Type in ['Repair', 'Repairable', 'Unrepairable', 'Benign', 'Catastrophic'] if Repair_Type in Repair_Types}
+
+def Statistics_Counts(Statistics):
+    """
+    This function gives the number of faults of each repair type of the statistics of an analysis, in the format of the golden results.
+    """
+    return {Repair_Type: Statistics[Repair_Type] for Repair_Type in ['Repairable', 'Unrepairable', 'Benign', 'Catastrophic'] if Statistics.get(Repair_Type)}
+
+def Benchmark_Interface(Bumps_Number, Work_Directory, Pitch, Short_Distance, Aspect_file_name, Number_of_faults_tested, seed):
+    """
+    This function generates the synthetic interfaces of one size of the ladder and times every stage of CIRA on them.
+    The connection-level interface is used by every stage except the bundle model solver, which uses a bundle interface made of
+    the fewest full repair chains holding Bumps_Number bumps, so that every size of the ladder above a chain gives a larger bundle interface.
+    The fault model is the 2-bump short within Short_Distance.
+    The model solvers, building the interface model and solving the faults needing a repair action with Model_Repair_Types as the analyses do,
+    are cross-checked against LogicSolver and BundleSolver, which are not timed.
+
+    Parameters:
+    - Bumps_Number (int): Number of bumps of the interfaces.
+    - Work_Directory (str): Directory for the generated interfaces and the outputs of CIRA.
+    - Pitch (float): Pitch of the interfaces, in µm.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - Aspect_file_name (str): Path to the file containing colors and shapes of bumps.
+    - Number_of_faults_tested (int): Number of faults per electrical yield of the MetaCIRA sweep.
+    - seed (int): Seed of the generator and of MetaCIRA.
+
+    Returns:
+    - tuple: (times, results, mismatches), two dictionaries indexed by stage, containing the time in seconds and the result checked against the golden values,
+      and the list of the disagreements of the model solvers with LogicSolver and BundleSolver.
+    """
+    times = {}
+    results = {}
+    mismatches = []
+
+    # Connection-level interface: chains of 16 signals with 1 spare, interleaved two by two
+    BumpMap_file_name, IRL_file_name = Generate_Interface(f'Chain_{Bumps_Number}', Work_Directory, Bumps_Number, Pitch,
+                                                          'DATA:0.7,POWER:0.15,GND:0.15', 16, 1, 2, 0, seed)
+    # Bundle interface, like HYDRA 16-1 2RB: chains of 4 bundles of 16 bumps with 2 repair bundles
+    Bundle_Bumps_Number = -(-Bumps_Number // Bundle_Chain_Bumps) * Bundle_Chain_Bumps
+    Bundle_BumpMap_file_name, Bundle_IRL_file_name = Generate_Interface(f'Bundle_{Bumps_Number}', Work_Directory, Bundle_Bumps_Number, Pitch,
+                                                                        'DATA:10,CLK:1,GND:3,POWER:2', 4, 2, 1, 16, seed)
+
+    def Load(BumpMap_file_name, IRL_file_name):
+        return CIRA.Repair_IRL_file_loading_into_a_dataframe(IRL_file_name), CIRA.Avoid_bump_name_iteration(BumpMap_file_name)
+
+    def Enumerate(df_bump):
+        return list(CIRA.Fault_Enumerator(df_bump, 1, 2, Short_Distance, 'Short'))
+
+    def Classify(df_bump, Route_Table, Faults):
+        return CIRA.Classify_Fault_Rows(CIRA.Bump_Fault_Classes(df_bump, Route_Table), Faults, 'Short')
+
+    def Solve(Fault_Table, Solver):
+        return [Solver(fault, Chain_list) if Repair_Type == 'Repair' else Repair_Type for fault, Repair_Type, Chain_list in Fault_Table]
+
+    def Model_Solve(df_bump, Route_Table, Faults, Fault_Table, Bundle_Flag):
+        Model = CIRA.Interface_Model(df_bump, Route_Table, Bundle_Flag=Bundle_Flag)
+        Repair_Faults = iter(CIRA.Model_Repair_Types(Model, [index_list for index_list, (fault, Repair_Type, Chain_list) in zip(Faults, Fault_Table) if Repair_Type == 'Repair']))
+        return [next(Repair_Faults) if Repair_Type == 'Repair' else Repair_Type for fault, Repair_Type, Chain_list in Fault_Table]
+
+    def Cross_Check(stage, Repair_Types, Reference_Types, Reference):
+        disagreements = sum(Repair_Type != Reference_Type for Repair_Type, Reference_Type in zip(Repair_Types, Reference_Types))
+        if disagreements:
+            mismatches.append(f'{Bumps_Number} bumps, {stage} : {disagreements} faults solved differently by {Reference}')
+
+    (Route_Table, df_bump), times['Loading'] = Timed(Load, BumpMap_file_name, IRL_file_name)
+    Faults, times['Fault enumeration'] = Timed(Enumerate, df_bump)
+    Fault_Table, times['Classification'] = Timed(Classify, df_bump, Route_Table, Faults)
+    results['Loading'] = len(df_bump)
+    results['Fault enumeration'] = len(Faults)
+    results['Classification'] = Count_Repair_Types([Repair_Type for fault, Repair_Type, Chain_list in Fault_Table])
+
+    Repair_Types, times['Model solver'] = Timed(Model_Solve, df_bump, Route_Table, Faults, Fault_Table, False)
+    results['Model solver'] = Count_Repair_Types(Repair_Types)
+    Cross_Check('Model solver', Repair_Types, Solve(Fault_Table, lambda fault, Chain_list: CIRA.LogicSolver(list(Chain_list), Route_Table, df_bump, fault)), 'LogicSolver')
+
+    Repair_Types, times['RecursiveSolver'] = Timed(Solve, Fault_Table, lambda fault, Chain_list: CIRA.Repair_Solution_of_Fault(fault, Route_Table, df_bump)[0])
+    results['RecursiveSolver'] = Count_Repair_Types(Repair_Types)
+
+    # The bundle faults are prepared outside of the timed stage
+    Bundle_Route_Table, Bundle_df_bump = Load(Bundle_BumpMap_file_name, Bundle_IRL_file_name)
+    Bundle_Faults = Enumerate(Bundle_df_bump)
+    Bundle_Fault_Table = Classify(Bundle_df_bump, Bundle_Route_Table, Bundle_Faults)
+    Repair_Types, times['Bundle model solver'] = Timed(Model_Solve, Bundle_df_bump, Bundle_Route_Table, Bundle_Faults, Bundle_Fault_Table, True)
+    results['Bundle model solver'] = Count_Repair_Types(Repair_Types)
+    Cross_Check('Bundle model solver', Repair_Types, Solve(Bundle_Fault_Table, lambda fault, Chain_list: CIRA.BundleSolver(Bundle_df_bump, fault, Bundle_Route_Table)), 'BundleSolver')
+
+    # MetaCIRA writes its plot in the current directory
+    current_directory = os.getcwd()
+    os.chdir(Work_Directory)
+    try:
+        (yield_range, yield_without_repair, yield_with_repair), times['MetaCIRA sweep'] = Timed(
+            CIRA.MetaCIRA, os.path.abspath(os.path.join(current_directory, BumpMap_file_name)), os.path.abspath(os.path.join(current_directory, IRL_file_name)),
+            None, False, 0.99, 1, Number_of_faults_tested, 4, False, False, seed)
+    finally:
+        os.chdir(current_directory)
+        plt.close('all')
+    results['MetaCIRA sweep'] = {'Without repair': [round(value, 6) for value in yield_without_repair], 'With repair': [round(value, 6) for value in yield_with_repair]}
+
+    SVG_file_name = os.path.join(Work_Directory, f'Chain_{Bumps_Number}.svg')
+    _, times['SVG rendering'] = Timed(CIRA.Display_SVG, BumpMap_file_name, Aspect_file_name, SVG_file_name, False, 0.6 * Pitch, Pitch, 1, 1,
+                                      True, 1, True, 'black', 'Arial', 1, False)
+    results['SVG rendering'] = os.path.getsize(SVG_file_name) > 0
+
+    return times, results, mismatches
+
+def Benchmark_Exact_Modes(Work_Directory, Pitch, Short_Distance, seed):
+    """
+    This function times the modes computing the exact repair statistics without solving each fault, and checks them against the exhaustive analyses :
+    Counted_Open_Statistics, Pruned_Open_Statistics and Streamed_Repair_Statistics against Repair_Statistics_using_LogicSolver on a connection-level
+    interface of Exact_Bumps_Number bumps, and Bundle_Repair_Statistics against BundleSolver on a bundle interface of one repair chain.
+    The exhaustive analyses are not timed.
+
+    Parameters:
+    - Work_Directory (str): Directory for the generated interfaces and the outputs of CIRA.
+    - Pitch (float): Pitch of the interfaces, in µm.
+    - Short_Distance (float): Upper threshold for the short distance in µm.
+    - seed (int): Seed of the generator.
+
+    Returns:
+    - tuple: (times, results, mismatches), as returned by Benchmark_Interface, the result of each stage giving the statistics of each of its fault models.
+    """
+    times = {stage: 0.0 for stage in Exact_Stages}
+    results = {stage: {} for stage in Exact_Stages}
+    mismatches = []
+
+    BumpMap_file_name, IRL_file_name = Generate_Interface('Exact', Work_Directory, Exact_Bumps_Number, Pitch, 'DATA:0.7,POWER:0.15,GND:0.15', 16, 1, 2, 0, seed)
+    Bundle_BumpMap_file_name, Bundle_IRL_file_name = Generate_Interface('Exact_Bundle', Work_Directory, Bundle_Chain_Bumps, Pitch, 'DATA:10,CLK:1,GND:3,POWER:2', 4, 2, 1, 16, seed)
+    Output_file_name = lambda Name: os.path.join(Work_Directory, f'Exact_{Name}.csv')
+
+    def Exhaustive(Fault_Type, Faults_Number, Shorted_Bumps_Number):
+        Repair_Table = CIRA.Repair_Statistics_using_LogicSolver(BumpMap_file_name, Fault_Type, Shorted_Bumps_Number, Short_Distance, Faults_Number, IRL_file_name,
+                                                                Output_file_name('Repair_Table'), Output_file_name('Fault_Table'), False)
+        return Count_Repair_Types(Repair_Table['Repair_Type'].tolist())
+
+    def Exhaustive_Bundle(Fault_Type, Faults_Number, Shorted_Bumps_Number):
+        Route_Table = CIRA.Repair_IRL_file_loading_into_a_dataframe(Bundle_IRL_file_name)
+        df_bump = CIRA.Avoid_bump_name_iteration(Bundle_BumpMap_file_name)
+        Names = df_bump['Name'].tolist()
+        Types = df_bump['Type'].tolist()
+        Repair_Types = []
+        for index_list in CIRA.Fault_Enumerator(df_bump, Faults_Number, Shorted_Bumps_Number, Short_Distance, Fault_Type):
+            Repair_Type = CIRA.Bundle_Fault_Class([Types[i] for i in index_list], Fault_Type)
+            Repair_Types.append(CIRA.BundleSolver(df_bump, [Names[i] for i in index_list], Route_Table) if Repair_Type == 'Repair' else Repair_Type)
+        return Count_Repair_Types(Repair_Types)
+
+    def Check(stage, Fault_Model, Mode, Reference, Reference_name):
+        Fault_Type, Faults_Number, Shorted_Bumps_Number = Fault_Models[Fault_Model]
+        Statistics, time_taken = Timed(Mode, Fault_Type, Faults_Number, Shorted_Bumps_Number)
+        times[stage] += time_taken
+        results[stage][Fault_Model] = None if Statistics is None else Statistics_Counts(Statistics)
+        expected, _ = Timed(Reference, Fault_Type, Faults_Number, Shorted_Bumps_Number)
+        if results[stage][Fault_Model] != expected:
+            mismatches.append(f'Exact modes, {stage}, {Fault_Model} : {Reference_name} gives {expected}, got {results[stage][Fault_Model]}')
+
+    for Fault_Model in ['2 opens', '3 opens']:
+        Check('Counted opens', Fault_Model, lambda Fault_Type, Faults_Number, Shorted_Bumps_Number:
+              CIRA.Counted_Open_Statistics(BumpMap_file_name, IRL_file_name, Faults_Number), Exhaustive, 'LogicSolver')
+        Check('Pruned opens', Fault_Model, lambda Fault_Type, Faults_Number, Shorted_Bumps_Number:
+              CIRA.Pruned_Open_Statistics(BumpMap_file_name, IRL_file_name, Faults_Number, Output_file_name('Minimal_Unrepairable_Sets'), False), Exhaustive, 'LogicSolver')
+    for Fault_Model in ['2 opens', '3 opens', '2-bump shorts', '3-bump shorts']:
+        Check('Streamed statistics', Fault_Model, lambda Fault_Type, Faults_Number, Shorted_Bumps_Number:
+              CIRA.Streamed_Repair_Statistics(BumpMap_file_name, IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance), Exhaustive, 'LogicSolver')
+    # The exhaustive BundleSolver is too slow for the 3 opens
+    for Fault_Model in ['2 opens', '2-bump shorts', '3-bump shorts']:
+        Check('Bundle statistics', Fault_Model, lambda Fault_Type, Faults_Number, Shorted_Bumps_Number:
+              CIRA.Bundle_Repair_Statistics(Bundle_BumpMap_file_name, Bundle_IRL_file_name, Fault_Type, Faults_Number, Shorted_Bumps_Number, Short_Distance,
+                                            Output_file_name('Fault_Class_Table')), Exhaustive_Bundle, 'BundleSolver')
+
+    return times, results, mismatches
+
+
+if __name__ == '__main__':
+
+    #Parser initialisation.
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--Sizes', type = str, help = 'Comma separated ladder of interface sizes, in bumps.', default = '64,128,256')
+    parser.add_argument('--Pitch', type = float, help = 'Pitch of the synthetic interfaces, in µm.', default = 10)
+    parser.add_argument('--Short_Distance', type = float, help = 'Upper threshold for the short distance, as a multiple of the Pitch.', default = 1.5)
+    parser.add_argument('--Number_of_faults_tested', type = int, help = 'Number of faults per electrical yield of the MetaCIRA sweep.', default = 100)
+    parser.add_argument('--Seed', type = int, help = 'Seed of the generator and of MetaCIRA.', default = 1)
+    parser.add_argument('--Aspect_file_name', type = str, help = 'Filename for the colors and shapes of bumps (must be a csv).', default = os.path.join('DEMO', 'colors_shapes_dict.csv'))
+    parser.add_argument('--Work_Directory', type = str, help = 'Directory for the synthetic interfaces and the outputs of CIRA.', default = os.path.join('OutputFiles', 'Benchmark'))
+    parser.add_argument('--Results_file_name', type = str, help = 'CSV file where the time of every stage and size is written.', default = os.path.join('OutputFiles', 'Benchmark.csv'))
+    parser.add_argument('--Golden_file_name', type = str, help = 'JSON file containing the golden results of each size.', default = 'CIRA_Benchmark_Golden.json')
+    parser.add_argument('--Update_Golden', action = 'store_true', help = 'Flag to write the results of this run as the golden results.')
+    parser.add_argument('--Plot', action = 'store_true', help = 'Flag to plot the time of each stage versus the interface size (Benchmark.svg in the Work_Directory).')
+
+    args = parser.parse_args()
+    os.makedirs(args.Work_Directory, exist_ok=True)
+
+    # Load the golden results
+    golden = {}
+    if os.path.exists(args.Golden_file_name):
+        with open(args.Golden_file_name, 'r') as file:
+            golden = json.load(file)
+
+    def Benchmarks():
+        # Each size of the ladder, then the exact modes, with the key of their golden results
+        for Bumps_Number in [int(size) for size in args.Sizes.split(',')]:
+            print(f'Benchmarking {Bumps_Number} bumps')
+            yield str(Bumps_Number), f'{Bumps_Number} bumps', Bumps_Number, Stages, Benchmark_Interface(
+                Bumps_Number, args.Work_Directory, args.Pitch, args.Short_Distance * args.Pitch, args.Aspect_file_name, args.Number_of_faults_tested, args.Seed)
+        print('Checking the exact modes')
+        yield 'Exact modes', 'Exact modes', Exact_Bumps_Number, Exact_Stages, Benchmark_Exact_Modes(args.Work_Directory, args.Pitch, args.Short_Distance * args.Pitch, args.Seed)
+
+    rows = []
+    failures = []
+    for Golden_key, Label, Bumps_Number, Stage_list, (times, results, mismatches) in Benchmarks():
+
+        # Check the results against their golden results
+        for stage in Stage_list:
+            expected = golden.get(Golden_key, {}).get(stage)
+            if expected is None:
+                check = 'NO GOLDEN'
+            elif json.loads(json.dumps(results[stage])) == expected:
+                check = 'OK'
+            else:
+                check = 'FAILED'
+                failures.append(f'{Label}, {stage} : expected {expected}, got {results[stage]}')
+            rows.append({'Bumps': Bumps_Number, 'Stage': stage, 'Time (s)': times[stage], 'Check': check})
+            print(f'  {stage:<20} {times[stage]:>10.4f} s  {check}')
+        failures += mismatches
+
+        if args.Update_Golden:
+            golden[Golden_key] = json.loads(json.dumps(results))
+
+    # Write the times of every stage and size
+    Results = pd.DataFrame(rows)
+    Results.to_csv(args.Results_file_name, index=False)
+    print(f'Wrote the results to {args.Results_file_name}')
+
+    if args.Update_Golden:
+        with open(args.Golden_file_name, 'w') as file:
+            json.dump(golden, file, indent=1)
+        print(f'Wrote the golden results to {args.Golden_file_name}')
+
+    # Scaling curves, one per stage, on log-log axes
+    if args.Plot:
+        plt.figure()
+        for stage, group in Results.groupby('Stage', sort=False):
+            plt.plot(group['Bumps'], group['Time (s)'], marker='o', label=stage)
+        plt.xscale('log')
+        plt.yscale('log')
+        plt.xlabel('Number of bumps')
+        plt.ylabel('Time (s)')
+        plt.legend()
+        plt.grid()
+        plt.title('Time of each stage of CIRA versus the interface size')
+        plt.savefig(os.path.join(args.Work_Directory, 'Benchmark.svg'), format='svg')
+
+    if failures:
+        print('Golden results mismatch :')
+        for failure in failures:
+            print(f'  {failure}')
+        sys.exit(1)
@@ -0,0 +1,307 @@
+# ----------------------------------------------------------------------------
+#                        LIST / DSCIN / LSTA
+# ----------------------------------------------------------------------------
+#
+#
+#  File        : CIRA_Generator
+#
+#  Description : This program generates synthetic chiplet interfaces (bump map
+#                and IRL files) in the format read by CIRA. See the file
+#                README.md for user instructions.
+#
+#  Copyright (C) 2025 CEA-LIST
+#
+#  Maintainer  : Adrian Evans (adrian.evans@cea.fr)
+#
+# Licensed under the LGPL-3.0 (the "License");
+# You may not use this file except in compliance with the License.
+# You may obtain a copy of the License at:
+# https://www.gnu.org/licenses/lgpl-3.0.fr.html#license-text
+#
+# THE SOFTWARE IS PROVIDED “AS IS” AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+# REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+# INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+# LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+# OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+# PERFORMANCE OF THIS SOFTWARE.
+#
+# ----------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+from math import ceil, sqrt
+import yaml
+
+# Types of connections that need a repair action, the others are supply connections
+Functional_types = ['DATA', 'CLK', 'ADDR', 'SIDEBAND']
+Supply_types = ['POWER', 'GND']
+
+def Parse_Type_Mix(Type_Mix):
+    """
+    This function reads a type mix written as 'DATA:0.7,POWER:0.15,GND:0.15' into a dictionary.
+
+    Parameters:
+    - Type_Mix (str or dict): The type mix, the fractions do not need to sum to 1.
+
+    Returns:
+    - dict: A dictionary mapping each type to its fraction of the bumps, normalized to sum to 1.
+    """
+    if isinstance(Type_Mix, str):
+        Type_Mix = {bump_type.strip(): float(fraction) for bump_type, fraction in (item.split(':') for item in Type_Mix.split(','))}
+
+    for bump_type in Type_Mix:
+        if bump_type not in Functional_types + Supply_types:
+            raise ValueError(f"Unknown bump type {bump_type}, the types are {Functional_types + Supply_types}")
+
+    Total = sum(Type_Mix.values())
+    return {bump_type: fraction / Total for bump_type, fraction in Type_Mix.items()}
+
+def Spread_Types(Type_Counts, rng):
+    """
+    This function returns a list containing each type as many times as given by Type_Counts, in a random order.
+
+    Parameters:
+    - Type_Counts (dict): A dictionary mapping each type to its number of bumps.
+    - rng (random.Random): Random generator.
+
+    Returns:
+    - list: The shuffled list of types.
+    """
+    types = [bump_type for bump_type, count in Type_Counts.items() for _ in range(count)]
+    rng.shuffle(types)
+    return types
+
+def Split_Counts(Number, Fractions):
+    """
+    This function splits Number items between types according to their fractions, the rounding errors going to the largest fractions.
+
+    Parameters:
+    - Number (int): Number of items to split.
+    - Fractions (dict): A dictionary mapping each type to its fraction.
+
+    Returns:
+    - dict: A dictionary mapping each type to its number of items, summing to Number.
+    """
+    if not Fractions:
+        return {}
+    Total = sum(Fractions.values())
+    counts = {bump_type: int(Number * fraction / Total) for bump_type, fraction in Fractions.items()}
+    for bump_type in sorted(Fractions, key=Fractions.get, reverse=True)[:Number - sum(counts.values())]:
+        counts[bump_type] += 1
+    return counts
+
+def Interleave(groups, Interleaving):
+    """
+    This function orders the items of several groups so that the groups are interleaved Interleaving by Interleaving.
+    With Interleaving = 1 the groups stay contiguous, with Interleaving = 2 the items of groups 0 and 1 alternate, then those of groups 2 and 3, etc.
+
+    Parameters:
+    - groups (list): List of lists of items.
+    - Interleaving (int): Number of groups interleaved together.
+
+    Returns:
+    - list: The ordered items.
+    """
+    ordered = []
+    for first in range(0, len(groups), Interleaving):
+        block = groups[first:first + Interleaving]
+        for position in range(max(len(group) for group in block)):
+            for group in block:
+                if position < len(group):
+                    ordered.append(group[position])
+    return ordered
+
+def Place_with_supplies(chain_bumps, supply_types):
+    """
+    This function spreads the supply bumps evenly between the bumps of the repair chains.
+
+    Parameters:
+    - chain_bumps (list): The bumps of the repair chains, in placement order.
+    - supply_types (list): The types of the supply bumps.
+
+    Returns:
+    - list: The bumps in placement order, the supply bumps being dictionaries with only a 'Type' key.
+    """
+    Total = len(chain_bumps) + len(supply_types)
+    placed = []
+    chain_index = 0
+    supply_index = 0
+    for position in range(Total):
+        # Bresenham-like spreading: a supply bump is placed each time the expected number of supplies increases
+        if supply_index < len(supply_types) and (position + 1) * len(supply_types) // Total > supply_index or chain_index == len(chain_bumps):
+            placed.append({'Type': supply_types[supply_index]})
+            supply_index += 1
+        else:
+            placed.append(chain_bumps[chain_index])
+            chain_index += 1
+    return placed
+
+def IRL_Port(Port_name, Signal, Routes):
+    """
+    This function writes one port of an IRL file.
+
+    Parameters:
+    - Port_name (str): Name of the port (key in the repair chain).
+    - Signal (str): Name of the functional signal.
+    - Routes (list): List of (Status, Connection, Mux, Sel) tuples, the first one being the Default route.
+
+    Returns:
+    - str: The text of the port.
+    """
+    text = f'  {Port_name}:\n    Name: {Signal}\n'
+    for Status, Connection, Mux, Sel in Routes:
+        text += f'    {Status}:\n      To: {Connection}\n      Control:\n        Mux: {Mux}\n        Sel: {Sel}\n'
+    return text + '\n'
+
+def Generate_Interface(Name, Output_Directory, Bumps_Number, Pitch, Type_Mix, Chain_Length, Spares_Number, Interleaving=1, Bundle_Size=0, seed=None):
+    """
+    This function generates a synthetic interface and writes its bump map (YAML) and IRL file in the format read by CIRA.
+    The bumps are placed row by row on a square grid of the given pitch.
+
+    Without bundles (Bundle_Size = 0), each repair chain has Chain_Length functional signals followed by Spares_Number spare connections,
+    and signal k can be shifted by up to Spares_Number positions (routes 'Repair', 'Repair_1', ...), like the MCI interfaces.
+    The supply bumps (POWER, GND) are spread evenly between the bumps of the chains.
+
+    With bundles (Bundle_Size > 0), the bumps are grouped into square bundles of Bundle_Size bumps, each bundle containing the type mix,
+    and each repair chain has Chain_Length functional bundles followed by Spares_Number repair bundles. Bundle k is repaired by bundle
+    k + Spares_Number, like the HYDRA interfaces.
+
+    Parameters:
+    - Name (str): Name of the interface, used for the file names.
+    - Output_Directory (str): Directory where the files are written.
+    - Bumps_Number (int): Number of bumps of the interface (rounded down to full chains with bundles).
+    - Pitch (float): Distance between two neighbouring bumps, in µm.
+    - Type_Mix (str or dict): Fraction of each bump type, see Parse_Type_Mix.
+    - Chain_Length (int): Number of functional signals (or bundles) per repair chain.
+    - Spares_Number (int): Number of spare connections (or repair bundles) per repair chain.
+    - Interleaving (int): Number of repair chains interleaved together on the interface.
+    - Bundle_Size (int): Number of bumps per bundle, 0 for a repair at the connection level.
+    - seed (int, optional): Seed of the random generator, for reproducible interfaces.
+
+    Returns:
+    - tuple: (BumpMap_file_name, IRL_file_name), the paths of the written files.
+    """
+    rng = random.Random(seed)
+    Type_Mix = Parse_Type_Mix(Type_Mix)
+    Functional_Mix = {bump_type: fraction for bump_type, fraction in Type_Mix.items() if bump_type in Functional_types}
+    Supply_Mix = {bump_type: fraction for bump_type, fraction in Type_Mix.items() if bump_type in Supply_types}
+    if not Functional_Mix:
+        raise ValueError('The type mix must contain at least one functional type')
+
+    # Parts of the IRL file, joined once when the file is written
+    IRL_parts = ['# IRL Format v1.0\n# Generated file - do not edit manually\n\n']
+
+    if Bundle_Size == 0:
+        # Number of bumps of the chains and of the supplies
+        Supply_Number = round(Bumps_Number * sum(Supply_Mix.values()))
+        Chains_Number = (Bumps_Number - Supply_Number) // (Chain_Length + Spares_Number)
+        if Chains_Number == 0:
+            raise ValueError(f'{Bumps_Number} bumps are not enough for one repair chain of {Chain_Length} signals and {Spares_Number} spares')
+        # The bumps that do not fit in a complete chain become supply bumps
+        Supply_Number = Bumps_Number - Chains_Number * (Chain_Length + Spares_Number)
+
+        functional_types = Spread_Types(Split_Counts(Chains_Number * Chain_Length, Functional_Mix), rng)
+        supply_types = Spread_Types(Split_Counts(Supply_Number, Supply_Mix or {'GND': 1}), rng)
+
+        chains = []
+        for chain in range(Chains_Number):
+            signals = [f'C{chain}_S{k}' for k in range(Chain_Length)]
+            physical = [f'{signal}_phy' for signal in signals] + [f'C{chain}_RD_{j}_phy' for j in range(1, Spares_Number + 1)]
+
+            # Functional bumps followed by the spares, the spares keep the type of the chain like in the MCI interfaces
+            bumps = [{'Name': physical[k], 'Type': functional_types[chain * Chain_Length + k], 'Spare': False} for k in range(Chain_Length)]
+            bumps += [{'Name': connection, 'Type': 'DATA', 'Spare': True} for connection in physical[Chain_Length:]]
+            chains.append(bumps)
+
+            # Signal k can be routed to the physical connections k, k+1, ..., k+Spares_Number
+            IRL_parts.append(f'RepairChain_{chain}:\n')
+            for k, signal in enumerate(signals):
+                Routes = []
+                for shift in range(Spares_Number + 1):
+                    Status = 'Default' if shift == 0 else ('Repair' if shift == 1 else f'Repair_{shift - 1}')
+                    Connection = physical[k + shift]
+                    Routes.append((Status, Connection, Connection.replace('_phy', '_mux'), f'm{shift + 1}'))
+                IRL_parts.append(IRL_Port(f'Port_{k}', signal, Routes))
+
+        placed = Place_with_supplies(Interleave(chains, Interleaving), supply_types)
+
+        # Supply bumps share their name, as in the demo interfaces
+        for bump in placed:
+            if 'Name' not in bump:
+                bump['Name'] = 'VDD_phy' if bump['Type'] == 'POWER' else 'VSS_phy'
+                bump['Spare'] = False
+
+        Columns = ceil(sqrt(len(placed)))
+        BumpMap = [dict(bump, X=float((i % Columns) * Pitch), Y=float((i // Columns) * Pitch)) for i, bump in enumerate(placed)]
+
+    else:
+        Bundles_per_chain = Chain_Length + Spares_Number
+        Chains_Number = Bumps_Number // (Bundle_Size * Bundles_per_chain)
+        if Chains_Number == 0:
+            raise ValueError(f'{Bumps_Number} bumps are not enough for one repair chain of {Bundles_per_chain} bundles of {Bundle_Size} bumps')
+        if Chains_Number * Bundle_Size * Bundles_per_chain != Bumps_Number:
+            print(f'Warning : the interface is rounded down to {Chains_Number * Bundle_Size * Bundles_per_chain} bumps, to contain full repair chains.')
+
+        # Each bundle contains the same type mix
+        Bundle_Counts = Split_Counts(Bundle_Size, Type_Mix)
+
+        chains = []
+        for chain in range(Chains_Number):
+            bundles = [f'Bundle_{k}_{chain}' for k in range(Bundles_per_chain)]
+            chains.append([(bundle, Spread_Types(Bundle_Counts, rng)) for bundle in bundles])
+
+            # Functional bundle k is repaired by bundle k + Spares_Number
+            IRL_parts.append(f'RepairChain_{chain}:\n')
+            for k in range(Chain_Length):
+                Routes = [('Default', f'{bundles[k]}_phy', f'{bundles[k]}_mux', 'm1'),
+                          ('Repair', f'{bundles[k + Spares_Number]}_phy', f'{bundles[k + Spares_Number]}_mux', 'm2')]
+                IRL_parts.append(IRL_Port(f'Bundle_{k}', bundles[k], Routes))
+
+        # Bundles are square blocks of bumps, placed row by row
+        Side = ceil(sqrt(Bundle_Size))
+        ordered = Interleave(chains, Interleaving)
+        Blocks_per_row = ceil(sqrt(len(ordered)))
+        BumpMap = []
+        for block, (bundle, types) in enumerate(ordered):
+            X0 = (block % Blocks_per_row) * Side
+            Y0 = (block // Blocks_per_row) * Side
+            for i, bump_type in enumerate(types):
+                BumpMap.append({'Bundle': f'{bundle}_phy', 'Name': f'{bundle}_{i}', 'Spare': False, 'Type': bump_type,
+                                'X': float((X0 + i % Side) * Pitch), 'Y': float((Y0 + i // Side) * Pitch)})
+
+    # Write the files
+    os.makedirs(Output_Directory, exist_ok=True)
+    BumpMap_file_name = os.path.join(Output_Directory, f'{Name}_BumpMap.yaml')
+    IRL_file_name = os.path.join(Output_Directory, f'{Name}.irl')
+    Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    with open(BumpMap_file_name, 'w') as file:
+        yaml.dump(BumpMap, file, Dumper=Dumper, default_flow_style=False)
+    with open(IRL_file_name, 'w', encoding='utf-8') as file:
+        file.write(''.join(IRL_parts))
+
+    return BumpMap_file_name, IRL_file_name
+
+
+if __name__ == '__main__':
+
+    #Parser initialisation.
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('--Name', type = str, help = 'Name of the generated interface, used for the file names.', default = 'Synthetic')
+    parser.add_argument('--Output_Directory', type = str, help = 'Directory where the bump map and IRL files are written.', default = r'OutputFiles')
+    parser.add_argument('--Bumps_Number', type = int, help = 'Number of bumps of the interface.', default = 256)
+    parser.add_argument('--Pitch', type = float, help = 'Distance between two neighbouring bumps, in µm.', default = 10)
+    parser.add_argument('--Type_Mix', type = str, help = 'Fraction of each bump type, for example : DATA:0.7,POWER:0.15,GND:0.15.', default = 'DATA:0.7,POWER:0.15,GND:0.15')
+    parser.add_argument('--Chain_Length', type = int, help = 'Number of functional signals (or bundles with --Bundle_Size) per repair chain.', default = 16)
+    parser.add_argument('--Spares_Number', type = int, help = 'Number of spare connections (or repair bundles with --Bundle_Size) per repair chain.', default = 1)
+    parser.add_argument('--Interleaving', type = int, help = 'Number of repair chains interleaved together.', default = 1)
+    parser.add_argument('--Bundle_Size', type = int, help = 'Number of bumps per bundle, 0 for a repair at the connection level.', default = 0)
+    parser.add_argument('--Seed', type = int, help = 'Seed of the random generator.', default = None)
+
+    args = parser.parse_args()
+
+    BumpMap_file_name, IRL_file_name = Generate_Interface(args.Name, args.Output_Directory, args.Bumps_Number, args.Pitch, args.Type_Mix,
+                                                          args.Chain_Length, args.Spares_Number, args.Interleaving, args.Bundle_Size, args.Seed)
+    print(f'Wrote {BumpMap_file_name} and {IRL_file_name}')